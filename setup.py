@@ -0,0 +1,26 @@
+"""
+Optional native build for hot agent-runtime modules.
+
+Package metadata lives in pyproject.toml. Setting SYNAPSE_MYPYC=1 at build
+time compiles the modules below with mypyc (requires ``mypy``); otherwise a
+pure-Python package is built.
+"""
+
+import os
+
+from setuptools import setup
+
+MYPYC_MODULES = [
+    "synapse/agent_runtime/execution_quota.py",
+    "synapse/agent_runtime/deterministic_planner.py",
+]
+
+ext_modules = []
+if os.environ.get("SYNAPSE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--ignore-missing-imports", "--follow-imports=silent", *MYPYC_MODULES]
+    )
+
+setup(ext_modules=ext_modules)
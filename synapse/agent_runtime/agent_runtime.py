@@ -5,17 +5,18 @@ Secure Agent Runtime
 PROTOCOL_VERSION: str = "1.0"
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
-from datetime import datetime, UTC
-import hashlib
-import json
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 import asyncio
+import bisect
 
-from synapse.planning.plan_model import Plan
+from synapse.core.canonical import canonical_json
+from synapse.core.hashing import content_hasher
+from synapse.core.timestamps import utc_isoformat
+from synapse.planning.plan_model import Plan, PlanStep
 from synapse.planning.policy_constrained_planner import PolicyConstrainedPlanner, PlanningConstraints
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Result of agent execution"""
     success: bool
@@ -28,30 +29,44 @@ class AgentResult:
     protocol_version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Capability-bound context for agent"""
     agent_id: str
     task_id: str
-    capabilities: Set[str]
+    capabilities: FrozenSet[str]
     execution_seed: int
     max_steps: int = 10
     max_time_ms: int = 30000
+    max_parallel: int = 4
     protocol_version: str = "1.0"
+    
+    def __post_init__(self):
+        # Immutable, hashable capability set for repeated per-step subset checks
+        if not isinstance(self.capabilities, frozenset):
+            self.capabilities = frozenset(self.capabilities)
 
 
 class AgentRuntime:
     """Secure agent runtime that runs within ExecutionNode"""
     
+    # Yield to the event loop once per this many executed steps (power of two)
+    YIELD_EVERY_STEPS: int = 16
+    
     def __init__(self, planner: PolicyConstrainedPlanner):
         self.planner = planner
+        self._step_counter = 0
         self._execution_trace: List[Dict[str, Any]] = []
         self._used_capabilities: Set[str] = set()
+        self._sorted_capabilities: List[str] = []
+        self._trace_hasher = content_hasher()
     
     async def run(self, task: str, context: AgentContext) -> AgentResult:
         """Run agent with capability-bound context"""
         self._execution_trace = []
         self._used_capabilities = set()
+        self._sorted_capabilities = []
+        self._trace_hasher = content_hasher()
         
         # Step 1: Create planning constraints
         constraints = PlanningConstraints(
@@ -76,50 +91,87 @@ class AgentRuntime:
                 used_capabilities=self._used_capabilities,
                 deterministic_state_hash=self._compute_state_hash(),
                 error=f"Planning failed: {planning_result.violations}",
-                timestamp=datetime.now(UTC).isoformat()
+                timestamp=utc_isoformat()
             )
         
         plan = planning_result.plan
         plan_hash = planning_result.plan_hash
         
-        # Step 3: Execute plan steps
+        # Step 3: Execute plan steps, independent steps concurrently per wave.
+        # Once a step fails, sequential execution would still have run every
+        # step ordered before it, so later waves run only those steps.
+        semaphore = asyncio.Semaphore(max(1, context.max_parallel))
+        executed: List[Tuple[PlanStep, Dict[str, Any]]] = []
+        cutoff: Optional[int] = None
+        wave_start: Optional[int] = None
         try:
-            for step in plan.steps:
-                # Record execution
-                step_result = await self._execute_step(step, context)
-                self._execution_trace.append(step_result)
-                self._used_capabilities.update(step.required_capabilities)
-                
-                if not step_result.get("success"):
-                    return AgentResult(
-                        success=False,
-                        plan_hash=plan_hash,
-                        execution_trace=self._execution_trace,
-                        used_capabilities=self._used_capabilities,
-                        deterministic_state_hash=self._compute_state_hash(),
-                        error=f"Step {step.step_id} failed",
-                        timestamp=datetime.now(UTC).isoformat()
-                    )
-            
+            for wave in plan.steps_by_wave():
+                if cutoff is not None:
+                    wave = [step for step in wave if step.order < cutoff]
+                    if not wave:
+                        break
+                wave_start = wave[0].order
+                step_results = await self._execute_wave(wave, context, semaphore)
+                executed.extend(zip(wave, step_results))
+                for step, step_result in zip(wave, step_results):
+                    if not step_result.get("success") and (cutoff is None or step.order < cutoff):
+                        cutoff = step.order
+        except Exception as e:
+            # The raising wave was cancelled part-way, so only steps ordered
+            # before all of it are known to match sequential execution
+            self._record_executed(executed, limit=wave_start)
+            # Report the first step failure rather than the TaskGroup wrapper
+            while isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
             return AgentResult(
-                success=True,
+                success=False,
                 plan_hash=plan_hash,
                 execution_trace=self._execution_trace,
                 used_capabilities=self._used_capabilities,
                 deterministic_state_hash=self._compute_state_hash(),
-                timestamp=datetime.now(UTC).isoformat()
+                error=str(e),
+                timestamp=utc_isoformat()
             )
-            
-        except Exception as e:
+        
+        failed_step = self._record_executed(executed)
+        if failed_step is not None:
             return AgentResult(
                 success=False,
                 plan_hash=plan_hash,
                 execution_trace=self._execution_trace,
                 used_capabilities=self._used_capabilities,
                 deterministic_state_hash=self._compute_state_hash(),
-                error=str(e),
-                timestamp=datetime.now(UTC).isoformat()
+                error=f"Step {failed_step.step_id} failed",
+                timestamp=utc_isoformat()
             )
+        
+        return AgentResult(
+            success=True,
+            plan_hash=plan_hash,
+            execution_trace=self._execution_trace,
+            used_capabilities=self._used_capabilities,
+            deterministic_state_hash=self._compute_state_hash(),
+            timestamp=utc_isoformat()
+        )
+    
+    async def _execute_wave(
+        self,
+        wave: List[PlanStep],
+        context: AgentContext,
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Execute one wave of independent steps, at most max_parallel at a time"""
+        if len(wave) == 1:
+            return [await self._execute_step(wave[0], context)]
+        
+        async def bounded(step: PlanStep) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._execute_step(step, context)
+        
+        # TaskGroup cancels the remaining steps as soon as one raises
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(bounded(step)) for step in wave]
+        return [task.result() for task in tasks]
     
     async def _execute_step(self, step, context: AgentContext) -> Dict[str, Any]:
         """Execute a single step"""
@@ -130,27 +182,68 @@ class AgentRuntime:
                 "action": step.action,
                 "success": False,
                 "error": "Missing capabilities",
-                "timestamp": datetime.now(UTC).isoformat()
+                "timestamp": utc_isoformat()
             }
         
-        # Simulate execution (in real implementation, would call skills)
-        await asyncio.sleep(0.001)  # Minimal delay for async
+        # Simulate execution (in real implementation, would call skills).
+        # Yield periodically for cooperative scheduling instead of sleeping per step.
+        self._step_counter += 1
+        if self._step_counter & (self.YIELD_EVERY_STEPS - 1) == 0:
+            await asyncio.sleep(0)
         
         return {
             "step_id": step.step_id,
             "action": step.action,
             "success": True,
-            "timestamp": datetime.now(UTC).isoformat()
+            "timestamp": utc_isoformat()
         }
     
+    def _record_executed(
+        self,
+        executed: List[Tuple[PlanStep, Dict[str, Any]]],
+        limit: Optional[int] = None
+    ) -> Optional[PlanStep]:
+        """Record executed steps in plan order, whatever wave ran them
+        
+        Recording stops after the first failed step (and before step order
+        limit, when given), which is where sequential execution of the same
+        plan would have stopped, so the trace, used capabilities and state
+        hash match it. Returns the failed step, if any.
+        """
+        for step, step_result in sorted(executed, key=lambda pair: pair[0].order):
+            if limit is not None and step.order >= limit:
+                break
+            self._record_step(step_result)
+            self._track_capabilities(step.required_capabilities)
+            if not step_result.get("success"):
+                return step
+        return None
+    
+    def _record_step(self, step_result: Dict[str, Any]) -> None:
+        """Append step result to trace and fold it into the rolling hash"""
+        self._execution_trace.append(step_result)
+        self._trace_hasher.update(b"".join((
+            b'{"step_id":',
+            canonical_json(step_result.get("step_id")),
+            b',"success":',
+            b"true" if step_result.get("success") else b"false",
+            b"},",
+        )))
+    
+    def _track_capabilities(self, capabilities: Set[str]) -> None:
+        """Add capabilities to the used set, keeping a sorted view for hashing"""
+        for capability in capabilities:
+            if capability not in self._used_capabilities:
+                self._used_capabilities.add(capability)
+                bisect.insort(self._sorted_capabilities, capability)
+    
     def _compute_state_hash(self) -> str:
-        """Compute deterministic state hash"""
-        data = {
-            "trace": [
-                {"step_id": t.get("step_id"), "success": t.get("success")}
-                for t in self._execution_trace
-            ],
-            "capabilities": sorted(list(self._used_capabilities))
-        }
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        """Compute deterministic state hash
+        
+        The trace part is hashed incrementally by _record_step, so this only
+        clones the running digest and appends the used capabilities.
+        """
+        hasher = self._trace_hasher.copy()
+        hasher.update(b"|")
+        hasher.update(canonical_json(self._sorted_capabilities))
+        return hasher.hexdigest()
@@ -4,15 +4,31 @@ Deterministic Planner - No Randomness Allowed
 
 PROTOCOL_VERSION: str = "1.0"
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Set
-import hashlib
-import json
+from typing import Dict, Final, List, Optional, Any, Set, Tuple
+import re
 
+from synapse.core.canonical import canonical_json
+from synapse.core.hashing import content_hash, content_hasher
 from synapse.planning.plan_model import Plan, PlanStep, PlanBuilder
 
+# Keyword -> (action, required capability, parameters), in plan order
+_KEYWORD_STEPS: Final[Tuple[Tuple[str, str, Dict[str, str]], ...]] = (
+    ("read", "fs:read", {"path": "/workspace"}),
+    ("write", "fs:write", {"path": "/workspace"}),
+    ("execute", "os:process", {"command": "echo"}),
+    ("search", "net:http", {"query": ""}),
+)
 
-@dataclass
+# Lookahead alternation: finds every keyword occurrence (including
+# overlapping ones) in a single pass, matching plain substring semantics
+_KEYWORD_RE: Final = re.compile(
+    "(?=(" + "|".join(keyword for keyword, _, _ in _KEYWORD_STEPS) + "))"
+)
+
+
+@dataclass(slots=True)
 class PlanningInput:
     """Deterministic input for planning"""
     task: str
@@ -26,8 +42,11 @@ class PlanningInput:
 class DeterministicPlanner:
     """Planner that produces identical output for identical input"""
     
-    def __init__(self):
-        self._plan_cache: Dict[str, Plan] = {}
+    DEFAULT_CACHE_SIZE: Final[int] = 1024
+    
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self._cache_size: Final[int] = cache_size
+        self._plan_cache: "OrderedDict[bytes, Plan]" = OrderedDict()
     
     def generate_plan(
         self,
@@ -37,34 +56,35 @@ class DeterministicPlanner:
         seed: int
     ) -> Plan:
         """Generate deterministic plan"""
+        # Encode the task once for both the cache key and the task ID
+        task_bytes = task.encode()
+        
         # Create cache key
-        cache_key = self._compute_cache_key(task, constraints, capabilities, seed)
+        cache_key = self._compute_cache_key(task_bytes, constraints, capabilities, seed)
         
         # Return cached plan if exists
-        if cache_key in self._plan_cache:
-            return self._plan_cache[cache_key]
+        cached = self._plan_cache.get(cache_key)
+        if cached is not None:
+            self._plan_cache.move_to_end(cache_key)
+            return cached
         
         # Generate plan deterministically
         steps = self._generate_steps(task, capabilities, seed)
         
         # Build plan
         builder = PlanBuilder(
-            task_id=self._compute_task_id(task, seed),
+            task_id=self._compute_task_id(task_bytes, seed),
             execution_seed=seed,
             policy_hash=constraints.get("policy_hash", "")
         )
         
-        for step in steps:
-            builder.add_step(
-                action=step["action"],
-                capabilities=step["capabilities"],
-                parameters=step.get("parameters", {})
-            )
-        
+        builder.add_steps_batch(steps)
         plan = builder.build()
         
-        # Cache the plan
+        # Cache the plan, evicting the least recently used entry
         self._plan_cache[cache_key] = plan
+        if len(self._plan_cache) > self._cache_size:
+            self._plan_cache.popitem(last=False)
         
         return plan
     
@@ -75,43 +95,20 @@ class DeterministicPlanner:
         seed: int
     ) -> List[Dict[str, Any]]:
         """Generate steps deterministically based on task and seed"""
-        steps = []
+        steps: List[Dict[str, Any]] = []
         
-        # Use seed for deterministic step generation
-        hash_input = f"{task}:{seed}"
-        hash_val = hashlib.sha256(hash_input.encode()).hexdigest()
-        
-        # Parse task keywords
-        task_lower = task.lower()
+        # Parse task keywords in one scan
+        found = {match.group(1) for match in _KEYWORD_RE.finditer(task.lower())}
         
         # Generate steps based on keywords and capabilities
-        if "read" in task_lower and "fs:read" in capabilities:
-            steps.append({
-                "action": "read",
-                "capabilities": {"fs:read"},
-                "parameters": {"path": "/workspace"}
-            })
-        
-        if "write" in task_lower and "fs:write" in capabilities:
-            steps.append({
-                "action": "write",
-                "capabilities": {"fs:write"},
-                "parameters": {"path": "/workspace"}
-            })
-        
-        if "execute" in task_lower and "os:process" in capabilities:
-            steps.append({
-                "action": "execute",
-                "capabilities": {"os:process"},
-                "parameters": {"command": "echo"}
-            })
-        
-        if "search" in task_lower and "net:http" in capabilities:
-            steps.append({
-                "action": "search",
-                "capabilities": {"net:http"},
-                "parameters": {"query": ""}
-            })
+        if found:
+            for action, capability, parameters in _KEYWORD_STEPS:
+                if action in found and capability in capabilities:
+                    steps.append({
+                        "action": action,
+                        "capabilities": {capability},
+                        "parameters": dict(parameters)
+                    })
         
         # Default step if none matched
         if not steps:
@@ -125,25 +122,29 @@ class DeterministicPlanner:
     
     def _compute_cache_key(
         self,
-        task: str,
+        task_bytes: bytes,
         constraints: Dict[str, Any],
         capabilities: Set[str],
         seed: int
-    ) -> str:
-        """Compute deterministic cache key"""
-        data = {
-            "task": task,
+    ) -> bytes:
+        """Compute deterministic cache key (raw digest)
+        
+        The encoded task is hashed length-prefixed ahead of the canonical
+        JSON of the remaining inputs, so it is never re-escaped into JSON.
+        """
+        data: Dict[str, Any] = {
             "constraints": constraints,
-            "capabilities": sorted(list(capabilities)),
+            "capabilities": sorted(capabilities),
             "seed": seed
         }
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        hasher = content_hasher(len(task_bytes).to_bytes(8, "big"))
+        hasher.update(task_bytes)
+        hasher.update(canonical_json(data))
+        return hasher.digest()
     
-    def _compute_task_id(self, task: str, seed: int) -> str:
-        """Compute deterministic task ID"""
-        data = f"{task}:{seed}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+    def _compute_task_id(self, task_bytes: bytes, seed: int) -> str:
+        """Compute deterministic task ID (hash of task:seed)"""
+        return content_hash(b"%s:%d" % (task_bytes, seed))[:16]
     
     def verify_determinism(self, plan1: Plan, plan2: Plan) -> bool:
         """Verify two plans are identical"""
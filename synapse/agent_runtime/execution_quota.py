@@ -5,12 +5,21 @@ Execution Quota - Resource Limits for Agent Execution
 PROTOCOL_VERSION: str = "1.0"
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any
-from datetime import datetime, UTC
+from typing import Dict, Final, List, Optional, Any
 import time
 
+from synapse.core.canonical import canonical_json
+from synapse.core.hashing import content_hash
 
-@dataclass
+# Violation name -> bit in ExecutionQuota's violation mask
+_VIOLATION_BITS: Final[Dict[str, int]] = {
+    "max_steps_exceeded": 1,
+    "max_capability_calls_exceeded": 2,
+    "max_time_exceeded": 4,
+}
+
+
+@dataclass(slots=True)
 class QuotaLimits:
     """Execution quota limits"""
     max_steps: int = 10
@@ -19,13 +28,13 @@ class QuotaLimits:
     protocol_version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class QuotaState:
     """Current quota state"""
     steps_used: int = 0
     time_used_ms: int = 0
     capability_calls_used: int = 0
-    start_time: Optional[float] = None
+    start_time_ns: Optional[int] = None  # time.monotonic_ns() at start
     protocol_version: str = "1.0"
 
 
@@ -33,21 +42,21 @@ class ExecutionQuota:
     """Manages execution quotas for agents"""
     
     def __init__(self, limits: QuotaLimits):
-        self.limits = limits
-        self.state = QuotaState()
-        self._violations: list = []
+        self.limits: Final[QuotaLimits] = limits
+        self.state: QuotaState = QuotaState()
+        self._violations_mask: int = 0
     
-    def start(self):
+    def start(self) -> None:
         """Start quota tracking"""
-        self.state = QuotaState(start_time=time.perf_counter())
-        self._violations = []
+        self.state = QuotaState(start_time_ns=time.monotonic_ns())
+        self._violations_mask = 0
     
     def record_step(self) -> bool:
         """Record a step execution, returns False if quota exceeded"""
         self.state.steps_used += 1
         
         if self.state.steps_used > self.limits.max_steps:
-            self._violations.append("max_steps_exceeded")
+            self._violations_mask |= _VIOLATION_BITS["max_steps_exceeded"]
             return False
         return True
     
@@ -56,20 +65,20 @@ class ExecutionQuota:
         self.state.capability_calls_used += 1
         
         if self.state.capability_calls_used > self.limits.max_capability_calls:
-            self._violations.append("max_capability_calls_exceeded")
+            self._violations_mask |= _VIOLATION_BITS["max_capability_calls_exceeded"]
             return False
         return True
     
     def check_time(self) -> bool:
         """Check if time quota exceeded"""
-        if self.state.start_time is None:
+        if self.state.start_time_ns is None:
             return True
         
-        elapsed_ms = int((time.perf_counter() - self.state.start_time) * 1000)
+        elapsed_ms = (time.monotonic_ns() - self.state.start_time_ns) // 1_000_000
         self.state.time_used_ms = elapsed_ms
         
         if elapsed_ms > self.limits.max_time_ms:
-            self._violations.append("max_time_exceeded")
+            self._violations_mask |= _VIOLATION_BITS["max_time_exceeded"]
             return False
         return True
     
@@ -81,9 +90,9 @@ class ExecutionQuota:
             self.state.capability_calls_used <= self.limits.max_capability_calls
         )
     
-    def get_violations(self) -> list:
-        """Get list of quota violations"""
-        return list(self._violations)
+    def get_violations(self) -> List[str]:
+        """Get list of quota violations (each reported once)"""
+        return [name for name, bit in _VIOLATION_BITS.items() if self._violations_mask & bit]
     
     def get_remaining_steps(self) -> int:
         """Get remaining steps"""
@@ -99,14 +108,10 @@ class ExecutionQuota:
     
     def get_state_hash(self) -> str:
         """Get deterministic hash of quota state"""
-        import hashlib
-        import json
-        
-        data = {
+        data: Dict[str, Any] = {
             "steps_used": self.state.steps_used,
             "time_used_ms": self.state.time_used_ms,
             "capability_calls_used": self.state.capability_calls_used,
-            "violations": sorted(self._violations)
+            "violations_mask": self._violations_mask
         }
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return content_hash(canonical_json(data))
@@ -6,12 +6,14 @@ PROTOCOL_VERSION: str = "1.0"
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Set
-from datetime import datetime, UTC
-import hashlib
-import json
+import time
 
+from synapse.core.canonical import canonical_json
+from synapse.core.hashing import content_digest, content_hash, content_hasher
+from synapse.core.timestamps import utc_isoformat
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MemorySnapshot:
     """Immutable memory snapshot"""
     snapshot_id: str
@@ -27,8 +29,17 @@ class MemoryVault:
     """Secure memory vault with hash-addressed storage"""
     
     def __init__(self):
-        self._snapshots: Dict[str, MemorySnapshot] = {}
-        self._agent_snapshots: Dict[str, List[str]] = {}
+        # Keyed by the raw 8-byte snapshot ID; snapshot_id strings are its hex
+        self._snapshots: Dict[bytes, MemorySnapshot] = {}
+        self._agent_snapshots: Dict[str, List[bytes]] = {}
+    
+    @staticmethod
+    def _key(snapshot_id: str) -> Optional[bytes]:
+        """Convert a public hex snapshot ID to its storage key"""
+        try:
+            return bytes.fromhex(snapshot_id)
+        except (TypeError, ValueError):
+            return None
     
     def store(
         self,
@@ -38,13 +49,18 @@ class MemoryVault:
     ) -> MemorySnapshot:
         """Store data in vault, returns immutable snapshot"""
         # Compute hash
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        data_hash = hashlib.sha256(canonical.encode()).hexdigest()
+        data_digest = content_digest(canonical_json(data))
+        data_hash = data_digest.hex()
         
-        # Create snapshot ID
-        snapshot_id = hashlib.sha256(
-            f"{agent_id}:{data_hash}:{datetime.now(UTC).isoformat()}".encode()
-        ).hexdigest()[:16]
+        # Create snapshot ID from a single clock read
+        created_ns = time.time_ns()
+        hasher = content_hasher(agent_id.encode())
+        hasher.update(b":")
+        hasher.update(data_digest)
+        hasher.update(b":")
+        hasher.update(created_ns.to_bytes(8, "big"))
+        key = hasher.digest()[:8]
+        snapshot_id = key.hex()
         
         # Create immutable snapshot
         snapshot = MemorySnapshot(
@@ -52,16 +68,16 @@ class MemoryVault:
             agent_id=agent_id,
             data=data,
             capabilities_required=frozenset(capabilities_required),
-            created_at=datetime.now(UTC).isoformat(),
+            created_at=utc_isoformat(created_ns),
             hash=data_hash
         )
         
         # Store
-        self._snapshots[snapshot_id] = snapshot
+        self._snapshots[key] = snapshot
         
         if agent_id not in self._agent_snapshots:
             self._agent_snapshots[agent_id] = []
-        self._agent_snapshots[agent_id].append(snapshot_id)
+        self._agent_snapshots[agent_id].append(key)
         
         return snapshot
     
@@ -71,11 +87,10 @@ class MemoryVault:
         capabilities: Set[str]
     ) -> Optional[MemorySnapshot]:
         """Retrieve snapshot if capabilities allow"""
-        if snapshot_id not in self._snapshots:
+        snapshot = self._snapshots.get(self._key(snapshot_id))
+        if snapshot is None:
             return None
         
-        snapshot = self._snapshots[snapshot_id]
-        
         # Check capabilities
         if not snapshot.capabilities_required.issubset(capabilities):
             return None
@@ -84,16 +99,15 @@ class MemoryVault:
     
     def get_agent_snapshots(self, agent_id: str) -> List[str]:
         """Get all snapshot IDs for an agent"""
-        return self._agent_snapshots.get(agent_id, [])
+        return [key.hex() for key in self._agent_snapshots.get(agent_id, [])]
     
     def verify_integrity(self, snapshot_id: str) -> bool:
         """Verify snapshot integrity"""
-        if snapshot_id not in self._snapshots:
+        snapshot = self._snapshots.get(self._key(snapshot_id))
+        if snapshot is None:
             return False
         
-        snapshot = self._snapshots[snapshot_id]
-        canonical = json.dumps(snapshot.data, sort_keys=True, separators=(',', ':'))
-        computed_hash = hashlib.sha256(canonical.encode()).hexdigest()
+        computed_hash = content_hash(canonical_json(snapshot.data))
         
         return computed_hash == snapshot.hash
     
@@ -103,7 +117,7 @@ class MemoryVault:
     
     def reconstruct(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
         """Reconstruct data from snapshot"""
-        snapshot = self._snapshots.get(snapshot_id)
+        snapshot = self._snapshots.get(self._key(snapshot_id))
         if snapshot:
             return dict(snapshot.data)
         return None
@@ -0,0 +1,55 @@
+"""Vectorized skill-threshold kernels for GovernorAgent.
+
+Protocol Version: 1.0
+
+The governor passes skill metrics as parallel success-rate / latency
+columns, which are compared in a single pass.  The kernel is compiled with
+numba when available; with only numpy it runs as plain array comparisons.
+Without numpy, ``AVAILABLE`` is False and callers keep the scalar loop.
+"""
+import logging
+from typing import List, Sequence, Tuple
+
+PROTOCOL_VERSION: str = "1.0"
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def _threshold_masks(success, latency, success_threshold, latency_threshold):
+    return success < success_threshold, latency > latency_threshold
+
+
+if np is not None:
+    try:
+        from numba import njit
+
+        _threshold_masks = njit(cache=True)(_threshold_masks)
+    except ImportError:
+        logger.debug("numba not installed — skill threshold kernel runs on numpy")
+
+AVAILABLE: bool = np is not None
+
+
+def threshold_flags(
+    success: Sequence[float],
+    latency: Sequence[float],
+    success_threshold: float,
+    latency_threshold: float,
+) -> List[Tuple[int, bool, bool]]:
+    """Return ``(index, low_success, high_latency)`` for each flagged skill."""
+    low_success, high_latency = _threshold_masks(
+        np.asarray(success, dtype=np.float64),
+        np.asarray(latency, dtype=np.float64),
+        success_threshold,
+        latency_threshold,
+    )
+    flagged = np.flatnonzero(low_success | high_latency)
+    return [
+        (i, bool(low_success[i]), bool(high_latency[i]))
+        for i in flagged.tolist()
+    ]
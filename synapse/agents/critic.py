@@ -9,12 +9,13 @@ Responsibilities:
 - Detect knowledge gaps → trigger CreateSkill / CreateKnowledge
 - Emit full audit trail for every evaluation
 """
+import functools
 import hashlib
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from synapse.observability.logger import audit
+from synapse.observability.logger import audit, audit_enabled
 
 PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
@@ -68,6 +69,12 @@ Evaluate strictly and return a JSON object with these fields:
 Return ONLY valid JSON, no markdown, no explanations."""
 
 
+@functools.lru_cache(maxsize=256)
+def _render_eval_prompt(task: str, status: str, output: str, error: str) -> str:
+    """Render EVAL_PROMPT; memoized on the already-truncated fields."""
+    return EVAL_PROMPT.format(task=task, status=status, output=output, error=error)
+
+
 class CriticAgent:
     """Evaluates execution outcomes and provides structured feedback.
 
@@ -86,11 +93,12 @@ class CriticAgent:
         self.llm_provider = llm_provider
         self.audit_logger = audit_logger
         self.success_threshold = success_threshold
-        audit(
-            event="critic_agent_initialized",
-            has_llm=llm_provider is not None,
-            protocol_version=self.protocol_version,
-        )
+        if audit_enabled():
+            audit(
+                event="critic_agent_initialized",
+                has_llm=llm_provider is not None,
+                protocol_version=self.protocol_version,
+            )
 
     async def evaluate(
         self,
@@ -108,27 +116,29 @@ class CriticAgent:
         Returns:
             Dict wrapping EvaluationResult
         """
-        audit(
-            event="evaluation_started",
-            status=execution_result.get("status"),
-            task_preview=task[:80],
-            seed=seed,
-            protocol_version=self.protocol_version,
-        )
+        if audit_enabled():
+            audit(
+                event="evaluation_started",
+                status=execution_result.get("status"),
+                task_preview=task[:80],
+                seed=seed,
+                protocol_version=self.protocol_version,
+            )
 
         # Try LLM evaluation first
         result = await self._evaluate_with_llm(execution_result, task)
         if result is None:
             result = self._evaluate_heuristic(execution_result, task)
 
-        audit(
-            event="evaluation_completed",
-            success=result.success,
-            score=result.score,
-            should_create_skill=result.should_create_skill,
-            gaps_count=len(result.knowledge_gaps),
-            protocol_version=self.protocol_version,
-        )
+        if audit_enabled():
+            audit(
+                event="evaluation_completed",
+                success=result.success,
+                score=result.score,
+                should_create_skill=result.should_create_skill,
+                gaps_count=len(result.knowledge_gaps),
+                protocol_version=self.protocol_version,
+            )
 
         return result.to_dict()
 
@@ -144,12 +154,7 @@ class CriticAgent:
             output = str(result.get("result", ""))[:500]
             error = str(result.get("error", ""))[:300]
 
-            prompt = EVAL_PROMPT.format(
-                task=task[:300],
-                status=status,
-                output=output,
-                error=error,
-            )
+            prompt = _render_eval_prompt(task[:300], str(status), output, error)
             response = await self.llm_provider.generate(prompt)
             content = response.get("content", "{}")
             # Strip markdown fences
@@ -233,9 +238,9 @@ class CriticAgent:
         seed: Optional[int] = None,
     ) -> str:
         """Public method for tests."""
-        return EVAL_PROMPT.format(
-            task="(unknown)",
-            status=execution_result.get("status", "unknown"),
-            output=str(execution_result.get("result", ""))[:200],
-            error=str(execution_result.get("error", ""))[:100],
+        return _render_eval_prompt(
+            "(unknown)",
+            str(execution_result.get("status", "unknown")),
+            str(execution_result.get("result", ""))[:200],
+            str(execution_result.get("error", ""))[:100],
         )
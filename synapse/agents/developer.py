@@ -14,7 +14,6 @@ Implements the full CreateSkill pipeline:
 On every step an audit event is emitted.
 """
 import ast
-import hashlib
 import logging
 import re
 import textwrap
@@ -22,12 +21,32 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from synapse.llm.batching import BatchingLLMClient
 from synapse.observability.logger import audit
 
 PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
 logger = logging.getLogger(__name__)
 
+# Static LLM prompt body; only the task and class name vary per call.
+_PROMPT_TMPL = """You are an expert Python developer creating a skill for an autonomous agent platform.
+
+TASK: {task}
+
+Generate ONLY the body of the `execute()` method for a Python class called `{class_name}`.
+The method signature is:
+    async def execute(self, context=None, **kwargs) -> dict:
+
+Requirements:
+- Store your final answer in a variable called `result`
+- Handle exceptions with try/except
+- Do NOT import os, sys, subprocess, socket, or other dangerous modules
+- Use only: pathlib.Path, json, re, datetime, typing, asyncio
+- The last line before the return must set `result`
+- Return only the method body code (no class definition, no def line)
+
+RESPOND WITH ONLY PYTHON CODE, no markdown, no explanations."""
+
 # Dangerous AST node types / names that must be blocked
 BLOCKED_BUILTINS = {
     "eval", "exec", "compile", "__import__", "breakpoint",
@@ -53,7 +72,7 @@ def _safe_exec(code_obj, namespace: dict) -> None:
     exec(code_obj, namespace)  # nosec B102
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneratedSkill:
     """A skill produced by DeveloperAgent — not yet active."""
     skill_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -190,6 +209,7 @@ class DeveloperAgent:
         policy_engine: Any = None,
     ):
         self.llm_provider = llm_provider
+        self._llm_client = BatchingLLMClient(llm_provider) if llm_provider else None
         self.skill_registry = skill_registry
         self.policy_engine = policy_engine
         audit(
@@ -322,6 +342,11 @@ class DeveloperAgent:
             audit(event="skill_registration_failed", error=str(e), protocol_version=self.protocol_version)
             return {"status": "error", "error": str(e), "protocol_version": PROTOCOL_VERSION}
 
+    async def shutdown(self) -> None:
+        """Stop the LLM batching worker and wait for in-flight prompts."""
+        if self._llm_client is not None:
+            await self._llm_client.aclose()
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -330,10 +355,10 @@ class DeveloperAgent:
         self, task: str, name: str, class_name: str
     ) -> str:
         """Generate the body of execute() via LLM or structured fallback."""
-        if self.llm_provider:
+        if self._llm_client:
             prompt = self._build_prompt(task, name, class_name)
             try:
-                response = await self.llm_provider.generate(prompt)
+                response = await self._llm_client.generate(prompt)
                 content = response.get("content", "")
                 extracted = self._extract_python_body(content)
                 if extracted:
@@ -345,23 +370,7 @@ class DeveloperAgent:
         return self._template_implementation(task, name)
 
     def _build_prompt(self, task: str, name: str, class_name: str) -> str:
-        return f"""You are an expert Python developer creating a skill for an autonomous agent platform.
-
-TASK: {task}
-
-Generate ONLY the body of the `execute()` method for a Python class called `{class_name}`.
-The method signature is:
-    async def execute(self, context=None, **kwargs) -> dict:
-
-Requirements:
-- Store your final answer in a variable called `result`
-- Handle exceptions with try/except
-- Do NOT import os, sys, subprocess, socket, or other dangerous modules
-- Use only: pathlib.Path, json, re, datetime, typing, asyncio
-- The last line before the return must set `result`
-- Return only the method body code (no class definition, no def line)
-
-RESPOND WITH ONLY PYTHON CODE, no markdown, no explanations."""
+        return _PROMPT_TMPL.format_map({"task": task, "class_name": class_name})
 
     def _extract_python_body(self, llm_output: str) -> str:
         """Extract clean Python method body from LLM response."""
@@ -4,19 +4,32 @@ Predictive Autonomy & Proactive Risk Management.
 """
 from __future__ import annotations
 
-import hashlib
-import uuid
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-import asyncio
-import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+from synapse.core.hashing import content_digest
+from synapse.llm.batching import BatchingLLMClient
 
 PROTOCOL_VERSION: str = "1.0"
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _forecast_id_cached(seed: int, target: str) -> str:
+    """UUID-formatted content digest of seed:target; memoized for recurring targets."""
+    h = content_digest(f"{seed}:{target}".encode())[:16].hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@lru_cache(maxsize=1024)
+def _llm_confidence(seed: int) -> float:
+    """First uniform(0.7, 0.95) draw of Random(seed); memoized to skip MT reseeding."""
+    import random  # only the LLM prediction path needs it
+
+    return random.Random(seed).uniform(0.7, 0.95)
+
+
+@dataclass(slots=True, frozen=True)
 class ForecastRequest:
     """Request for forecast."""
     target: str
@@ -26,7 +39,20 @@ class ForecastRequest:
     protocol_version: str = "1.0"
 
 
-@dataclass
+class Prediction(NamedTuple):
+    """Single forecast prediction; fields left as None are omitted from to_dict()."""
+    type: str
+    target: str
+    probability: Optional[float] = None
+    eta_minutes: Optional[int] = None
+    confidence: Optional[float] = None
+    forecast: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
+
+
+@dataclass(slots=True, frozen=True)
 class ForecastResult:
     """Result of forecast."""
     forecast_id: str
@@ -42,6 +68,21 @@ class ForecasterAgent:
 
     PROTOCOL_VERSION = "1.0"
 
+    # (history key, prediction type, target, threshold, scale, probability cap);
+    # scale None reports the last sample itself as the probability.
+    _TREND_META = (
+        ('cpu_trend', 'cpu_overload', 'cpu', 70, 100, 0.9),
+        ('memory_trend', 'memory_exhaustion', 'memory', 1500, 2048, 0.85),
+        ('failure_trend', 'skill_failure', 'skills', 0.1, None, None),
+    )
+
+    # prediction type -> (probability floor, risk level) tiers, highest first
+    _RISK_TIERS = {
+        'cpu_overload': ((0.8, 4), (0.6, 3), (float('-inf'), 2)),
+        'memory_exhaustion': ((0.8, 4), (0.6, 3), (float('-inf'), 2)),
+        'skill_failure': ((0.5, 3), (float('-inf'), 1)),
+    }
+
     def __init__(
         self,
         llm: Optional[Any] = None,
@@ -50,15 +91,24 @@ class ForecasterAgent:
         policy_engine: Optional[Any] = None
     ):
         self.llm = llm
+        self._llm_client = (
+            BatchingLLMClient(llm) if llm and hasattr(llm, 'generate') else None
+        )
         self.telemetry = telemetry
+        # Telemetry accessors resolved once rather than probed per forecast()
+        self._get_historical_metrics = getattr(telemetry, 'get_historical_metrics', None) if telemetry else None
+        self._get_current_metrics = getattr(telemetry, 'get_current_metrics', None) if telemetry else None
         self.resource_manager = resource_manager
         self.policy_engine = policy_engine
 
+    async def shutdown(self) -> None:
+        """Stop the LLM batching worker and wait for in-flight prompts."""
+        if self._llm_client is not None:
+            await self._llm_client.aclose()
+
     def _generate_forecast_id(self, seed: int, target: str) -> str:
         """Generate deterministic forecast ID."""
-        data = f"{seed}:{target}"
-        hash_bytes = hashlib.sha256(data.encode()).digest()
-        return str(uuid.UUID(bytes=hash_bytes[:16]))
+        return _forecast_id_cached(seed, target)
 
     async def forecast(self, request: ForecastRequest) -> ForecastResult:
         """Generate forecast based on request."""
@@ -66,25 +116,20 @@ class ForecasterAgent:
 
         # Get metrics
         metrics = {}
-        if self.telemetry:
-            if hasattr(self.telemetry, 'get_historical_metrics'):
-                metrics['historical'] = self.telemetry.get_historical_metrics()
-            if hasattr(self.telemetry, 'get_current_metrics'):
-                metrics['current'] = self.telemetry.get_current_metrics()
+        if self._get_historical_metrics is not None:
+            metrics['historical'] = self._get_historical_metrics()
+        if self._get_current_metrics is not None:
+            metrics['current'] = self._get_current_metrics()
 
         # Generate predictions
         predictions = await self._generate_predictions(request, metrics)
 
-        # Generate recommendations
-        recommendations = self._generate_recommendations(predictions)
-
-        # Calculate confidence and risk
-        confidence = self._calculate_confidence(predictions)
-        risk_level = self._calculate_risk_level(predictions)
+        # Recommendations, confidence and risk in one pass over predictions
+        recommendations, confidence, risk_level = self._postprocess(predictions)
 
         return ForecastResult(
             forecast_id=forecast_id,
-            predictions=predictions,
+            predictions=[pred.to_dict() for pred in predictions],
             recommendations=recommendations,
             confidence=confidence,
             risk_level=risk_level
@@ -94,80 +139,69 @@ class ForecasterAgent:
         self,
         request: ForecastRequest,
         metrics: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Prediction]:
         """Generate predictions using LLM or ML models."""
         predictions = []
-        rng = random.Random(request.seed)
 
         # Use LLM if available
-        if self.llm and hasattr(self.llm, 'generate'):
+        if self._llm_client:
             try:
                 prompt = f"Forecast {request.forecast_type} for {request.target} over {request.horizon_minutes} minutes"
-                response = await self.llm.generate(prompt)
+                response = await self._llm_client.generate(prompt)
                 # Parse LLM response into predictions
-                predictions.append({
-                    'type': 'llm_forecast',
-                    'target': request.target,
-                    'forecast': str(response),
-                    'confidence': rng.uniform(0.7, 0.95)
-                })
+                predictions.append(Prediction(
+                    type='llm_forecast',
+                    target=request.target,
+                    forecast=str(response),
+                    confidence=_llm_confidence(request.seed)
+                ))
             except Exception as _exc:  # noqa
                 pass  # noqa: silenced - _exc
 
         # Fallback to trend-based prediction
         historical = metrics.get('historical', {})
 
-        if 'cpu_trend' in historical:
-            cpu_trend = historical['cpu_trend']
-            if cpu_trend and cpu_trend[-1] > 70:
-                predictions.append({
-                    'type': 'cpu_overload',
-                    'target': 'cpu',
-                    'probability': min(0.9, cpu_trend[-1] / 100 + 0.1),
-                    'eta_minutes': request.horizon_minutes
-                })
-
-        if 'memory_trend' in historical:
-            memory_trend = historical['memory_trend']
-            if memory_trend and memory_trend[-1] > 1500:
-                predictions.append({
-                    'type': 'memory_exhaustion',
-                    'target': 'memory',
-                    'probability': min(0.85, memory_trend[-1] / 2048 + 0.1),
-                    'eta_minutes': request.horizon_minutes
-                })
-
-        if 'failure_trend' in historical:
-            failure_trend = historical['failure_trend']
-            if failure_trend and failure_trend[-1] > 0.1:
-                predictions.append({
-                    'type': 'skill_failure',
-                    'target': 'skills',
-                    'probability': failure_trend[-1],
-                    'eta_minutes': request.horizon_minutes
-                })
+        for key, kind, target, threshold, scale, cap in self._TREND_META:
+            trend = historical.get(key)
+            if trend and trend[-1] > threshold:
+                last = trend[-1]
+                predictions.append(Prediction(
+                    type=kind,
+                    target=target,
+                    probability=last if scale is None else min(cap, last / scale + 0.1),
+                    eta_minutes=request.horizon_minutes
+                ))
 
         # Default if no predictions
         if not predictions:
-            predictions.append({
-                'type': 'stable',
-                'target': request.target,
-                'probability': 0.1,
-                'confidence': 0.8
-            })
+            predictions.append(Prediction(
+                type='stable',
+                target=request.target,
+                probability=0.1,
+                confidence=0.8
+            ))
 
         return predictions
 
-    def _generate_recommendations(
+    def _postprocess(
         self,
-        predictions: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Generate recommendations based on predictions."""
+        predictions: List[Prediction]
+    ) -> Tuple[List[Dict[str, Any]], float, int]:
+        """Derive recommendations, overall confidence and risk level."""
+        if not predictions:
+            return [], 0.5, 0
+
         recommendations = []
+        confidence_sum = 0.0
+        max_risk = 0
 
         for pred in predictions:
-            pred_type = pred.get('type', '')
-            prob = pred.get('probability', 0)
+            pred_type = pred.type
+            prob = pred.probability if pred.probability is not None else 0
+            if pred.confidence is not None:
+                confidence_sum += pred.confidence
+            else:
+                confidence_sum += pred.probability if pred.probability is not None else 0.5
 
             if pred_type == 'cpu_overload':
                 recommendations.append({
@@ -188,37 +222,12 @@ class ForecasterAgent:
                     'auto_apply': False
                 })
 
-        return recommendations
+            tiers = self._RISK_TIERS.get(pred_type)
+            if tiers:
+                for threshold, risk in tiers:
+                    if prob > threshold:
+                        if risk > max_risk:
+                            max_risk = risk
+                        break
 
-    def _calculate_confidence(self, predictions: List[Dict[str, Any]]) -> float:
-        """Calculate overall confidence."""
-        if not predictions:
-            return 0.5
-
-        confidences = [p.get('confidence', p.get('probability', 0.5)) for p in predictions]
-        return sum(confidences) / len(confidences)
-
-    def _calculate_risk_level(self, predictions: List[Dict[str, Any]]) -> int:
-        """Calculate overall risk level."""
-        if not predictions:
-            return 0
-
-        max_risk = 0
-        for pred in predictions:
-            prob = pred.get('probability', 0)
-            pred_type = pred.get('type', '')
-
-            if 'overload' in pred_type or 'exhaustion' in pred_type:
-                if prob > 0.8:
-                    max_risk = max(max_risk, 4)
-                elif prob > 0.6:
-                    max_risk = max(max_risk, 3)
-                else:
-                    max_risk = max(max_risk, 2)
-            elif 'failure' in pred_type:
-                if prob > 0.5:
-                    max_risk = max(max_risk, 3)
-                else:
-                    max_risk = max(max_risk, 1)
-
-        return min(5, max_risk)
+        return recommendations, confidence_sum / len(predictions), min(5, max_risk)
@@ -2,15 +2,38 @@
 
 Phase 11 - Continuous Self-Improvement & Adaptive Governance.
 """
-import hashlib
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timezone
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Union
+
+from synapse.agents import _governor_kernels
+from synapse.core.hashing import content_hash
+from synapse.core.timestamps import utc_isoformat
 
 PROTOCOL_VERSION: str = "1.0"
 
+SKILL_SUCCESS_THRESHOLD: float = 0.8
+SKILL_LATENCY_THRESHOLD_MS: int = 300
+# Below this many skills the dict loop beats building the metric columns.
+VECTORIZE_MIN_SKILLS: int = 64
+
+
+@lru_cache(maxsize=4096)
+def _action_id_cached(seed: int, action_type: str, target: str) -> str:
+    """Content-hash action ID; memoized for recurring (seed, action, target)."""
+    data = f"{seed}:{action_type}:{target}"
+    return f"act-{content_hash(data.encode())[:32]}"
+
 
-@dataclass
+@dataclass(slots=True)
+class SkillMetrics:
+    """Per-skill health metrics; telemetry may report these instead of dicts."""
+    success_rate: float = 1.0
+    latency_ms: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
 class GovernanceAction:
     """Action to be taken by governor."""
     action_type: str
@@ -21,7 +44,7 @@ class GovernanceAction:
     protocol_version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """Result of governance action."""
     success: bool
@@ -33,10 +56,34 @@ class ActionResult:
     protocol_version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
+class AnalysisView(Mapping):
+    """Metrics snapshot a governance decision was derived from.
+
+    Also a read-only mapping with "system" and "skills" keys, so it reads
+    and compares like the dict it replaced.
+    """
+    system: Dict[str, Any]
+    skills: Dict[str, Any]
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if key == "system":
+            return self.system
+        if key == "skills":
+            return self.skills
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("system", "skills"))
+
+    def __len__(self) -> int:
+        return 2
+
+
+@dataclass(slots=True, frozen=True)
 class GovernanceDecision:
     """Decision made by governor based on analysis."""
-    analysis: Dict[str, Any]
+    analysis: AnalysisView
     bottlenecks: List[Dict[str, Any]]
     actions: List[Dict[str, Any]]
     feedback: Dict[str, Any]
@@ -55,6 +102,9 @@ class GovernorAgent:
         cluster_manager: Any = None
     ):
         self.telemetry = telemetry
+        # Telemetry accessors resolved once rather than probed per analyze()
+        self._get_system_metrics = getattr(telemetry, 'get_system_metrics', None) if telemetry else None
+        self._get_skill_metrics = getattr(telemetry, 'get_skill_metrics', None) if telemetry else None
         self.policy_engine = policy_engine
         self.resource_manager = resource_manager
         self.audit_logger = audit_logger
@@ -63,8 +113,7 @@ class GovernorAgent:
     
     def _generate_id(self, seed: int, action_type: str, target: str) -> str:
         """Generate deterministic action ID."""
-        data = f"{seed}:{action_type}:{target}"
-        return f"act-{hashlib.md5(data.encode(), usedforsecurity=False).hexdigest()}"  # nosec B324
+        return _action_id_cached(seed, action_type, target)
     
     async def analyze(self) -> GovernanceDecision:
         """Analyze system metrics and make governance decision."""
@@ -72,18 +121,18 @@ class GovernorAgent:
         if self.audit_logger:
             self.audit_logger.record({
                 "event": "governance_analysis_started",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_isoformat()
             })
         
         # Get system metrics
         system_metrics = {}
-        if self.telemetry:
-            system_metrics = self.telemetry.get_system_metrics()
+        if self._get_system_metrics is not None:
+            system_metrics = self._get_system_metrics()
         
         # Get skill metrics
         skill_metrics = {}
-        if self.telemetry and hasattr(self.telemetry, 'get_skill_metrics'):
-            skill_metrics = self.telemetry.get_skill_metrics()
+        if self._get_skill_metrics is not None:
+            skill_metrics = self._get_skill_metrics()
         
         # Analyze for bottlenecks
         bottlenecks = self._detect_bottlenecks(system_metrics, skill_metrics)
@@ -100,14 +149,11 @@ class GovernorAgent:
                 "event": "governance_analysis_completed",
                 "bottlenecks_count": len(bottlenecks),
                 "actions_count": len(actions),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": utc_isoformat()
             })
         
         return GovernanceDecision(
-            analysis={
-                "system": system_metrics,
-                "skills": skill_metrics
-            },
+            analysis=AnalysisView(system=system_metrics, skills=skill_metrics),
             bottlenecks=bottlenecks,
             actions=actions,
             feedback=feedback
@@ -154,7 +200,7 @@ class GovernorAgent:
                     "action_type": action.action_type,
                     "target": action.target,
                     "success": True,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": utc_isoformat()
                 })
             
             return ActionResult(
@@ -205,25 +251,57 @@ class GovernorAgent:
         
         # Check skill metrics
         if skill_metrics:
-            for skill_name, metrics in skill_metrics.items():
-                if isinstance(metrics, dict):
-                    success_rate = metrics.get("success_rate", 1.0)
-                    if success_rate < 0.8:
-                        bottlenecks.append({
-                            "type": "low_success_rate",
-                            "source": f"skill:{skill_name}",
-                            "value": success_rate,
-                            "threshold": 0.8
-                        })
-                    
-                    latency = metrics.get("latency_ms", 0)
-                    if latency > 300:
-                        bottlenecks.append({
-                            "type": "high_latency",
-                            "source": f"skill:{skill_name}",
-                            "value": latency,
-                            "threshold": 300
-                        })
+            bottlenecks.extend(self._detect_skill_bottlenecks(skill_metrics))
+        
+        return bottlenecks
+    
+    def _detect_skill_bottlenecks(
+        self,
+        skill_metrics: Dict[str, Union["SkillMetrics", Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Flag skills under the success-rate or over the latency threshold."""
+        names = []
+        success = []
+        latency = []
+        for skill_name, metrics in skill_metrics.items():
+            if isinstance(metrics, SkillMetrics):
+                success.append(metrics.success_rate)
+                latency.append(metrics.latency_ms)
+            elif isinstance(metrics, dict):
+                success.append(metrics.get("success_rate", 1.0))
+                latency.append(metrics.get("latency_ms", 0))
+            else:
+                continue
+            names.append(skill_name)
+        
+        if _governor_kernels.AVAILABLE and len(names) >= VECTORIZE_MIN_SKILLS:
+            flagged = _governor_kernels.threshold_flags(
+                success, latency, SKILL_SUCCESS_THRESHOLD, SKILL_LATENCY_THRESHOLD_MS
+            )
+        else:
+            flagged = []
+            for i, (success_rate, latency_ms) in enumerate(zip(success, latency)):
+                low_success = success_rate < SKILL_SUCCESS_THRESHOLD
+                high_latency = latency_ms > SKILL_LATENCY_THRESHOLD_MS
+                if low_success or high_latency:
+                    flagged.append((i, low_success, high_latency))
+        
+        bottlenecks = []
+        for i, low_success, high_latency in flagged:
+            if low_success:
+                bottlenecks.append({
+                    "type": "low_success_rate",
+                    "source": f"skill:{names[i]}",
+                    "value": success[i],
+                    "threshold": SKILL_SUCCESS_THRESHOLD
+                })
+            if high_latency:
+                bottlenecks.append({
+                    "type": "high_latency",
+                    "source": f"skill:{names[i]}",
+                    "value": latency[i],
+                    "threshold": SKILL_LATENCY_THRESHOLD_MS
+                })
         
         return bottlenecks
     
@@ -3,26 +3,114 @@
 Implements SYSTEM_SPEC_v3.1 - Guardian Agent.
 With comprehensive audit logging.
 """
-from typing import Dict, List, Optional
+import asyncio
+import contextlib
+import re
+from typing import Dict, List, Optional, Sequence, Union
 from dataclasses import dataclass
 
 PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
 
 # Import audit for logging
-from synapse.observability.logger import audit
+from synapse.observability.logger import audit, audit_enabled
 
+DANGEROUS_PATTERNS = ('rm -rf', 'format', 'delete', 'drop', 'truncate')
+# Zero-width lookahead so overlapping patterns (e.g. "rm -rformat") all match
+_DANGEROUS_RE = re.compile("(?=(" + "|".join(map(re.escape, DANGEROUS_PATTERNS)) + "))")
 
-@dataclass
+# Steps buffered per audit record before an intermediate flush
+AUDIT_BATCH_MAX_STEPS: int = 32
+
+
+class _AuditBatch:
+    """Buffers the steps of one guardian check and emits them as one audit record."""
+
+    __slots__ = ("event", "fields", "steps", "enabled")
+
+    def __init__(self, event: str, **fields):
+        self.event = event
+        self.fields = fields
+        self.steps: List[Dict] = []
+        self.enabled = audit_enabled()
+
+    def add(self, step: str, **fields) -> None:
+        if not self.enabled:
+            return
+        self.steps.append({"step": step, **fields})
+        if len(self.steps) >= AUDIT_BATCH_MAX_STEPS:
+            audit(event=self.event, steps=self.steps, partial=True, **self.fields)
+            self.steps = []
+
+    def flush(self, **outcome) -> None:
+        if not self.enabled:
+            return
+        audit(event=self.event, steps=self.steps, **self.fields, **outcome)
+        self.steps = []
+
+
+@dataclass(slots=True, frozen=True)
 class SecurityCheckResult:
     """Result of security check."""
     approved: bool
     reason: str
-    blocked_capabilities: List[str]
+    blocked_capabilities: Sequence[str]
     requires_human_approval: bool
     protocol_version: str = "1.0"
 
 
+@dataclass(slots=True, frozen=True)
+class ValidatedPlan:
+    """Plan fields read by the guardian, parsed once from the plan dict."""
+    plan_id: str
+    risk_level: int
+    required_capabilities: List[str]
+    raw: Dict
+
+    @classmethod
+    def from_dict(cls, plan: Dict) -> "ValidatedPlan":
+        return cls(
+            plan_id=plan.get("id", "unknown"),
+            risk_level=plan.get("risk_level", 0),
+            required_capabilities=plan.get("required_capabilities", []),
+            raw=plan
+        )
+
+
+async def _cancel(task: Optional["asyncio.Future"]) -> None:
+    """Cancel a pending approval request and wait for it to unwind."""
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
+
+
+# Shared results for the common approve paths.  They are frozen and their
+# blocked_capabilities is an empty tuple, so no caller can alter them.
+_APPROVED_NO_CAPS = SecurityCheckResult(
+    approved=True,
+    reason="no_capabilities_required",
+    blocked_capabilities=(),
+    requires_human_approval=False,
+    protocol_version=PROTOCOL_VERSION
+)
+_APPROVED_NO_SECURITY = SecurityCheckResult(
+    approved=True,
+    reason="no_security_manager",
+    blocked_capabilities=(),
+    requires_human_approval=False,
+    protocol_version=PROTOCOL_VERSION
+)
+_APPROVED_SAFETY = SecurityCheckResult(
+    approved=True,
+    reason="safety_check_passed",
+    blocked_capabilities=(),
+    requires_human_approval=False,
+    protocol_version=PROTOCOL_VERSION
+)
+
+
 class GuardianAgent:
     """Agent for security validation before execution with audit logging."""
 
@@ -39,48 +127,75 @@ class GuardianAgent:
             protocol_version=self.protocol_version
         )
 
-    async def validate_plan(self, plan: Dict, context: Dict = None) -> SecurityCheckResult:
+    async def validate_plan(
+        self, plan: Union[Dict, ValidatedPlan], context: Dict = None
+    ) -> SecurityCheckResult:
         """Validate plan before execution with audit logging.
 
+        The validation steps are audited as a single "plan_validation" record.
+
         Args:
-            plan: Plan to validate
+            plan: Plan to validate, as a dict or an already parsed ValidatedPlan
             context: Execution context
 
         Returns:
             SecurityCheckResult with validation results
         """
-        # Audit: plan validation started
-        audit(
-            event="plan_validation_started",
-            plan_id=plan.get("id", "unknown"),
-            risk_level=plan.get("risk_level", 0),
+        if not isinstance(plan, ValidatedPlan):
+            plan = ValidatedPlan.from_dict(plan)
+        batch = _AuditBatch(
+            "plan_validation",
+            plan_id=plan.plan_id,
             protocol_version=self.protocol_version
         )
+        batch.add("started", risk_level=plan.risk_level)
+        result = None
+        try:
+            result = await self._validate_plan(plan, context, batch)
+            return result
+        finally:
+            batch.flush(
+                approved=result.approved if result else False,
+                reason=result.reason if result else "error"
+            )
+
+    async def _validate_plan(
+        self,
+        plan: ValidatedPlan,
+        context: Optional[Dict],
+        batch: "_AuditBatch"
+    ) -> SecurityCheckResult:
+        risk_level = plan.risk_level
+        # High-risk plans need human approval whatever the capability
+        # outcome, so request it while the capability check runs.
+        approval_task = None
+        if risk_level >= 3:
+            batch.add("human_approval_requested", risk_level=risk_level)
+            approval_task = asyncio.ensure_future(
+                self._request_human_approval(plan, context)
+            )
 
         # 1. Capability check
-        caps_result = await self._check_capabilities(plan, context)
+        try:
+            caps_result = await self._check_capabilities(plan, context)
+        except BaseException:
+            await _cancel(approval_task)
+            raise
 
         if not caps_result.approved:
-            # Audit: validation denied - missing capabilities
-            audit(
-                event="plan_validation_denied",
+            await _cancel(approval_task)
+            batch.add(
+                "denied",
                 reason="missing_capabilities",
-                blocked=caps_result.blocked_capabilities,
-                protocol_version=self.protocol_version
+                blocked=caps_result.blocked_capabilities
             )
             return caps_result
 
         # 2. Human approval check for high risk
-        risk_level = plan.get("risk_level", 0)
-        if risk_level >= 3:
-            approval = await self._request_human_approval(plan, context)
+        if approval_task is not None:
+            approval = await approval_task
             if not approval.approved:
-                # Audit: human denied
-                audit(
-                    event="human_approval_denied",
-                    plan_id=plan.get("id", "unknown"),
-                    protocol_version=self.protocol_version
-                )
+                batch.add("human_approval_denied")
                 return SecurityCheckResult(
                     approved=False,
                     reason="human_denied",
@@ -89,12 +204,7 @@ class GuardianAgent:
                     protocol_version=self.protocol_version
                 )
 
-        # Audit: validation approved
-        audit(
-            event="plan_validation_approved",
-            plan_id=plan.get("id", "unknown"),
-            protocol_version=self.protocol_version
-        )
+        batch.add("approved")
 
         return SecurityCheckResult(
             approved=True,
@@ -104,18 +214,12 @@ class GuardianAgent:
             protocol_version=self.protocol_version
         )
 
-    async def _check_capabilities(self, plan: Dict, context: Dict) -> SecurityCheckResult:
+    async def _check_capabilities(self, plan: ValidatedPlan, context: Dict) -> SecurityCheckResult:
         """Check required capabilities."""
-        required_caps = plan.get("required_capabilities", [])
+        required_caps = plan.required_capabilities
 
         if not required_caps:
-            return SecurityCheckResult(
-                approved=True,
-                reason="no_capabilities_required",
-                blocked_capabilities=[],
-                requires_human_approval=False,
-                protocol_version=self.protocol_version
-            )
+            return _APPROVED_NO_CAPS
 
         if self.security:
             result = await self.security.check_capabilities(
@@ -134,27 +238,13 @@ class GuardianAgent:
             )
 
         # No security manager - approve by default
-        return SecurityCheckResult(
-            approved=True,
-            reason="no_security_manager",
-            blocked_capabilities=[],
-            requires_human_approval=False,
-            protocol_version=self.protocol_version
-        )
+        return _APPROVED_NO_SECURITY
 
-    async def _request_human_approval(self, plan: Dict, context: Dict) -> SecurityCheckResult:
+    async def _request_human_approval(self, plan: ValidatedPlan, context: Dict) -> SecurityCheckResult:
         """Request human approval for high-risk plan."""
-        # Audit: human approval requested
-        audit(
-            event="human_approval_requested",
-            plan_id=plan.get("id", "unknown"),
-            risk_level=plan.get("risk_level", 0),
-            protocol_version=self.protocol_version
-        )
-
         if self.security:
             approval = await self.security.request_human_approval(
-                plan=plan,
+                plan=plan.raw,
                 trace_id=context.get("trace_id", "unknown") if context else "unknown"
             )
             return SecurityCheckResult(
@@ -175,10 +265,12 @@ class GuardianAgent:
         )
 
     async def check_execution_safety(self, skill_name: str, params: Dict) -> SecurityCheckResult:
-        """Check if skill execution is safe with audit logging."""
-        # Audit: execution safety check started
-        audit(
-            event="execution_safety_check_started",
+        """Check if skill execution is safe with audit logging.
+
+        The check is audited as a single "execution_safety_check" record.
+        """
+        batch = _AuditBatch(
+            "execution_safety_check",
             skill_name=skill_name,
             protocol_version=self.protocol_version
         )
@@ -187,13 +279,8 @@ class GuardianAgent:
         dangerous_params = self._check_dangerous_params(params)
 
         if dangerous_params:
-            # Audit: dangerous params detected
-            audit(
-                event="dangerous_params_detected",
-                skill_name=skill_name,
-                params=dangerous_params,
-                protocol_version=self.protocol_version
-            )
+            batch.add("dangerous_params_detected", params=dangerous_params)
+            batch.flush(approved=False, reason="dangerous_parameters")
 
             return SecurityCheckResult(
                 approved=False,
@@ -203,30 +290,18 @@ class GuardianAgent:
                 protocol_version=self.protocol_version
             )
 
-        # Audit: execution safety check passed
-        audit(
-            event="execution_safety_check_passed",
-            skill_name=skill_name,
-            protocol_version=self.protocol_version
-        )
+        batch.flush(approved=True, reason="safety_check_passed")
 
-        return SecurityCheckResult(
-            approved=True,
-            reason="safety_check_passed",
-            blocked_capabilities=[],
-            requires_human_approval=False,
-            protocol_version=self.protocol_version
-        )
+        return _APPROVED_SAFETY
 
     def _check_dangerous_params(self, params: Dict) -> List[str]:
         """Check for dangerous parameters."""
         dangerous = []
-        dangerous_patterns = ['rm -rf', 'format', 'delete', 'drop', 'truncate']
 
         for key, value in params.items():
-            value_str = str(value).lower()
-            for pattern in dangerous_patterns:
-                if pattern in value_str:
-                    dangerous.append(f"{key}: {pattern}")
+            found = set(_DANGEROUS_RE.findall(str(value).lower()))
+            if found:
+                # One entry per matched pattern, in pattern order
+                dangerous.extend(f"{key}: {pattern}" for pattern in DANGEROUS_PATTERNS if pattern in found)
 
         return dangerous
@@ -2,16 +2,82 @@
 
 Phase 10 - Production Autonomy & Self-Optimization.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-import hashlib
+from functools import lru_cache
+import time
+
+from synapse.core.hashing import content_digest
 
 
 PROTOCOL_VERSION: str = "1.0"
 
+# Policy decisions rarely change between requests; re-check after the TTL
+POLICY_CACHE_TTL: float = 60.0
+POLICY_CACHE_SIZE: int = 1024
+
+
+# Static LLM prompt bodies; only the request fields vary per call.
+_CODE_TMPL = """Optimize the following code for {goal}.
+
+Current code:
+{code}
+
+Performance metrics:
+- Success rate: {success_rate}
+- Latency: {latency_ms}ms
+
+Provide optimized code that improves {goal}.
+"""
+
+_PROMPT_TMPL = """Optimize the following prompt for {goal}.
+
+Current prompt:
+{prompt}
+
+Performance metrics:
+- Success rate: {success_rate}
+
+Provide an improved prompt.
+"""
+
+
+@lru_cache(maxsize=4096)
+def _optimization_id(skill_name: str, optimization_goal: str, seed: int) -> str:
+    """Content-hash optimization ID; memoized for repeat optimizations of a skill."""
+    content = f"{skill_name}:{optimization_goal}:{seed}"
+    return f"opt-{content_digest(content.encode())[:16].hex()}"
+
+
+@lru_cache(maxsize=1024)
+def _fallback_code(skill_name: str, optimization_goal: str, seed: int) -> str:
+    """Deterministic fallback code; memoized for repeat requests."""
+    return f'''# Optimized skill: {skill_name}
+# Optimization goal: {optimization_goal}
+# Seed: {seed}
+
+class Optimized{skill_name.title().replace("_", "")}:
+    """Optimized version with improved {optimization_goal}."""
+    
+    protocol_version = "1.0"
+    
+    def execute(self, context):
+        """Execute with optimized performance."""
+        # Improved implementation
+        return {{"success": True, "optimized": True}}
+'''
+
 
-@dataclass
+@lru_cache(maxsize=256)
+def _fallback_prompt(optimization_goal: str) -> str:
+    """Deterministic fallback prompt; memoized per goal."""
+    return f"""Execute the task with improved {optimization_goal}.
+Be precise and efficient in your response.
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class OptimizationRequest:
     """Request for optimization."""
     skill_name: str
@@ -23,7 +89,7 @@ class OptimizationRequest:
     protocol_version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OptimizationResponse:
     """Response from optimization."""
     success: bool
@@ -56,6 +122,28 @@ class OptimizerAgent:
         self.llm_provider = llm_provider
         self.policy_engine = policy_engine
         self.audit_logger = audit_logger
+        # skill_name -> (expires_at monotonic seconds, allowed)
+        self._policy_cache: Dict[str, Tuple[float, bool]] = {}
+    
+    def _allows_optimization(self, skill_name: str) -> bool:
+        """Policy decision for skill_name, cached for POLICY_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._policy_cache.get(skill_name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        allowed = bool(self.policy_engine.allows_optimization(skill_name))
+        if cached is None and len(self._policy_cache) >= POLICY_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._policy_cache[next(iter(self._policy_cache))]
+        self._policy_cache[skill_name] = (now + POLICY_CACHE_TTL, allowed)
+        return allowed
+    
+    def invalidate_policy(self, skill_name: Optional[str] = None) -> None:
+        """Drop cached policy decisions for skill_name, or all when None."""
+        if skill_name is None:
+            self._policy_cache.clear()
+        else:
+            self._policy_cache.pop(skill_name, None)
     
     def _generate_optimization_id(self, request: OptimizationRequest) -> str:
         """Generate deterministic optimization ID.
@@ -66,10 +154,7 @@ class OptimizerAgent:
         Returns:
             Deterministic UUID based on request content
         """
-        content = f"{request.skill_name}:{request.optimization_goal}:{request.seed}"
-        hash_bytes = hashlib.sha256(content.encode()).digest()
-        hex_id = hash_bytes[:16].hex()
-        return f"opt-{hex_id}"
+        return _optimization_id(request.skill_name, request.optimization_goal, request.seed)
     
     async def optimize_code(self, request: OptimizationRequest) -> OptimizationResponse:
         """Optimize skill code.
@@ -84,7 +169,7 @@ class OptimizerAgent:
         
         # Check policy
         if self.policy_engine:
-            if not self.policy_engine.allows_optimization(request.skill_name):
+            if not self._allows_optimization(request.skill_name):
                 return OptimizationResponse(
                     success=False,
                     optimization_id=optimization_id,
@@ -130,7 +215,7 @@ class OptimizerAgent:
         
         # Check policy
         if self.policy_engine:
-            if not self.policy_engine.allows_optimization(request.skill_name):
+            if not self._allows_optimization(request.skill_name):
                 return OptimizationResponse(
                     success=False,
                     optimization_id=optimization_id,
@@ -163,17 +248,13 @@ class OptimizerAgent:
         Returns:
             Prompt string for LLM
         """
-        return f"""Optimize the following code for {request.optimization_goal}.
-
-Current code:
-{request.current_code}
-
-Performance metrics:
-- Success rate: {request.performance_metrics.get('success_rate', 'unknown')}
-- Latency: {request.performance_metrics.get('latency_ms', 'unknown')}ms
-
-Provide optimized code that improves {request.optimization_goal}.
-"""
+        metrics = request.performance_metrics
+        return _CODE_TMPL.format_map({
+            "goal": request.optimization_goal,
+            "code": request.current_code,
+            "success_rate": metrics.get("success_rate", "unknown"),
+            "latency_ms": metrics.get("latency_ms", "unknown"),
+        })
     
     def _build_prompt_optimization_prompt(self, request: OptimizationRequest) -> str:
         """Build prompt for prompt optimization.
@@ -184,16 +265,11 @@ Provide optimized code that improves {request.optimization_goal}.
         Returns:
             Prompt string for LLM
         """
-        return f"""Optimize the following prompt for {request.optimization_goal}.
-
-Current prompt:
-{request.current_prompt}
-
-Performance metrics:
-- Success rate: {request.performance_metrics.get('success_rate', 'unknown')}
-
-Provide an improved prompt.
-"""
+        return _PROMPT_TMPL.format_map({
+            "goal": request.optimization_goal,
+            "prompt": request.current_prompt,
+            "success_rate": request.performance_metrics.get("success_rate", "unknown"),
+        })
     
     def _generate_fallback_code(self, request: OptimizationRequest) -> str:
         """Generate fallback optimized code.
@@ -204,20 +280,7 @@ Provide an improved prompt.
         Returns:
             Fallback optimized code
         """
-        return f'''# Optimized skill: {request.skill_name}
-# Optimization goal: {request.optimization_goal}
-# Seed: {request.seed}
-
-class Optimized{request.skill_name.title().replace("_", "")}:
-    """Optimized version with improved {request.optimization_goal}."""
-    
-    protocol_version = "1.0"
-    
-    def execute(self, context):
-        """Execute with optimized performance."""
-        # Improved implementation
-        return {{"success": True, "optimized": True}}
-'''
+        return _fallback_code(request.skill_name, request.optimization_goal, request.seed)
     
     def _generate_fallback_prompt(self, request: OptimizationRequest) -> str:
         """Generate fallback optimized prompt.
@@ -228,6 +291,4 @@ class Optimized{request.skill_name.title().replace("_", "")}:
         Returns:
             Fallback optimized prompt
         """
-        return f"""Execute the task with improved {request.optimization_goal}.
-Be precise and efficient in your response.
-"""
+        return _fallback_prompt(request.optimization_goal)
@@ -22,7 +22,21 @@ SPEC_VERSION: str = "3.1"
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _keyword_re(*keywords: str) -> "re.Pattern[str]":
+    """Case-insensitive substring match for any of keywords."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Heuristic planner keyword groups, one precompiled scan per step kind
+_READ_RE = _keyword_re("read", "open", "load", "get file")
+_WRITE_RE = _keyword_re("write", "save", "create file", "output")
+_SEARCH_RE = _keyword_re("search", "find", "look up", "web", "google")
+_GENERATE_RE = _keyword_re("generate", "create", "build", "code", "script")
+_ANALYZE_RE = _keyword_re("analyze", "process", "transform", "convert")
+_PATH_RE = re.compile(r"[\w./]+\.\w+")
+
+
+@dataclass(slots=True, frozen=True)
 class ActionStep:
     """One step in an ActionPlan."""
     step_id: str
@@ -47,7 +61,7 @@ class ActionStep:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionPlan:
     """Complete execution plan for a task."""
     plan_id: str
@@ -257,34 +271,34 @@ class PlannerAgent:
 
     def _plan_heuristic(self, task: str) -> List[ActionStep]:
         """Heuristic plan generation based on task keywords."""
-        t = task.lower()
         steps: List[ActionStep] = []
 
-        if any(k in t for k in ["read", "open", "load", "get file"]):
+        if _READ_RE.search(task):
+            path_match = _PATH_RE.search(task)
             steps.append(ActionStep(
                 step_id="step_1", action="Read file contents", skill="read_file",
-                params={"path": re.search(r'[\w./]+\.\w+', task).group(0) if re.search(r'[\w./]+\.\w+', task) else "."},
+                params={"path": path_match.group(0) if path_match else "."},
                 required_capabilities=["fs:read"], risk_level=1,
             ))
-        if any(k in t for k in ["write", "save", "create file", "output"]):
+        if _WRITE_RE.search(task):
             steps.append(ActionStep(
                 step_id=f"step_{len(steps)+1}", action="Write result to file", skill="write_file",
                 params={"path": "output.txt", "content": "{{previous_result}}"},
                 required_capabilities=["fs:write"], risk_level=2,
             ))
-        if any(k in t for k in ["search", "find", "look up", "web", "google"]):
+        if _SEARCH_RE.search(task):
             steps.append(ActionStep(
                 step_id=f"step_{len(steps)+1}", action="Web search", skill="web_search",
                 params={"query": task},
                 required_capabilities=["net:http"], risk_level=2,
             ))
-        if any(k in t for k in ["generate", "create", "build", "code", "script"]):
+        if _GENERATE_RE.search(task):
             steps.append(ActionStep(
                 step_id=f"step_{len(steps)+1}", action="Generate code", skill="code_generator",
                 params={"task_description": task},
                 required_capabilities=["code:generate"], risk_level=3,
             ))
-        if any(k in t for k in ["analyze", "process", "transform", "convert"]):
+        if _ANALYZE_RE.search(task):
             steps.append(ActionStep(
                 step_id=f"step_{len(steps)+1}", action="Analyze and process data", skill="data_processor",
                 params={"task": task},
@@ -2,7 +2,8 @@ PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
 
 import asyncio
-from typing import Any, Callable, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Union
 
 from synapse.core.models import ExecutionContext, SkillManifest
 from synapse.observability.logger import trace, record_metric
@@ -15,36 +16,50 @@ class CognitiveAgent:
     def __init__(self, name: str, context: ExecutionContext):
         self.name = name
         self.context = context
-        self.skill_registry: Dict[str, Callable[..., Any]] = {}
+        # A plain dict until seal() swaps in a read-only MappingProxyType
+        self.skill_registry: Union[
+            Dict[str, Callable[..., Any]], Mapping[str, Callable[..., Any]]
+        ] = {}
 
     # ---------------------------------------------------------------------
     # Skill handling
     # ---------------------------------------------------------------------
     def register_skill(self, manifest: SkillManifest, handler: Callable[..., Any]):
-        self.skill_registry[manifest.name] = handler
+        registry = self.skill_registry
+        if not isinstance(registry, dict):
+            raise RuntimeError(f"Agent {self.name} is sealed; cannot register {manifest.name}")
+        registry[manifest.name] = handler
         record_metric("skill_registered")
 
+    @property
+    def sealed(self) -> bool:
+        return isinstance(self.skill_registry, MappingProxyType)
+
+    def seal(self) -> None:
+        """Freeze the skill registry once registration is complete."""
+        if not self.sealed:
+            self.skill_registry = MappingProxyType(dict(self.skill_registry))
+
     async def execute_skill(self, name: str, **kwargs):
-        if name not in self.skill_registry:
+        handler = self.skill_registry.get(name)
+        if handler is None:
             raise ValueError(f"Skill {name} not registered")
-        handler = self.skill_registry[name]
         async with trace("skill_execute", skill=name):
             result = await handler(**kwargs)
             record_metric("skill_executed")
             return result
 
     # ---------------------------------------------------------------------
-    # Lifecycle hooks – default implementations are no‑ops
+    # Lifecycle hooks – default implementations are no‑ops and skip tracing
+    # so an idle run_once() does not pay for spans; overrides add their own
     # ---------------------------------------------------------------------
     async def perceive(self) -> Any:
-        async with trace("perceive"):
-            # In a real system this would ingest events from connectors
-            return None
+        # In a real system this would ingest events from connectors
+        return None
 
     async def reason(self, perception: Any) -> Any:
-        async with trace("reason"):
-            # Decision making – placeholder returns a dummy plan
-            return {"action": "noop"}
+        # Decision making – placeholder returns a dummy plan
+        return {"action": "noop"}
 
     async def act(self, plan: Any) -> Any:
         async with trace("act"):
@@ -54,16 +69,18 @@ class CognitiveAgent:
             return None
 
     async def learn(self, result: Any) -> None:
+        # Store experience in memory if available
+        memory = getattr(self, "memory", None)
+        if memory is None:
+            return
         async with trace("learn"):
-            # Store experience in memory if available
-            if hasattr(self, "memory") and self.memory is not None:
-                try:
-                    await self.memory.store(
-                        key=f"experience:{id(result)}",
-                        value={"result": str(result), "agent": self.__class__.__name__}
-                    )
-                except Exception as _exc:  # noqa
-                    pass  # noqa: silenced - _exc
+            try:
+                await memory.store(
+                    key=f"experience:{id(result)}",
+                    value={"result": str(result), "agent": self.__class__.__name__}
+                )
+            except Exception as _exc:  # noqa
+                pass  # noqa: silenced - _exc
 
     # ---------------------------------------------------------------------
     # Full run – orchestrates the lifecycle
@@ -2,32 +2,69 @@
 
 Protocol Version: 1.0
 """
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timezone
-import json
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 import asyncio
+import gzip
+import itertools
 import os
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 
+from synapse.core.hashing import content_hash
+from synapse.core.timestamps import utc_isoformat
 from synapse.core.exceptions import synapse_error_handler, generic_error_handler, SynapseError
+from synapse.api import responses
+from synapse.api.responses import OrjsonResponse
+from synapse.api.storage import tail
+from synapse.observability.logger import start_audit_drainer, stop_audit_drainer
 from synapse.api.middleware import (
     make_request_logging_middleware,
+    make_response_cache_middleware,
+    make_trace_id_middleware,
+    trace_id_var,
     make_security_headers_middleware,
     make_rate_limit_middleware,
 )
 PROTOCOL_VERSION: str = "1.0"
 
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Run the audit drainer for the lifetime of the application."""
+    start_audit_drainer()
+    for name in TEMPLATE_PAGES:
+        _load_template(name)
+    try:
+        yield
+    finally:
+        await stop_audit_drainer()
+
+
 app = FastAPI(
     title="Synapse Agent Platform",
     description="Universal Autonomous Agent Platform API",
     version="3.4.0",
+    lifespan=_lifespan,
+    default_response_class=OrjsonResponse,
 )
 
 # Phase 2 Middleware — registered as pure async functions (no BaseHTTPMiddleware)
+# Dashboard polling endpoints; innermost, so auth and rate limits still apply
+app.middleware("http")(make_response_cache_middleware({
+    "/api/v1/status": 2.0,
+    "/api/v1/approvals": 2.0,
+    "/api/v1/approvals/pending": 2.0,
+    "/api/v1/logs": 5.0,
+}))
 app.middleware("http")(make_request_logging_middleware())
+app.middleware("http")(make_trace_id_middleware())
 app.middleware("http")(make_security_headers_middleware())
 app.middleware("http")(make_rate_limit_middleware(requests_per_minute=60))
 
@@ -41,6 +78,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON/HTML bodies for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Include API routes
 from synapse.api.routes import api_router
 
@@ -84,8 +124,18 @@ app.include_router(api_router, prefix="/api/v1")
 # In-memory storage for demo
 agents: Dict[str, Dict] = {}
 approvals: List[Dict] = []
-logs: List[Dict] = []
+# Same dicts as `approvals`, indexed by id for approve/reject
+approvals_by_id: Dict[str, Dict] = {}
+# Pending subset in creation order, so status/pending views skip a full scan
+pending_approvals: Dict[str, Dict] = {}
+# Oldest log entries are evicted past LOGS_MAX
+LOGS_MAX: int = 10_000
+logs: "deque[Dict]" = deque(maxlen=LOGS_MAX)
 tasks: List[Dict] = []
+completed_tasks_count: int = 0
+# Monotonic ID sources; next() is atomic, unlike len(list) + 1
+_task_ids = itertools.count(1)
+_approval_ids = itertools.count(1)
 
 
 # === Models ===
@@ -116,44 +166,77 @@ async def health_check():
         "status": "healthy",
         "version": "3.4.0",
         "protocol_version": PROTOCOL_VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": utc_isoformat()
     }
 
 
-@app.get("/api/v1/status")
-async def get_status():
-    """Get system status."""
+def _status_snapshot() -> Dict[str, Any]:
     return {
         "status": "operational",
         "agents_count": len(agents),
-        "pending_approvals": len([a for a in approvals if a["status"] == "pending"]),
-        "tasks_completed": len([t for t in tasks if t["status"] == "completed"]),
+        "pending_approvals": len(pending_approvals),
+        "tasks_completed": completed_tasks_count,
         "protocol_version": PROTOCOL_VERSION
     }
 
 
+@app.get("/api/v1/status")
+async def get_status():
+    """Get system status."""
+    return _status_snapshot()
+
+
 # === Tasks ===
 
 @app.post("/api/v1/tasks")
 async def create_task(request: TaskRequest):
     """Create and execute a task."""
-    task_id = f"task_{len(tasks) + 1}"
+    global completed_tasks_count
+    task_id = f"task_{next(_task_ids)}"
     task = {
         "id": task_id,
         "task": request.task,
         "payload": request.payload,
         "status": "completed",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_isoformat(),
         "protocol_version": PROTOCOL_VERSION
     }
     tasks.append(task)
+    completed_tasks_count += 1
+    _publish_events("status")
     return task
 
 
+# Lists longer than this are encoded in chunks of this size, yielding to the
+# event loop between chunks so one large listing cannot stall other requests
+ENCODE_CHUNK_SIZE: int = 1000
+
+
+async def _encode_list_chunks(key: str, items: List[Dict]):
+    yield b'{"' + key.encode() + b'":['
+    for start in range(0, len(items), ENCODE_CHUNK_SIZE):
+        chunk = responses.dumps_bytes(items[start:start + ENCODE_CHUNK_SIZE])
+        yield (b"," if start else b"") + chunk[1:-1]
+        await asyncio.sleep(0)
+    yield b'],"protocol_version":' + responses.dumps_bytes(PROTOCOL_VERSION) + b"}"
+
+
+def _list_response(key: str, items: List[Dict]) -> Response:
+    """Respond with {key: items, "protocol_version": ...}.
+
+    Stored records are JSON-native, so a Response is returned directly to
+    skip FastAPI's per-item jsonable_encoder walk.
+    """
+    if len(items) <= ENCODE_CHUNK_SIZE:
+        return OrjsonResponse({key: items, "protocol_version": PROTOCOL_VERSION})
+    # Snapshot the list; records appended mid-stream are left out
+    return StreamingResponse(_encode_list_chunks(key, list(items)), media_type="application/json")
+
+
 @app.get("/api/v1/tasks")
 async def list_tasks():
     """List all tasks."""
-    return {"tasks": tasks, "protocol_version": PROTOCOL_VERSION}
+    return _list_response("tasks", tasks)
 
 
 # === Approvals ===
@@ -161,69 +244,107 @@ async def list_tasks():
 @app.get("/api/v1/approvals")
 async def list_approvals():
     """List all approval requests."""
-    return {"approvals": approvals, "protocol_version": PROTOCOL_VERSION}
+    return _list_response("approvals", approvals)
+
+
+def _pending_snapshot() -> Dict[str, Any]:
+    return {"approvals": list(pending_approvals.values()), "protocol_version": PROTOCOL_VERSION}
 
 
 @app.get("/api/v1/approvals/pending")
 async def list_pending_approvals():
     """List pending approval requests."""
-    pending = [a for a in approvals if a["status"] == "pending"]
-    return {"approvals": pending, "protocol_version": PROTOCOL_VERSION}
+    return _list_response("approvals", list(pending_approvals.values()))
 
 
 @app.post("/api/v1/approvals")
 async def create_approval(request: ApprovalRequest):
     """Create an approval request."""
-    approval_id = f"approval_{len(approvals) + 1}"
+    approval_id = f"approval_{next(_approval_ids)}"
     approval = {
         "id": approval_id,
         "action": request.action,
         "risk_level": request.risk_level,
         "details": request.details,
         "status": "pending",
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_isoformat(),
         "protocol_version": PROTOCOL_VERSION
     }
     approvals.append(approval)
+    approvals_by_id[approval_id] = approval
+    pending_approvals[approval_id] = approval
+    _publish_events("status", "approvals")
     return approval
 
 
 @app.post("/api/v1/approvals/{approval_id}/approve")
 async def approve_request(approval_id: str):
     """Approve a request."""
-    for approval in approvals:
-        if approval["id"] == approval_id:
-            approval["status"] = "approved"
-            approval["approved_at"] = datetime.now(timezone.utc).isoformat()
-            return approval
-    raise HTTPException(status_code=404, detail="Approval not found")
+    approval = approvals_by_id.get(approval_id)
+    if approval is None:
+        raise HTTPException(status_code=404, detail="Approval not found")
+    pending_approvals.pop(approval_id, None)
+    approval["status"] = "approved"
+    approval["approved_at"] = utc_isoformat()
+    _publish_events("status", "approvals")
+    return approval
 
 
 @app.post("/api/v1/approvals/{approval_id}/reject")
 async def reject_request(approval_id: str):
     """Reject a request."""
-    for approval in approvals:
-        if approval["id"] == approval_id:
-            approval["status"] = "rejected"
-            approval["rejected_at"] = datetime.now(timezone.utc).isoformat()
-            return approval
-    raise HTTPException(status_code=404, detail="Approval not found")
+    approval = approvals_by_id.get(approval_id)
+    if approval is None:
+        raise HTTPException(status_code=404, detail="Approval not found")
+    pending_approvals.pop(approval_id, None)
+    approval["status"] = "rejected"
+    approval["rejected_at"] = utc_isoformat()
+    _publish_events("status", "approvals")
+    return approval
 
 
 # === Logs ===
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _recent_logs(limit: int) -> List[Dict]:
+    return tail(logs, limit)
+
+
+def _logs_snapshot(limit: int) -> Dict[str, Any]:
+    return {"logs": _recent_logs(limit), "protocol_version": PROTOCOL_VERSION}
+
+
+def _stream_logs(limit: int) -> StreamingResponse:
+    # The entry list is taken up front (the deque may change mid-stream);
+    # only the encoding is done lazily, one line per entry.
+    entries = _recent_logs(limit)
+    lines = (responses.dumps_bytes(entry) + b"\n" for entry in entries)
+    return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE)
+
+
 @app.get("/api/v1/logs")
-async def get_logs(limit: int = 100):
-    """Get recent logs."""
-    return {"logs": logs[-limit:], "protocol_version": PROTOCOL_VERSION}
+async def get_logs(request: Request, limit: int = 100):
+    """Get recent logs (NDJSON when the client accepts application/x-ndjson)."""
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return _stream_logs(limit)
+    return _list_response("logs", _recent_logs(limit))
+
+
+@app.get("/api/v1/logs/stream")
+async def stream_logs(limit: int = 100):
+    """Stream recent logs as newline-delimited JSON, oldest first."""
+    return _stream_logs(limit)
 
 
 @app.post("/api/v1/logs")
 async def add_log(log: Dict[str, Any]):
     """Add a log entry."""
-    log["timestamp"] = datetime.now(timezone.utc).isoformat()
+    log["timestamp"] = utc_isoformat()
     log["protocol_version"] = PROTOCOL_VERSION
     logs.append(log)
+    _publish_events("logs")
     return log
 
 
@@ -243,28 +364,187 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.close(code=1008, reason="Unauthorized: Invalid or missing token")
         return
     
-    # Auth successful - accept connection
-    await websocket.accept()
+    # Auth successful - accept connection, with MessagePack framing when the
+    # client offers it and msgspec is installed; JSON text frames otherwise
+    use_msgpack = (
+        responses.MSGPACK_AVAILABLE
+        and responses.MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+    )
+    await websocket.accept(
+        subprotocol=responses.MSGPACK_SUBPROTOCOL if use_msgpack else None
+    )
     try:
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            if use_msgpack:
+                message = responses.msgpack_loads(await websocket.receive_bytes())
+            else:
+                message = responses.loads(await websocket.receive_text())
             response = {
                 "type": "echo",
                 "data": message,
                 "protocol_version": PROTOCOL_VERSION
             }
-            await websocket.send_json(response)
+            if use_msgpack:
+                await websocket.send_bytes(responses.msgpack_dumps(response))
+            else:
+                await websocket.send_text(responses.dumps(response))
+    except WebSocketDisconnect:
+        pass
+
+
+# === Dashboard events ===
+
+# Connected /ws/events clients (the dashboard listens here instead of
+# polling), each mapped to the topics waiting to be pushed to it. A single
+# writer task per client drains those topics, so a burst of changes goes
+# out as one frame per topic carrying the latest snapshot.
+_event_subscribers: Dict[WebSocket, Dict[str, None]] = {}
+_event_writers: Dict[WebSocket, asyncio.Task] = {}
+# Encoded snapshot per topic, shared by all writers until the topic changes
+_event_messages: Dict[str, str] = {}
+EVENTS_LOG_LIMIT: int = 10
+
+_EVENT_SNAPSHOTS = {
+    "status": _status_snapshot,
+    "approvals": _pending_snapshot,
+    "logs": lambda: _logs_snapshot(EVENTS_LOG_LIMIT),
+}
+
+
+def _event_message(topic: str) -> str:
+    message = _event_messages.get(topic)
+    if message is None:
+        message = responses.dumps({"type": topic, **_EVENT_SNAPSHOTS[topic]()})
+        _event_messages[topic] = message
+    return message
+
+
+async def _drain_events(websocket: WebSocket) -> None:
+    try:
+        pending = _event_subscribers.get(websocket)
+        while pending:
+            topic = next(iter(pending))
+            del pending[topic]
+            await websocket.send_text(_event_message(topic))
+    except Exception:
+        _event_subscribers.pop(websocket, None)
+    finally:
+        # No await between the empty check and here, so a publish that
+        # lands after this starts a new writer instead of being dropped
+        _event_writers.pop(websocket, None)
+
+
+def _queue_events(websocket: WebSocket, topics: Iterable[str]) -> None:
+    pending = _event_subscribers.get(websocket)
+    if pending is None:
+        return
+    pending.update(dict.fromkeys(topics))
+    if websocket not in _event_writers:
+        _event_writers[websocket] = asyncio.get_running_loop().create_task(
+            _drain_events(websocket)
+        )
+
+
+def _publish_events(*topics: str) -> None:
+    """Queue fresh snapshots of topics for subscribers without awaiting them."""
+    for topic in topics:
+        _event_messages.pop(topic, None)
+    for websocket in list(_event_subscribers):
+        _queue_events(websocket, topics)
+
+
+@app.websocket("/ws/events")
+async def events_endpoint(websocket: WebSocket):
+    """Push status/approvals/logs snapshots whenever they change.
+
+    Auth follows the HTTP API: a token is required only when
+    SYNAPSE_API_KEY is configured.
+    """
+    expected_token = os.getenv("SYNAPSE_API_KEY")
+    if expected_token is not None and websocket.query_params.get("token") != expected_token:
+        await websocket.close(code=1008, reason="Unauthorized: Invalid or missing token")
+        return
+
+    await websocket.accept()
+    _event_subscribers[websocket] = {}
+    # Snapshots on connect are encoded fresh, then go through the writer so
+    # sends on this socket never overlap
+    _event_messages.clear()
+    _queue_events(websocket, _EVENT_SNAPSHOTS)
+    try:
+        while True:
+            # Client messages are ignored; reading detects disconnects
+            await websocket.receive_text()
     except WebSocketDisconnect:
         pass
+    finally:
+        _event_subscribers.pop(websocket, None)
+        writer = _event_writers.pop(websocket, None)
+        if writer is not None:
+            writer.cancel()
 
 
 # === Dashboard HTML ===
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    """Serve dashboard HTML."""
-    return HTMLResponse(content=DASHBOARD_HTML)
+async def dashboard(request: Request):
+    """Serve dashboard HTML (pre-encoded; 304 when the client's ETag matches)."""
+    return _serve_page(request, _DASHBOARD_PAGE)
+
+
+# (body, headers) for the plain and gzip-encoded variants of a static page
+PageVariants = Tuple[Tuple[bytes, Dict[str, str]], Tuple[bytes, Dict[str, str]]]
+
+
+def _page_variants(raw: bytes) -> PageVariants:
+    """Encode a static page once, deriving both variants and their ETags."""
+    digest = content_hash(raw)[:16]
+    headers = {
+        "ETag": f'"{digest}"',
+        "Cache-Control": "public, max-age=300",
+        "Vary": "Accept-Encoding",
+    }
+    # GZipMiddleware passes responses with Content-Encoding through untouched.
+    # mtime=0 keeps the bytes (and ETag) stable across restarts.
+    gzipped = gzip.compress(raw, compresslevel=9, mtime=0)
+    gzip_headers = {**headers, "ETag": f'"{digest}-gzip"', "Content-Encoding": "gzip"}
+    return (raw, headers), (gzipped, gzip_headers)
+
+
+def _serve_page(request: Request, page: PageVariants) -> Response:
+    plain, gzipped = page
+    if _accepts_gzip(request.headers.get("accept-encoding")):
+        body, headers = gzipped
+    else:
+        body, headers = plain
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=body,
+        media_type="text/html; charset=utf-8",
+        headers=headers
+    )
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
 
 
 DASHBOARD_HTML = """
@@ -413,14 +693,44 @@ DASHBOARD_HTML = """
     <script>
         const API_BASE = '/api/v1';
         
+        function renderStatus(data) {
+            document.getElementById('status').textContent = data.status;
+            document.getElementById('agents-count').textContent = data.agents_count;
+            document.getElementById('pending-count').textContent = data.pending_approvals;
+            document.getElementById('tasks-count').textContent = data.tasks_completed;
+        }
+        
+        function renderApprovals(data) {
+            const list = document.getElementById('approvals-list');
+            if (data.approvals.length === 0) {
+                list.innerHTML = '<p style="color: #888;">No pending approvals</p>';
+                return;
+            }
+            list.innerHTML = data.approvals.map(a => `
+                <div class="approval-item risk-${a.risk_level >= 4 ? 'high' : a.risk_level >= 2 ? 'medium' : 'low'}">
+                    <strong>${a.action}</strong><br>
+                    <small>Risk Level: ${a.risk_level}</small><br>
+                    <button class="btn btn-success" onclick="approve('${a.id}')">✓ Approve</button>
+                    <button class="btn btn-danger" onclick="reject('${a.id}')">✗ Reject</button>
+                </div>
+            `).join('');
+        }
+        
+        function renderLogs(data) {
+            const list = document.getElementById('logs-list');
+            if (data.logs.length === 0) {
+                list.innerHTML = '<p style="color: #888;">No logs yet</p>';
+                return;
+            }
+            list.innerHTML = data.logs.map(l => `
+                <div class="log-entry">${l.timestamp || 'N/A'} - ${l.message || JSON.stringify(l)}</div>
+            `).join('');
+        }
+        
         async function fetchStatus() {
             try {
                 const res = await fetch(`${API_BASE}/status`);
-                const data = await res.json();
-                document.getElementById('status').textContent = data.status;
-                document.getElementById('agents-count').textContent = data.agents_count;
-                document.getElementById('pending-count').textContent = data.pending_approvals;
-                document.getElementById('tasks-count').textContent = data.tasks_completed;
+                renderStatus(await res.json());
             } catch (e) {
                 document.getElementById('status').textContent = 'Error';
             }
@@ -429,20 +739,7 @@ DASHBOARD_HTML = """
         async function fetchApprovals() {
             try {
                 const res = await fetch(`${API_BASE}/approvals/pending`);
-                const data = await res.json();
-                const list = document.getElementById('approvals-list');
-                if (data.approvals.length === 0) {
-                    list.innerHTML = '<p style="color: #888;">No pending approvals</p>';
-                    return;
-                }
-                list.innerHTML = data.approvals.map(a => `
-                    <div class="approval-item risk-${a.risk_level >= 4 ? 'high' : a.risk_level >= 2 ? 'medium' : 'low'}">
-                        <strong>${a.action}</strong><br>
-                        <small>Risk Level: ${a.risk_level}</small><br>
-                        <button class="btn btn-success" onclick="approve('${a.id}')">✓ Approve</button>
-                        <button class="btn btn-danger" onclick="reject('${a.id}')">✗ Reject</button>
-                    </div>
-                `).join('');
+                renderApprovals(await res.json());
             } catch (e) {
                 document.getElementById('approvals-list').innerHTML = '<p style="color: #ff4444;">Error loading approvals</p>';
             }
@@ -451,15 +748,7 @@ DASHBOARD_HTML = """
         async function fetchLogs() {
             try {
                 const res = await fetch(`${API_BASE}/logs?limit=10`);
-                const data = await res.json();
-                const list = document.getElementById('logs-list');
-                if (data.logs.length === 0) {
-                    list.innerHTML = '<p style="color: #888;">No logs yet</p>';
-                    return;
-                }
-                list.innerHTML = data.logs.map(l => `
-                    <div class="log-entry">${l.timestamp || 'N/A'} - ${l.message || JSON.stringify(l)}</div>
-                `).join('');
+                renderLogs(await res.json());
             } catch (e) {
                 document.getElementById('logs-list').innerHTML = '<p style="color: #ff4444;">Error loading logs</p>';
             }
@@ -478,7 +767,7 @@ DASHBOARD_HTML = """
                 const data = await res.json();
                 document.getElementById('task-result').innerHTML = 
                     `<div style="color: #00ff88;">✓ Task created: ${data.id}</div>`;
-                fetchStatus();
+                if (!eventsLive) fetchStatus();
             } catch (e) {
                 document.getElementById('task-result').innerHTML = 
                     `<div style="color: #ff4444;">Error: ${e.message}</div>`;
@@ -488,8 +777,7 @@ DASHBOARD_HTML = """
         async function approve(id) {
             try {
                 await fetch(`${API_BASE}/approvals/${id}/approve`, {method: 'POST'});
-                fetchApprovals();
-                fetchStatus();
+                if (!eventsLive) { fetchApprovals(); fetchStatus(); }
             } catch (e) {
                 alert('Error approving: ' + e.message);
             }
@@ -498,60 +786,99 @@ DASHBOARD_HTML = """
         async function reject(id) {
             try {
                 await fetch(`${API_BASE}/approvals/${id}/reject`, {method: 'POST'});
-                fetchApprovals();
-                fetchStatus();
+                if (!eventsLive) { fetchApprovals(); fetchStatus(); }
             } catch (e) {
                 alert('Error rejecting: ' + e.message);
             }
         }
         
-        // Initial load
-        fetchStatus();
-        fetchApprovals();
-        fetchLogs();
-        
-        // Auto-refresh every 5 seconds
-        setInterval(() => {
+        function refreshAll() {
             fetchStatus();
             fetchApprovals();
             fetchLogs();
-        }, 5000);
+        }
+        
+        // Live updates are pushed over /ws/events (a snapshot on connect,
+        // then on every change); poll every 5 seconds only while it is down.
+        const renderers = {status: renderStatus, approvals: renderApprovals, logs: renderLogs};
+        let eventsLive = false;
+        let pollTimer = null;
+        
+        function startPolling() {
+            if (pollTimer === null) pollTimer = setInterval(refreshAll, 5000);
+        }
+        
+        function stopPolling() {
+            if (pollTimer !== null) clearInterval(pollTimer);
+            pollTimer = null;
+        }
+        
+        function connectEvents() {
+            const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+            const ws = new WebSocket(`${scheme}://${location.host}/ws/events`);
+            ws.onopen = () => { eventsLive = true; stopPolling(); };
+            ws.onmessage = (event) => {
+                const data = JSON.parse(event.data);
+                const render = renderers[data.type];
+                if (render) render(data);
+            };
+            ws.onclose = () => {
+                eventsLive = false;
+                startPolling();
+                setTimeout(connectEvents, 5000);
+            };
+        }
+        
+        refreshAll();
+        connectEvents();
     </script>
 </body>
 </html>
 """
 
+# The dashboard is static: encode it and derive its ETags once at import
+_DASHBOARD_PAGE = _page_variants(DASHBOARD_HTML.encode("utf-8"))
+
 
 # === Static HTML Pages ===
 
+TEMPLATES_DIR = Path(__file__).parent.parent / "ui" / "web" / "templates"
+TEMPLATE_PAGES = ("providers.html", "agents.html", "settings.html")
+
+
+@lru_cache(maxsize=None)
+def _load_template(name: str) -> Optional[PageVariants]:
+    """Read and encode a template once; a missing file is cached as None."""
+    try:
+        raw = (TEMPLATES_DIR / name).read_bytes()
+    except FileNotFoundError:
+        return None
+    return _page_variants(raw)
+
+
+def _template_page(request: Request, name: str, title: str) -> Response:
+    page = _load_template(name)
+    if page is None:
+        return HTMLResponse(content=f"<h1>{title} page not found</h1>", status_code=404)
+    return _serve_page(request, page)
+
+
 @app.get("/providers.html", response_class=HTMLResponse)
-async def providers_page():
+async def providers_page(request: Request):
     """Serve providers page."""
-    from pathlib import Path
-    html_path = Path(__file__).parent.parent / "ui" / "web" / "templates" / "providers.html"
-    if html_path.exists():
-        return HTMLResponse(content=html_path.read_text())
-    return HTMLResponse(content="<h1>Providers page not found</h1>", status_code=404)
+    return _template_page(request, "providers.html", "Providers")
 
 
 @app.get("/agents.html", response_class=HTMLResponse)
-async def agents_page():
+async def agents_page(request: Request):
     """Serve agents page."""
-    from pathlib import Path
-    html_path = Path(__file__).parent.parent / "ui" / "web" / "templates" / "agents.html"
-    if html_path.exists():
-        return HTMLResponse(content=html_path.read_text())
-    return HTMLResponse(content="<h1>Agents page not found</h1>", status_code=404)
+    return _template_page(request, "agents.html", "Agents")
 
 
 @app.get("/settings.html", response_class=HTMLResponse)
-async def settings_page():
+async def settings_page(request: Request):
     """Serve settings page."""
-    from pathlib import Path
-    html_path = Path(__file__).parent.parent / "ui" / "web" / "templates" / "settings.html"
-    if html_path.exists():
-        return HTMLResponse(content=html_path.read_text())
-    return HTMLResponse(content="<h1>Settings page not found</h1>", status_code=404)
+    return _template_page(request, "settings.html", "Settings")
 
 
 # === Factory Function for Testing ===
@@ -577,7 +904,9 @@ def create_app(orchestrator=None, checkpoint_manager=None, rollback_manager=None
     app = FastAPI(
         title="Synapse API",
         version="3.4.0",
-        description="Synapse Agent Platform API"
+        description="Synapse Agent Platform API",
+        lifespan=_lifespan,
+        default_response_class=OrjsonResponse,
     )
     
     # Store injected dependencies in app state
@@ -585,39 +914,57 @@ def create_app(orchestrator=None, checkpoint_manager=None, rollback_manager=None
     app.state.checkpoint_manager = checkpoint_manager
     app.state.rollback_manager = rollback_manager
     app.state.protocol_version = PROTOCOL_VERSION
+    app.middleware("http")(make_trace_id_middleware())
     
+    # Bodies that never change are encoded once per app; handlers return
+    # a fresh Response over the shared bytes.
+    def static_body(content: Dict[str, Any]):
+        body = responses.dumps_bytes(content)
+        return lambda: Response(content=body, media_type="application/json")
+
+    health_response = static_body({
+        "status": "healthy",
+        "version": "3.4.0",
+        "protocol_version": PROTOCOL_VERSION
+    })
+    metrics_response = static_body({"metrics": {}, "protocol_version": PROTOCOL_VERSION})
+    agents_response = static_body({"agents": [], "protocol_version": PROTOCOL_VERSION})
+    cluster_response = static_body({
+        "status": "operational",
+        "nodes": 1,
+        "protocol_version": PROTOCOL_VERSION
+    })
+    no_checkpoint_response = static_body(
+        {"status": "no_checkpoint_manager", "protocol_version": PROTOCOL_VERSION}
+    )
+    rolled_back_response = static_body({"status": "rolled_back", "protocol_version": PROTOCOL_VERSION})
+    no_rollback_response = static_body(
+        {"status": "no_rollback_manager", "protocol_version": PROTOCOL_VERSION}
+    )
+
     # Add health endpoint
     @app.get("/health")
     async def health():
-        return {
-            "status": "healthy",
-            "version": "3.4.0",
-            "protocol_version": PROTOCOL_VERSION
-        }
+        return health_response()
     
     # Add metrics endpoint
     @app.get("/metrics")
     async def metrics():
-        return {
-            "metrics": {},
-            "protocol_version": PROTOCOL_VERSION
-        }
+        return metrics_response()
     
     # Add task endpoint
     @app.post("/task")
     async def execute_task(request: dict):
+        trace_id = trace_id_var.get()
         if orchestrator:
             result = await orchestrator.handle(request)
-            return {"status": "completed", "result": result, "protocol_version": PROTOCOL_VERSION}
-        return {"status": "no_orchestrator", "protocol_version": PROTOCOL_VERSION}
+            return {"status": "completed", "result": result, "trace_id": trace_id, "protocol_version": PROTOCOL_VERSION}
+        return {"status": "no_orchestrator", "trace_id": trace_id, "protocol_version": PROTOCOL_VERSION}
     
     # Add agents endpoint
     @app.get("/agents")
     async def list_agents():
-        return {
-            "agents": [],
-            "protocol_version": PROTOCOL_VERSION
-        }
+        return agents_response()
     
     # Add checkpoint endpoint
     @app.post("/checkpoint")
@@ -628,23 +975,19 @@ def create_app(orchestrator=None, checkpoint_manager=None, rollback_manager=None
                 session_id=request.get("session_id", "default")
             )
             return {"checkpoint_id": cp_id.id if hasattr(cp_id, 'id') else str(cp_id), "protocol_version": PROTOCOL_VERSION}
-        return {"status": "no_checkpoint_manager", "protocol_version": PROTOCOL_VERSION}
+        return no_checkpoint_response()
     
     # Add rollback endpoint
     @app.post("/rollback")
     async def execute_rollback(request: dict):
         if rollback_manager:
             rollback_manager.rollback_to(request.get("checkpoint_id"))
-            return {"status": "rolled_back", "protocol_version": PROTOCOL_VERSION}
-        return {"status": "no_rollback_manager", "protocol_version": PROTOCOL_VERSION}
+            return rolled_back_response()
+        return no_rollback_response()
     
     # Add cluster status endpoint
     @app.get("/cluster/status")
     async def cluster_status():
-        return {
-            "status": "operational",
-            "nodes": 1,
-            "protocol_version": PROTOCOL_VERSION
-        }
+        return cluster_response()
     
     return app
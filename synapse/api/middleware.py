@@ -9,16 +9,29 @@ with all Starlette/FastAPI versions (avoids BaseHTTPMiddleware issues).
 
 PROTOCOL_VERSION: str = "1.0"
 from fastapi import Request
-from fastapi.responses import JSONResponse
-from typing import Callable, Dict, List
+from fastapi.responses import JSONResponse, Response
+from typing import Callable, Dict, List, Optional, Tuple
+from contextvars import ContextVar
 from datetime import datetime, timezone
 import logging
 import time
-import uuid
-from collections import defaultdict
+import secrets
+from collections import OrderedDict, defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Per-request trace ID, set once by the trace-id middleware so handlers and
+# downstream audit/metrics code can read it without re-parsing headers.
+trace_id_var: ContextVar[Optional[str]] = ContextVar("synapse_trace_id", default=None)
+
+# Short-lived GET response cache, least recently used first:
+# "path?query|accept" -> (expires_at, status, raw headers sans content-length, body)
+RESPONSE_CACHE_MAX: int = 256
+_response_cache: "OrderedDict[str, Tuple[float, int, List[Tuple[bytes, bytes]], bytes]]" = OrderedDict()
+# Bumped on every invalidation; a GET only stores its body if no write
+# cleared the cache while it was being produced
+_response_cache_generation: int = 0
+
 _rate_limit_counts: Dict[str, List[float]] = defaultdict(list)
 _rate_limit_last_cleanup: float = time.time()
 _CLEANUP_INTERVAL = 300
@@ -36,13 +49,27 @@ def _cleanup_rate_limits() -> None:
             del _rate_limit_counts[ip]
 
 
+def make_trace_id_middleware() -> Callable:
+    async def middleware(request: Request, call_next: Callable):
+        trace_id = request.headers.get("X-Trace-ID") or secrets.token_hex(16)
+        token = trace_id_var.set(trace_id)
+        try:
+            response = await call_next(request)
+        finally:
+            trace_id_var.reset(token)
+        response.headers["X-Trace-ID"] = trace_id
+        return response
+
+    return middleware
+
+
 def make_request_logging_middleware() -> Callable:
     skip_paths = ["/health", "/metrics", "/docs", "/openapi.json"]
 
     async def middleware(request: Request, call_next: Callable):
         if any(request.url.path.startswith(p) for p in skip_paths):
             return await call_next(request)
-        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        correlation_id = request.headers.get("X-Correlation-ID") or secrets.token_hex(16)
         start_time = time.time()
         logger.info(f"REQUEST {request.method} {request.url.path}")
         request.state.correlation_id = correlation_id
@@ -96,6 +123,79 @@ def make_rate_limit_middleware(requests_per_minute: int = 60) -> Callable:
     return middleware
 
 
+def invalidate_response_cache() -> None:
+    """Drop all cached GET responses."""
+    global _response_cache_generation
+    _response_cache_generation += 1
+    _response_cache.clear()
+
+
+def _cached_response(status_code: int, raw_headers: List[Tuple[bytes, bytes]], body: bytes) -> Response:
+    response = Response(content=body, status_code=status_code)
+    response.raw_headers = [*raw_headers, (b"content-length", str(len(body)).encode())]
+    return response
+
+
+def _store_response(key: str, entry: Tuple[float, int, List[Tuple[bytes, bytes]], bytes]) -> None:
+    if key not in _response_cache and len(_response_cache) >= RESPONSE_CACHE_MAX:
+        now = time.monotonic()
+        for stale in [k for k, cached in _response_cache.items() if cached[0] <= now]:
+            del _response_cache[stale]
+        while len(_response_cache) >= RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+    _response_cache[key] = entry
+    _response_cache.move_to_end(key)
+
+
+def make_response_cache_middleware(ttls: Dict[str, float]) -> Callable:
+    """Cache successful GET responses for the paths in ``ttls`` (seconds).
+
+    The cached data is process-local, so any non-GET request clears the
+    cache once handled; readers never see a response older than the last
+    write.  At most RESPONSE_CACHE_MAX entries are kept (least recently
+    used evicted first).  Streamed responses (no Content-Length) pass
+    through uncached.  Install it before auth/rate-limit middleware so
+    those still run on cache hits.
+    """
+    async def middleware(request: Request, call_next: Callable):
+        if request.method in ("HEAD", "OPTIONS"):
+            return await call_next(request)
+        if request.method != "GET":
+            try:
+                return await call_next(request)
+            finally:
+                invalidate_response_cache()
+        ttl = ttls.get(request.url.path)
+        if ttl is None:
+            return await call_next(request)
+
+        # Accept is part of the key: some endpoints negotiate their format
+        key = f"{request.url.path}?{request.url.query}|{request.headers.get('accept', '')}"
+        now = time.monotonic()
+        cached = _response_cache.get(key)
+        if cached is not None:
+            expires_at, status_code, raw_headers, body = cached
+            if expires_at > now:
+                _response_cache.move_to_end(key)
+                return _cached_response(status_code, raw_headers, body)
+            del _response_cache[key]
+
+        generation = _response_cache_generation
+        response = await call_next(request)
+        # call_next hands every response back as a stream; only bodies built
+        # whole carry a Content-Length, so streamed ones (NDJSON, chunked
+        # lists) are passed on without being buffered or cached
+        if response.status_code != 200 or "content-length" not in response.headers:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        raw_headers = [(k, v) for k, v in response.raw_headers if k != b"content-length"]
+        if generation == _response_cache_generation:
+            _store_response(key, (now + ttl, response.status_code, raw_headers, body))
+        return _cached_response(response.status_code, raw_headers, body)
+
+    return middleware
+
+
 # Compatibility shims (imported by tests referencing class names)
 class RequestLoggingMiddleware:
     def __init__(self, app, **kwargs):
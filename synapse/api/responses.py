@@ -0,0 +1,74 @@
+"""Response classes for Synapse API.
+
+Protocol Version: 1.0
+Specification: 3.1
+"""
+
+PROTOCOL_VERSION: str = "1.0"
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# WebSocket subprotocol for MessagePack framing; offered only with msgspec
+MSGPACK_SUBPROTOCOL: str = "synapse.msgpack.v1"
+MSGPACK_AVAILABLE: bool = msgspec is not None
+
+_msgpack_encoder = msgspec.msgpack.Encoder() if msgspec else None
+_msgpack_decoder = msgspec.msgpack.Decoder() if msgspec else None
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson (falls back to stdlib json).
+
+    Defined locally rather than using fastapi's ORJSONResponse, which newer
+    FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            # stdlib json cannot encode the dataclass records orjson handles
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON str or bytes payload."""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def dumps(content: Any) -> str:
+    """Serialize content to a compact JSON str (for WebSocket text frames)."""
+    if orjson is None:
+        return json.dumps(content, separators=(",", ":"), ensure_ascii=False)
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def dumps_bytes(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON bytes."""
+    if orjson is None:
+        return dumps(content).encode()
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Decode a MessagePack payload (requires msgspec)."""
+    return _msgpack_decoder.decode(data)
+
+
+def msgpack_dumps(content: Any) -> bytes:
+    """Encode content as MessagePack (requires msgspec)."""
+    return _msgpack_encoder.encode(content)
@@ -3,11 +3,12 @@
 Protocol Version: 1.0
 """
 from fastapi import APIRouter
+from synapse.api.responses import OrjsonResponse
 from synapse.api.routes import providers, agents, settings
 
 PROTOCOL_VERSION: str = "1.0"
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=OrjsonResponse)
 
 # Include all route modules
 api_router.include_router(providers.router, prefix="/providers", tags=["providers"])
@@ -4,51 +4,58 @@ Protocol Version: 1.0
 """
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timezone
+from typing import Dict, Optional, Any
+from collections import deque
+from dataclasses import dataclass
+
+from synapse.api.responses import OrjsonResponse
+from synapse.api.storage import tail
+from synapse.core.timestamps import utc_isoformat
 
 PROTOCOL_VERSION: str = "1.0"
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
+
+# === Records ===
+
+@dataclass(slots=True)
+class AgentRecord:
+    """Stored agent row; orjson and FastAPI serialize it as a JSON object."""
+
+    id: str
+    name: str
+    status: str
+    type: str
+    created_at: str
+    started_at: Optional[str] = None
+    stopped_at: Optional[str] = None
+    protocol_version: str = PROTOCOL_VERSION
+
+
+@dataclass(slots=True)
+class AgentConfig:
+    """Per-agent runtime configuration."""
+
+    max_retries: int = 3
+    timeout: int = 30
+
 
 # In-memory storage
-agents_db: Dict[str, Dict] = {
-    "planner": {
-        "id": "planner",
-        "name": "Planner Agent",
-        "status": "idle",
-        "type": "planner",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "protocol_version": PROTOCOL_VERSION
-    },
-    "critic": {
-        "id": "critic",
-        "name": "Critic Agent",
-        "status": "idle",
-        "type": "critic",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "protocol_version": PROTOCOL_VERSION
-    },
-    "developer": {
-        "id": "developer",
-        "name": "Developer Agent",
-        "status": "idle",
-        "type": "developer",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "protocol_version": PROTOCOL_VERSION
-    },
-    "guardian": {
-        "id": "guardian",
-        "name": "Guardian Agent",
-        "status": "idle",
-        "type": "guardian",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "protocol_version": PROTOCOL_VERSION
-    }
+agents_db: Dict[str, AgentRecord] = {
+    agent_id: AgentRecord(
+        id=agent_id,
+        name=f"{agent_id.capitalize()} Agent",
+        status="idle",
+        type=agent_id,
+        created_at=utc_isoformat(),
+    )
+    for agent_id in ("planner", "critic", "developer", "guardian")
 }
 
-agents_logs: Dict[str, List[Dict]] = {k: [] for k in agents_db}
-agents_config: Dict[str, Dict] = {k: {"max_retries": 3, "timeout": 30} for k in agents_db}
+# Per-agent log buffers; the oldest entries are evicted past AGENT_LOGS_MAX
+AGENT_LOGS_MAX: int = 10_000
+agents_logs: Dict[str, "deque[Dict]"] = {k: deque(maxlen=AGENT_LOGS_MAX) for k in agents_db}
+agents_config: Dict[str, AgentConfig] = {k: AgentConfig() for k in agents_db}
 
 
 # === Models ===
@@ -63,10 +70,11 @@ class AgentConfigUpdate(BaseModel):
 @router.get("")
 async def list_agents():
     """List all agents."""
-    return {
+    # Records are JSON-native; returning a Response skips jsonable_encoder
+    return OrjsonResponse({
         "agents": list(agents_db.values()),
         "protocol_version": PROTOCOL_VERSION
-    }
+    })
 
 
 @router.get("/{agent_id}")
@@ -83,7 +91,7 @@ async def get_agent_status(agent_id: str):
     if agent_id not in agents_db:
         raise HTTPException(status_code=404, detail="Agent not found")
     return {
-        "status": agents_db[agent_id]["status"],
+        "status": agents_db[agent_id].status,
         "protocol_version": PROTOCOL_VERSION
     }
 
@@ -93,9 +101,10 @@ async def start_agent(agent_id: str):
     """Start an agent."""
     if agent_id not in agents_db:
         raise HTTPException(status_code=404, detail="Agent not found")
-    agents_db[agent_id]["status"] = "running"
-    agents_db[agent_id]["started_at"] = datetime.now(timezone.utc).isoformat()
-    return agents_db[agent_id]
+    agent = agents_db[agent_id]
+    agent.status = "running"
+    agent.started_at = utc_isoformat()
+    return agent
 
 
 @router.post("/{agent_id}/stop")
@@ -103,9 +112,10 @@ async def stop_agent(agent_id: str):
     """Stop an agent."""
     if agent_id not in agents_db:
         raise HTTPException(status_code=404, detail="Agent not found")
-    agents_db[agent_id]["status"] = "stopped"
-    agents_db[agent_id]["stopped_at"] = datetime.now(timezone.utc).isoformat()
-    return agents_db[agent_id]
+    agent = agents_db[agent_id]
+    agent.status = "stopped"
+    agent.stopped_at = utc_isoformat()
+    return agent
 
 
 @router.get("/{agent_id}/logs")
@@ -113,11 +123,11 @@ async def get_agent_logs(agent_id: str, limit: int = 100):
     """Get agent logs."""
     if agent_id not in agents_db:
         raise HTTPException(status_code=404, detail="Agent not found")
-    logs = agents_logs.get(agent_id, [])
-    return {
-        "logs": logs[-limit:],
+    logs = agents_logs.get(agent_id, deque())
+    return OrjsonResponse({
+        "logs": tail(logs, limit),
         "protocol_version": PROTOCOL_VERSION
-    }
+    })
 
 
 @router.get("/{agent_id}/config")
@@ -126,7 +136,7 @@ async def get_agent_config(agent_id: str):
     if agent_id not in agents_db:
         raise HTTPException(status_code=404, detail="Agent not found")
     return {
-        "config": agents_config.get(agent_id, {}),
+        "config": agents_config.setdefault(agent_id, AgentConfig()),
         "protocol_version": PROTOCOL_VERSION
     }
 
@@ -136,10 +146,9 @@ async def update_agent_config(agent_id: str, data: AgentConfigUpdate):
     """Update agent configuration."""
     if agent_id not in agents_db:
         raise HTTPException(status_code=404, detail="Agent not found")
-    config = agents_config.get(agent_id, {})
-    update_data = data.model_dump(exclude_unset=True)
-    config.update(update_data)
-    agents_config[agent_id] = config
+    config = agents_config.setdefault(agent_id, AgentConfig())
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(config, field, value)
     return {
         "config": config,
         "protocol_version": PROTOCOL_VERSION
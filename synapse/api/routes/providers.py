@@ -5,14 +5,34 @@ Protocol Version: 1.0
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+
+from synapse.api.responses import OrjsonResponse
+from synapse.core.timestamps import utc_isoformat
 
 PROTOCOL_VERSION: str = "1.0"
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
+
+# === Records ===
+
+@dataclass(slots=True)
+class ProviderRecord:
+    """Stored provider row; orjson and FastAPI serialize it as a JSON object."""
+
+    id: str
+    name: str
+    api_key: str
+    models: List[str] = field(default_factory=list)
+    priority: int = 3
+    base_url: Optional[str] = None
+    created_at: str = ""
+    updated_at: Optional[str] = None
+    protocol_version: str = PROTOCOL_VERSION
+
 
 # In-memory storage (will be replaced with database)
-providers_db: Dict[str, Dict] = {}
+providers_db: Dict[str, ProviderRecord] = {}
 
 
 # === Models ===
@@ -45,34 +65,33 @@ class ProviderService:
     def __init__(self):
         self.providers = providers_db
     
-    def list_providers(self) -> List[Dict]:
+    def list_providers(self) -> List[ProviderRecord]:
         return list(self.providers.values())
     
-    def get_provider(self, provider_id: str) -> Optional[Dict]:
+    def get_provider(self, provider_id: str) -> Optional[ProviderRecord]:
         return self.providers.get(provider_id)
     
-    def create_provider(self, data: ProviderCreate) -> Dict:
+    def create_provider(self, data: ProviderCreate) -> ProviderRecord:
         provider_id = data.name.lower().replace(" ", "_")
-        provider = {
-            "id": provider_id,
-            "name": data.name,
-            "api_key": "***",  # Never expose API key
-            "models": data.models,
-            "priority": data.priority,
-            "base_url": data.base_url,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "protocol_version": PROTOCOL_VERSION
-        }
+        provider = ProviderRecord(
+            id=provider_id,
+            name=data.name,
+            api_key="***",  # Never expose API key
+            models=data.models,
+            priority=data.priority,
+            base_url=data.base_url,
+            created_at=utc_isoformat(),
+        )
         self.providers[provider_id] = provider
         return provider
     
-    def update_provider(self, provider_id: str, data: ProviderUpdate) -> Optional[Dict]:
-        if provider_id not in self.providers:
+    def update_provider(self, provider_id: str, data: ProviderUpdate) -> Optional[ProviderRecord]:
+        provider = self.providers.get(provider_id)
+        if provider is None:
             return None
-        provider = self.providers[provider_id]
-        update_data = data.model_dump(exclude_unset=True)
-        provider.update(update_data)
-        provider["updated_at"] = datetime.now(timezone.utc).isoformat()
+        for name, value in data.model_dump(exclude_unset=True).items():
+            setattr(provider, name, value)
+        provider.updated_at = utc_isoformat()
         return provider
     
     def delete_provider(self, provider_id: str) -> bool:
@@ -92,14 +111,15 @@ class ProviderService:
             return []
         return [
             {"id": m, "name": m, "context_window": 128000}
-            for m in self.providers[provider_id].get("models", [])
+            for m in self.providers[provider_id].models
         ]
     
-    def set_priority(self, provider_id: str, priority: int) -> Optional[Dict]:
-        if provider_id not in self.providers:
+    def set_priority(self, provider_id: str, priority: int) -> Optional[ProviderRecord]:
+        provider = self.providers.get(provider_id)
+        if provider is None:
             return None
-        self.providers[provider_id]["priority"] = priority
-        return self.providers[provider_id]
+        provider.priority = priority
+        return provider
 
 
 provider_service = ProviderService()
@@ -111,10 +131,11 @@ provider_service = ProviderService()
 async def list_providers():
     """List all LLM providers."""
     providers = provider_service.list_providers()
-    return {
+    # Records are JSON-native; returning a Response skips jsonable_encoder
+    return OrjsonResponse({
         "providers": providers,
         "protocol_version": PROTOCOL_VERSION
-    }
+    })
 
 
 @router.get("/{provider_id}")
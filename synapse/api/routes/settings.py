@@ -2,15 +2,18 @@
 
 Protocol Version: 1.0
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
-from typing import Dict, Optional, Any, List
-from datetime import datetime, timezone
+from typing import Dict, Optional, Any
 import os
+import secrets
+
+from synapse.api.responses import OrjsonResponse, dumps_bytes
+from synapse.core.timestamps import utc_isoformat
 
 PROTOCOL_VERSION: str = "1.0"
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 # In-memory storage
 system_settings: Dict[str, Any] = {
@@ -38,7 +41,11 @@ connector_settings: Dict[str, Any] = {
 }
 
 env_vars: Dict[str, str] = {}
-backups: List[Dict] = []
+# Backups keyed by id (stored under both 'id' and 'backup_id')
+backups: Dict[str, Dict] = {}
+
+# Encoded GET bodies per settings section; PUT handlers drop their entry
+_settings_bodies: Dict[str, bytes] = {}
 
 
 # === Models ===
@@ -63,8 +70,12 @@ class EnvVarCreate(BaseModel):
     value: str
 
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _settings_response(section: str, settings: Dict[str, Any]) -> Response:
+    body = _settings_bodies.get(section)
+    if body is None:
+        body = dumps_bytes({"settings": settings, "protocol_version": PROTOCOL_VERSION})
+        _settings_bodies[section] = body
+    return Response(content=body, media_type="application/json")
 
 
 # === System Settings ===
@@ -72,7 +83,7 @@ def _utc_now() -> str:
 @router.get("/system")
 async def get_system_settings():
     """Get system settings."""
-    return {"settings": system_settings, "protocol_version": PROTOCOL_VERSION}
+    return _settings_response("system", system_settings)
 
 
 @router.put("/system")
@@ -80,7 +91,8 @@ async def update_system_settings(data: SystemSettingsUpdate):
     """Update system settings."""
     update_data = data.model_dump(exclude_unset=True)
     system_settings.update(update_data)
-    return {"settings": system_settings, "protocol_version": PROTOCOL_VERSION}
+    _settings_bodies.pop("system", None)
+    return _settings_response("system", system_settings)
 
 
 # === Security Settings ===
@@ -88,7 +100,7 @@ async def update_system_settings(data: SystemSettingsUpdate):
 @router.get("/security")
 async def get_security_settings():
     """Get security settings."""
-    return {"settings": security_settings, "protocol_version": PROTOCOL_VERSION}
+    return _settings_response("security", security_settings)
 
 
 @router.put("/security")
@@ -96,7 +108,8 @@ async def update_security_settings(data: SecuritySettingsUpdate):
     """Update security settings."""
     update_data = data.model_dump(exclude_unset=True)
     security_settings.update(update_data)
-    return {"settings": security_settings, "protocol_version": PROTOCOL_VERSION}
+    _settings_bodies.pop("security", None)
+    return _settings_response("security", security_settings)
 
 
 # === Memory Settings ===
@@ -104,7 +117,7 @@ async def update_security_settings(data: SecuritySettingsUpdate):
 @router.get("/memory")
 async def get_memory_settings():
     """Get memory settings."""
-    return {"settings": memory_settings, "protocol_version": PROTOCOL_VERSION}
+    return _settings_response("memory", memory_settings)
 
 
 # === Connector Settings ===
@@ -112,7 +125,7 @@ async def get_memory_settings():
 @router.get("/connectors")
 async def get_connector_settings():
     """Get connector settings."""
-    return {"settings": connector_settings, "protocol_version": PROTOCOL_VERSION}
+    return _settings_response("connectors", connector_settings)
 
 
 @router.put("/connectors/telegram")
@@ -120,6 +133,7 @@ async def update_telegram_settings(data: TelegramSettingsUpdate):
     """Update Telegram settings."""
     update_data = data.model_dump(exclude_unset=True)
     connector_settings["telegram"].update(update_data)
+    _settings_bodies.pop("connectors", None)
     return {"settings": connector_settings["telegram"], "protocol_version": PROTOCOL_VERSION}
 
 
@@ -153,27 +167,32 @@ async def delete_env_var(key: str):
 @router.post("/backup")
 async def create_backup():
     """Create a backup."""
-    backup_id = f"backup_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+    created_at = utc_isoformat()
+    # backup_YYYYMMDD_HHMMSS_<hex>, taken from the same timestamp; the random
+    # suffix keeps two backups within one second from overwriting each other
+    date, _, clock = created_at[:19].partition("T")
+    stamp = f"{date.replace('-', '')}_{clock.replace(':', '')}"
+    backup_id = f"backup_{stamp}_{secrets.token_hex(4)}"
     backup = {
         "backup_id": backup_id,
         "id": backup_id,  # Both for compatibility
-        "created_at": _utc_now(),
+        "created_at": created_at,
         "protocol_version": PROTOCOL_VERSION
     }
-    backups.append(backup)
+    backups[backup_id] = backup
     return backup
 
 
 @router.get("/backups")
 async def list_backups():
     """List backups."""
-    return {"backups": backups, "protocol_version": PROTOCOL_VERSION}
+    return {"backups": list(backups.values()), "protocol_version": PROTOCOL_VERSION}
 
 
 @router.post("/restore/{backup_id}")
 async def restore_backup(backup_id: str):
     """Restore from backup."""
-    backup = next((b for b in backups if b.get("id") == backup_id or b.get("backup_id") == backup_id), None)
+    backup = backups.get(backup_id)
     if not backup:
         raise HTTPException(status_code=404, detail="Backup not found")
     return {"status": "restored", "backup_id": backup_id, "protocol_version": PROTOCOL_VERSION}
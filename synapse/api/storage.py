@@ -9,9 +9,10 @@ to prevent race conditions in concurrent access scenarios.
 
 PROTOCOL_VERSION: str = "1.0"
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Reversible
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
+from itertools import islice
 
 
 class AsyncSafeDict:
@@ -179,6 +180,14 @@ class AsyncSafeList:
             }
 
 
+def tail(entries: Reversible[Any], limit: int) -> List[Any]:
+    """Last limit entries of a buffer, oldest first (slice semantics otherwise)."""
+    if limit > 0:
+        # Copy only the tail instead of the whole buffer
+        return list(islice(reversed(entries), limit))[::-1]
+    return list(entries)[-limit:]
+
+
 # Global storage instances
 agents_storage = AsyncSafeDict("agents")
 approvals_storage = AsyncSafeList("approvals")
@@ -193,4 +202,5 @@ __all__ = [
     "approvals_storage",
     "logs_storage",
     "tasks_storage",
+    "tail",
 ]
@@ -0,0 +1,34 @@
+"""
+Canonical JSON encoding for hash-addressed data
+"""
+
+PROTOCOL_VERSION: str = "1.0"
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def canonical_json(data: Any) -> bytes:
+    """Serialize data to canonical JSON bytes (sorted keys, no whitespace).
+
+    Uses orjson when installed; the stdlib fallback emits the same bytes for
+    JSON-native data so hashes stay identical across nodes.
+
+    Args:
+        data: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded canonical JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        data, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    ).encode()
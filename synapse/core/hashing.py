@@ -0,0 +1,54 @@
+"""
+Content hashing for hash-addressed identifiers
+
+SHA-256 is the default so identifiers match across nodes. Deployments that
+install the optional ``blake3`` package on every node can switch all
+content-addressed hashing to BLAKE3 with ``SYNAPSE_HASH_ALGO=blake3``.
+"""
+
+PROTOCOL_VERSION: str = "1.0"
+
+import hashlib
+import importlib.util
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGORITHM_ENV: str = "SYNAPSE_HASH_ALGO"
+SUPPORTED_ALGORITHMS = ("sha256", "blake3")
+
+
+def _resolve_algorithm() -> str:
+    """Resolve the configured hash algorithm, falling back to SHA-256"""
+    algorithm = os.environ.get(HASH_ALGORITHM_ENV, "sha256").strip().lower()
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        logger.warning("Unknown %s=%r — using sha256", HASH_ALGORITHM_ENV, algorithm)
+        return "sha256"
+    if algorithm == "blake3" and importlib.util.find_spec("blake3") is None:
+        logger.warning("blake3 not installed — using sha256 for content hashing")
+        return "sha256"
+    return algorithm
+
+
+HASH_ALGORITHM: str = _resolve_algorithm()
+
+if HASH_ALGORITHM == "blake3":
+    from blake3 import blake3 as _new_hasher
+else:
+    _new_hasher = hashlib.sha256
+
+
+def content_hasher(data: bytes = b""):
+    """Create a hasher object (hashlib-compatible API) seeded with data"""
+    return _new_hasher(data)
+
+
+def content_hash(data: bytes) -> str:
+    """Hex digest (64 characters) of data"""
+    return _new_hasher(data).hexdigest()
+
+
+def content_digest(data: bytes) -> bytes:
+    """Raw 32-byte digest of data"""
+    return _new_hasher(data).digest()
@@ -768,7 +768,7 @@ def build_orchestrator(
     """
     import os as _os
     from synapse.llm.provider import LiteLLMProvider
-    from synapse.memory.store import MemoryStore
+    from synapse.memory.store import DEFAULT_DB_PATH, MemoryStore
     from synapse.memory.vector_store import VectorMemoryStore
     from synapse.agents.planner import PlannerAgent
     from synapse.agents.critic import CriticAgent
@@ -785,8 +785,7 @@ def build_orchestrator(
     )
 
     # Memory
-    db = db_path or _os.path.join(_os.path.expanduser("~"), ".synapse", "memory.db")
-    memory = MemoryStore(db_path=db)
+    memory = MemoryStore(db_path=db_path or DEFAULT_DB_PATH)
     vector = VectorMemoryStore(persist_directory=vector_persist_dir)
     memory.vector_store = vector  # attach semantic store
 
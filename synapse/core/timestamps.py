@@ -0,0 +1,39 @@
+"""
+Cached UTC timestamp formatting for hot paths
+"""
+
+PROTOCOL_VERSION: str = "1.0"
+
+from datetime import datetime, UTC
+from typing import Optional, Tuple
+import time
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp.
+# Replaced as a single tuple so concurrent readers never see a torn pair.
+_second_cache: Tuple[int, str] = (-1, "")
+
+
+def utc_isoformat(ns: Optional[int] = None) -> str:
+    """Format a UTC timestamp as ISO-8601 with microseconds and +00:00 offset.
+
+    The date/time prefix is reused while the epoch second is unchanged, so the
+    common case is a single integer division and a short f-string.
+
+    Args:
+        ns: Nanoseconds since the epoch; defaults to ``time.time_ns()``
+
+    Returns:
+        Timestamp string compatible with ``datetime.now(UTC).isoformat()``
+    """
+    global _second_cache
+
+    if ns is None:
+        ns = time.time_ns()
+    second, remainder = divmod(ns, 1_000_000_000)
+
+    cached_second, prefix = _second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _second_cache = (second, prefix)
+
+    return f"{prefix}.{remainder // 1000:06d}+00:00"
@@ -2,6 +2,7 @@ PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
 
 """LLM Provider Layer."""
+from .batching import BatchingLLMClient
 from .provider import LLMRouter
 
-__all__ = ["LLMRouter"]
+__all__ = ["BatchingLLMClient", "LLMRouter"]
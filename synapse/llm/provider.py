@@ -73,6 +73,39 @@ class LiteLLMProvider:
         except Exception as e:
             raise RuntimeError(f"LLM call failed ({self.model}): {e}") from e
 
+    async def generate_batch(self, prompts: List[str], **kwargs) -> List[Any]:
+        """Generate responses for several prompts in one litellm batch call.
+
+        Items are response dicts, or the exception raised for that prompt.
+        """
+        try:
+            import litellm
+        except ImportError:
+            return [await self.generate(p, **kwargs) for p in prompts]
+
+        responses = await asyncio.get_event_loop().run_in_executor(
+            None,
+            lambda: litellm.batch_completion(
+                model=self.model,
+                messages=[[{"role": "user", "content": p}] for p in prompts],
+                api_key=self.api_key or None,
+                api_base=self.api_base or None,
+                **kwargs,
+            ),
+        )
+        results: List[Any] = []
+        for response in responses:
+            if isinstance(response, Exception):
+                results.append(RuntimeError(f"LLM call failed ({self.model}): {response}"))
+                continue
+            results.append({
+                "content": response.choices[0].message.content or "",
+                "model": self.model,
+                "usage": dict(response.usage) if response.usage else {},
+                "protocol_version": PROTOCOL_VERSION,
+            })
+        return results
+
     async def embed(self, text: str) -> List[float]:
         """Generate embeddings via litellm."""
         try:
@@ -149,6 +182,42 @@ class LLMRouter:
             return await self._providers[self._safe_provider_name].generate(prompt, **kwargs)
         raise last_error or RuntimeError("No available provider")
 
+    async def generate_batch(self, prompts: List[str], **kwargs) -> List[Any]:
+        """Batch-generate on the highest-priority active provider.
+
+        Items that fail are retried one at a time through ``generate`` (with
+        its provider fallback chain); items that succeeded are kept.  If the
+        batch call itself fails or times out, its worker thread may still be
+        running, so the batch is not resent and every item carries the error.
+        """
+        try:
+            provider = self.select_provider()
+        except RuntimeError:
+            # Nothing was sent; generate() may still reach the safe provider
+            return await asyncio.gather(
+                *(self.generate(p, **kwargs) for p in prompts),
+                return_exceptions=True,
+            )
+        try:
+            results = list(await asyncio.wait_for(
+                provider.generate_batch(prompts, **kwargs),
+                timeout=self._timeout,
+            ))
+        except asyncio.TimeoutError:
+            return [TimeoutError(f"Provider {provider.name} timed out")] * len(prompts)
+        except Exception as e:
+            return [e] * len(prompts)
+
+        failed = [i for i, result in enumerate(results) if isinstance(result, BaseException)]
+        if failed:
+            retried = await asyncio.gather(
+                *(self.generate(prompts[i], **kwargs) for i in failed),
+                return_exceptions=True,
+            )
+            for i, result in zip(failed, retried):
+                results[i] = result
+        return results
+
     def create_prompt_envelope(self, prompt: str) -> Dict[str, Any]:
         prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
         return {"prompt": prompt, "hash": prompt_hash, "protocol_version": self.protocol_version}
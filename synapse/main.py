@@ -41,6 +41,23 @@ def print_banner():
 """.format(PROTOCOL_VERSION, SPEC_VERSION))
 
 
+def install_event_loop() -> bool:
+    """Use uvloop for the server event loop when it is installed.
+
+    uvicorn only picks uvloop/httptools itself when it owns the loop; here
+    the server runs inside asyncio.run(), so the policy is set up front.
+    httptools is picked up by uvicorn's default ``http="auto"``.
+    Install both with ``pip install synapse-agent[perf]``.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+
 async def run_web_ui(host: str = "0.0.0.0", port: int = 8080):  # nosec B104
     """Run the Web UI server."""
     import uvicorn
@@ -148,6 +165,7 @@ def main():
     try:
         if args.web_ui or args.mode == "docker":
             # Run full platform with Web UI
+            install_event_loop()
             asyncio.run(run_full(
                 host=args.host,
                 api_port=args.port,
@@ -1,6 +1,6 @@
 PROTOCOL_VERSION: str = "1.0"
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from synapse.memory.store import MemoryStore
 from synapse.security.capability_manager import CapabilityManager
@@ -13,9 +13,9 @@ class DistributedMemoryStore:
     """
     protocol_version: str = "1.0"
 
-    def __init__(self, caps: CapabilityManager):
+    def __init__(self, caps: CapabilityManager, db_path: Optional[str] = None):
         self._caps = caps
-        self._store = MemoryStore()
+        self._store = MemoryStore(db_path=db_path)
 
     async def add_long_term(self, category: str, data: Any) -> None:
         await self._caps.check_capability(["memory:write"])
@@ -10,8 +10,14 @@ import aiosqlite
 PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
 
+# Used when no db_path is given (aiosqlite would otherwise create a file
+# literally named "None" in the working directory)
+DEFAULT_DB_PATH: str = os.path.join(os.path.expanduser("~"), ".synapse", "memory.db")
+
 # Helper to ensure DB exists and tables are created
 async def _init_db(db_path: str):
+    if db_path != ":memory:":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     async with aiosqlite.connect(db_path) as db:
         await db.execute('''
             CREATE TABLE IF NOT EXISTS short_term (
@@ -48,7 +54,7 @@ class MemoryStore:
     
     def __init__(self, db_path: Optional[str] = None):
         self.protocol_version = "1.0"
-        self.db_path = db_path
+        self.db_path = db_path or DEFAULT_DB_PATH
         self.vector_store = None  # Attached externally: VectorMemoryStore or os.path.join(os.getcwd(), "synapse", "memory", "memory.db")
         # No async task is started here – we will create it lazily when needed
         self._init_task: Optional[asyncio.Task] = None
@@ -6,11 +6,23 @@ SPEC_VERSION: 3.1
 
 PROTOCOL_VERSION: str = "1.0"
 SPEC_VERSION: str = "3.1"
+import asyncio
+import atexit
+import json
 import logging
 import time
-from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional, Union
-from datetime import datetime, timezone
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional, Union
+
+from synapse.core.timestamps import utc_isoformat
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 
 logger = logging.getLogger("synapse.observability")
 handler = logging.StreamHandler()
@@ -22,12 +34,52 @@ logger.setLevel(logging.INFO)
 _metrics: Dict[str, int] = {}
 _audit_log: list = []
 
+# Audit lines waiting to be written to the log handlers. Inside an event loop
+# a single flush is scheduled per batch instead of writing per audit() call:
+# on the next loop iteration, or AUDIT_DRAIN_INTERVAL later on loops where an
+# app has started draining. AUDIT_DRAIN_BATCH pending lines flush at once.
+# When the queue is full the oldest lines are dropped (and counted).
+AUDIT_QUEUE_MAX: int = 10_000
+AUDIT_DRAIN_INTERVAL: float = 0.05
+AUDIT_DRAIN_BATCH: int = 256
+_audit_pending: Deque[Dict[str, Any]] = deque(maxlen=AUDIT_QUEUE_MAX)
+_audit_flush_loop: Optional[asyncio.AbstractEventLoop] = None
+# Apps draining on each loop; start/stop are reference-counted so one app
+# shutting down does not change flushing for others on the same loop
+_audit_drain_refs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+
+# Process-wide audit switch, optionally overridden per context (e.g. per request)
+_audit_enabled: bool = True
+_audit_override: ContextVar[Optional[bool]] = ContextVar("synapse_audit_enabled", default=None)
+
 def record_metric(name: str, value: int = 1) -> None:
     _metrics[name] = _metrics.get(name, 0) + value
 
 def get_metric(name: str) -> int:
     return _metrics.get(name, 0)
 
+def set_audit_enabled(enabled: bool) -> None:
+    """Enable or disable audit recording process-wide."""
+    global _audit_enabled
+    _audit_enabled = enabled
+
+def audit_enabled() -> bool:
+    """Whether audit events are recorded in the current context.
+
+    Callers on hot paths check this before building audit payloads.
+    """
+    override = _audit_override.get()
+    return _audit_enabled if override is None else override
+
+@contextmanager
+def audit_scope(enabled: bool):
+    """Override audit recording for the current context (task/request)."""
+    token = _audit_override.set(enabled)
+    try:
+        yield
+    finally:
+        _audit_override.reset(token)
+
 def audit(event: Union[Dict[str, Any], str] = None, **kwargs) -> None:
     """Record an audit event.
 
@@ -35,16 +87,82 @@ def audit(event: Union[Dict[str, Any], str] = None, **kwargs) -> None:
         event: Event data to audit (optional, can be dict or string)
         **kwargs: Additional event data as keyword arguments
     """
+    if not audit_enabled():
+        return
+    # kwargs is already a fresh dict, so build the event in a single step
     if event is None:
-        event_copy = {}
+        event_copy = kwargs
     elif isinstance(event, str):
-        event_copy = {"event": event}
+        event_copy = {"event": event, **kwargs}
     else:
-        event_copy = event.copy()
-    event_copy.update(kwargs)
-    event_copy["timestamp"] = datetime.now(timezone.utc).isoformat()
+        event_copy = {**event, **kwargs}
+    event_copy["timestamp"] = utc_isoformat()
     _audit_log.append(event_copy)
-    logger.info(f"AUDIT: {event_copy}")
+    if logger.isEnabledFor(logging.INFO):
+        if len(_audit_pending) == AUDIT_QUEUE_MAX:
+            record_metric("audit_lines_dropped")
+        _audit_pending.append(event_copy)
+        _schedule_audit_flush()
+
+def flush_audit() -> int:
+    """Write queued audit events to the log handlers.
+
+    Returns:
+        Number of events written
+    """
+    global _audit_flush_loop
+    _audit_flush_loop = None
+    count = 0
+    while True:
+        try:
+            event = _audit_pending.popleft()
+        except IndexError:
+            return count
+        logger.info("AUDIT: %s", _serialize_audit(event))
+        count += 1
+
+def _serialize_audit(event: Dict[str, Any]) -> str:
+    """Encode an audit event as a JSON line; non-JSON values fall back to str()."""
+    if orjson is not None:
+        return orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(event, default=str, ensure_ascii=False)
+
+def _schedule_audit_flush() -> None:
+    global _audit_flush_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush_audit()
+        return
+    if len(_audit_pending) >= AUDIT_DRAIN_BATCH:
+        flush_audit()
+    elif _audit_flush_loop is not loop:
+        _audit_flush_loop = loop
+        if _audit_drain_refs.get(loop):
+            loop.call_later(AUDIT_DRAIN_INTERVAL, flush_audit)
+        else:
+            loop.call_soon(flush_audit)
+
+def start_audit_drainer() -> None:
+    """Defer audit writes on the running loop by up to AUDIT_DRAIN_INTERVAL.
+
+    Reference-counted per loop; pair each call with stop_audit_drainer().
+    Call from application startup.
+    """
+    loop = asyncio.get_running_loop()
+    _audit_drain_refs[loop] = _audit_drain_refs.get(loop, 0) + 1
+
+async def stop_audit_drainer() -> None:
+    """Release one start_audit_drainer() and write any queued audit lines."""
+    loop = asyncio.get_running_loop()
+    refs = _audit_drain_refs.get(loop, 0) - 1
+    if refs > 0:
+        _audit_drain_refs[loop] = refs
+    else:
+        _audit_drain_refs.pop(loop, None)
+    flush_audit()
+
+atexit.register(flush_audit)
 
 def get_audit_log() -> list:
     """Get all audit log entries."""
@@ -5,18 +5,18 @@ Formal Plan Model for Deterministic Planning
 PROTOCOL_VERSION: str = "1.0"
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Set
 from datetime import datetime, UTC
 import hashlib
 import json
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanStep:
     """Immutable plan step"""
     step_id: str
     action: str
-    required_capabilities: Set[str]
+    required_capabilities: FrozenSet[str]
     parameters: Dict[str, Any]
     order: int
     protocol_version: str = "1.0"
@@ -70,6 +70,29 @@ class Plan:
         for step in self.steps:
             caps.update(step.required_capabilities)
         return caps
+    
+    def steps_by_wave(self) -> List[List[PlanStep]]:
+        """Group steps into waves that can execute concurrently
+        
+        Steps carry no explicit dependencies, so a step depends on every
+        earlier step that touches the same capability namespace (the part
+        before ':', e.g. "fs"). Each step is placed one wave after its latest
+        dependency; steps without capabilities depend on nothing. Waves and
+        the steps within them are in plan order.
+        """
+        waves: List[List[PlanStep]] = []
+        namespace_wave: Dict[str, int] = {}
+        
+        for step in sorted(self.steps, key=lambda s: s.order):
+            namespaces = {cap.split(":", 1)[0] for cap in step.required_capabilities}
+            wave = max((namespace_wave[ns] + 1 for ns in namespaces if ns in namespace_wave), default=0)
+            if wave == len(waves):
+                waves.append([])
+            waves[wave].append(step)
+            for ns in namespaces:
+                namespace_wave[ns] = wave
+        
+        return waves
 
 
 @dataclass
@@ -87,14 +110,14 @@ class PlanBuilder:
         self._steps: List[PlanStep] = []
         self._capabilities: Set[str] = set()
     
+    def _step_id(self, order: int, action: str) -> str:
+        """Deterministic id for the step at position order"""
+        return hashlib.sha256(f"{self.task_id}:{order}:{action}".encode()).hexdigest()[:16]
+    
     def add_step(self, action: str, capabilities: Set[str], parameters: Dict[str, Any] = None) -> 'PlanBuilder':
         """Add a step to the plan"""
-        step_id = hashlib.sha256(
-            f"{self.task_id}:{len(self._steps)}:{action}".encode()
-        ).hexdigest()[:16]
-        
         step = PlanStep(
-            step_id=step_id,
+            step_id=self._step_id(len(self._steps), action),
             action=action,
             required_capabilities=frozenset(capabilities),
             parameters=parameters or {},
@@ -105,6 +128,29 @@ class PlanBuilder:
         self._capabilities.update(capabilities)
         return self
     
+    def add_steps_batch(self, raw_steps: Iterable[Dict[str, Any]]) -> 'PlanBuilder':
+        """Add several steps at once
+        
+        Each item is a dict with "action", "capabilities" and optional
+        "parameters"; the result is identical to calling add_step per item.
+        """
+        start = len(self._steps)
+        new_steps = [
+            PlanStep(
+                step_id=self._step_id(order, raw["action"]),
+                action=raw["action"],
+                required_capabilities=frozenset(raw["capabilities"]),
+                parameters=raw.get("parameters") or {},
+                order=order
+            )
+            for order, raw in enumerate(raw_steps, start)
+        ]
+        
+        self._steps.extend(new_steps)
+        for step in new_steps:
+            self._capabilities.update(step.required_capabilities)
+        return self
+    
     def build(self) -> Plan:
         """Build the immutable plan"""
         plan_id = hashlib.sha256(
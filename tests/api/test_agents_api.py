@@ -122,3 +122,19 @@ def test_update_agent_config(client):
     assert response.status_code == 200
     data = response.json()
     assert data["config"]["max_retries"] == 5
+
+
+@pytest.mark.api
+def test_get_agent_logs_tail(client):
+    """Agent logs return the newest entries and evict past the bound."""
+    from synapse.api.routes.agents import agents_logs, AGENT_LOGS_MAX
+    buffer = agents_logs["critic"]
+    buffer.clear()
+    buffer.extend({"n": i} for i in range(AGENT_LOGS_MAX + 5))
+    try:
+        assert len(buffer) == AGENT_LOGS_MAX
+        data = client.get("/api/v1/agents/critic/logs?limit=3").json()
+        last = AGENT_LOGS_MAX + 4
+        assert [e["n"] for e in data["logs"]] == [last - 2, last - 1, last]
+    finally:
+        buffer.clear()
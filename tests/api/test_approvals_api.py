@@ -0,0 +1,85 @@
+"""Tests for Approvals API."""
+import pytest
+from fastapi.testclient import TestClient
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client."""
+    monkeypatch.delenv("SYNAPSE_API_KEY", raising=False)
+    from synapse.api.app import app
+    from synapse.api.middleware import _rate_limit_counts
+    # Keep this module's requests from counting against later API tests
+    _rate_limit_counts.clear()
+    yield TestClient(app)
+    _rate_limit_counts.clear()
+
+
+def _create(client, action="deploy"):
+    response = client.post("/api/v1/approvals", json={"action": action, "risk_level": 3})
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.api
+def test_approve_updates_listed_approval(client):
+    """Approving by id updates the same record returned by the list."""
+    created = _create(client)
+    response = client.post(f"/api/v1/approvals/{created['id']}/approve")
+    assert response.status_code == 200
+    assert response.json()["status"] == "approved"
+
+    listed = {a["id"]: a for a in client.get("/api/v1/approvals").json()["approvals"]}
+    assert listed[created["id"]]["status"] == "approved"
+    assert "approved_at" in listed[created["id"]]
+
+
+@pytest.mark.api
+def test_reject_updates_status(client):
+    """Rejecting by id marks the approval rejected."""
+    created = _create(client, action="delete")
+    response = client.post(f"/api/v1/approvals/{created['id']}/reject")
+    assert response.status_code == 200
+    assert response.json()["status"] == "rejected"
+
+
+@pytest.mark.api
+@pytest.mark.parametrize("verb", ["approve", "reject"])
+def test_unknown_approval_not_found(client, verb):
+    """Unknown approval ids return 404."""
+    response = client.post(f"/api/v1/approvals/approval_missing/{verb}")
+    assert response.status_code == 404
+
+
+@pytest.mark.api
+def test_pending_view_and_status_track_decisions(client):
+    """Pending list and status counters follow approve/reject."""
+    before = client.get("/api/v1/status").json()["pending_approvals"]
+    first = _create(client, action="a")
+    second = _create(client, action="b")
+
+    pending_ids = [a["id"] for a in client.get("/api/v1/approvals/pending").json()["approvals"]]
+    assert pending_ids[-2:] == [first["id"], second["id"]]
+    assert client.get("/api/v1/status").json()["pending_approvals"] == before + 2
+
+    client.post(f"/api/v1/approvals/{first['id']}/approve")
+    pending_ids = [a["id"] for a in client.get("/api/v1/approvals/pending").json()["approvals"]]
+    assert first["id"] not in pending_ids
+    assert client.get("/api/v1/status").json()["pending_approvals"] == before + 1
+
+
+@pytest.mark.api
+def test_status_counts_completed_tasks(client):
+    """Creating a task bumps tasks_completed."""
+    before = client.get("/api/v1/status").json()["tasks_completed"]
+    client.post("/api/v1/tasks", json={"task": "noop"})
+    assert client.get("/api/v1/status").json()["tasks_completed"] == before + 1
+
+
+@pytest.mark.api
+def test_approval_ids_are_unique(client):
+    """Each created approval gets a distinct id."""
+    ids = {_create(client, action=f"a{i}")["id"] for i in range(3)}
+    assert len(ids) == 3
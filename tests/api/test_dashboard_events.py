@@ -0,0 +1,80 @@
+"""Tests for dashboard push events over /ws/events."""
+import pytest
+from fastapi.testclient import TestClient
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client."""
+    from synapse.api.app import app
+    from synapse.api.middleware import _rate_limit_counts, invalidate_response_cache
+
+    monkeypatch.delenv("SYNAPSE_API_KEY", raising=False)
+    _rate_limit_counts.clear()
+    invalidate_response_cache()
+    with TestClient(app) as test_client:
+        yield test_client
+    _rate_limit_counts.clear()
+
+
+@pytest.mark.api
+def test_snapshot_sent_on_connect(client):
+    """Subscribers get status, approvals and logs immediately."""
+    with client.websocket_connect("/ws/events") as ws:
+        types = [ws.receive_json()["type"] for _ in range(3)]
+    assert types == ["status", "approvals", "logs"]
+
+
+@pytest.mark.api
+def test_approval_change_is_pushed(client):
+    """Creating an approval pushes fresh status and approvals snapshots."""
+    with client.websocket_connect("/ws/events") as ws:
+        for _ in range(3):
+            ws.receive_json()
+        created = client.post("/api/v1/approvals", json={"action": "push", "risk_level": 2}).json()
+        status = ws.receive_json()
+        pending = ws.receive_json()
+    assert status["type"] == "status"
+    assert pending["type"] == "approvals"
+    assert created["id"] in [a["id"] for a in pending["approvals"]]
+
+
+@pytest.mark.api
+def test_token_required_when_api_key_set(client, monkeypatch):
+    """With SYNAPSE_API_KEY set, connections need a matching token."""
+    from starlette.websockets import WebSocketDisconnect
+
+    monkeypatch.setenv("SYNAPSE_API_KEY", "events-key")
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/ws/events") as ws:
+            ws.receive_json()
+    with client.websocket_connect("/ws/events?token=events-key") as ws:
+        assert ws.receive_json()["type"] == "status"
+
+
+@pytest.mark.api
+async def test_burst_coalesces_per_topic():
+    """Repeated publishes before the writer runs send each topic once."""
+    import importlib
+    import json
+
+    app_module = importlib.import_module("synapse.api.app")
+    sent = []
+
+    class _Socket:
+        async def send_text(self, text):
+            sent.append(json.loads(text)["type"])
+
+    ws = _Socket()
+    app_module._event_subscribers[ws] = {}
+    try:
+        for _ in range(5):
+            app_module._publish_events("status", "approvals")
+        app_module._publish_events("logs")
+        await app_module._event_writers[ws]
+    finally:
+        app_module._event_subscribers.pop(ws, None)
+    assert sent == ["status", "approvals", "logs"]
+    assert ws not in app_module._event_writers
@@ -0,0 +1,63 @@
+"""Tests for the dashboard page served at /."""
+import pytest
+from fastapi.testclient import TestClient
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    from synapse.api.app import app
+    from synapse.api.middleware import _rate_limit_counts
+    # Keep this module's requests from counting against later API tests
+    _rate_limit_counts.clear()
+    yield TestClient(app)
+    _rate_limit_counts.clear()
+
+
+@pytest.mark.api
+def test_dashboard_served_with_etag(client):
+    """Dashboard returns HTML with caching headers."""
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "Synapse Dashboard" in response.text
+    assert response.headers["etag"].startswith('"')
+    assert "max-age" in response.headers["cache-control"]
+
+
+@pytest.mark.api
+@pytest.mark.parametrize("wrap", ["{}", "W/{}", '"other", {}', "*"])
+def test_dashboard_not_modified(client, wrap):
+    """Matching If-None-Match yields an empty 304."""
+    etag = client.get("/").headers["etag"]
+    response = client.get("/", headers={"If-None-Match": wrap.format(etag)})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.api
+def test_dashboard_stale_etag_gets_body(client):
+    """A non-matching ETag gets the full page."""
+    response = client.get("/", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.content
+
+
+@pytest.mark.api
+def test_dashboard_gzip_precompressed(client):
+    """gzip-capable clients get the pre-compressed page with its own ETag."""
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.content == plain.content  # httpx decodes the body
+    assert zipped.headers["etag"] != plain.headers["etag"]
+    assert "Accept-Encoding" in zipped.headers["vary"]
+
+    response = client.get(
+        "/", headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["etag"]}
+    )
+    assert response.status_code == 304
+
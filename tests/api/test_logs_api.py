@@ -0,0 +1,95 @@
+"""Tests for Logs API."""
+import importlib
+from collections import deque
+
+import pytest
+from fastapi.testclient import TestClient
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client over a small, empty log buffer."""
+    app_module = importlib.import_module("synapse.api.app")
+    from synapse.api.middleware import _rate_limit_counts, invalidate_response_cache
+
+    monkeypatch.delenv("SYNAPSE_API_KEY", raising=False)
+    monkeypatch.setattr(app_module, "logs", deque(maxlen=3))
+    _rate_limit_counts.clear()
+    invalidate_response_cache()
+    yield TestClient(app_module.app)
+    _rate_limit_counts.clear()
+    invalidate_response_cache()
+
+
+@pytest.mark.api
+def test_get_logs_returns_tail_in_order(client):
+    """limit returns the most recent entries, oldest first."""
+    for i in range(3):
+        client.post("/api/v1/logs", json={"msg": f"m{i}"})
+    data = client.get("/api/v1/logs?limit=2").json()
+    assert [entry["msg"] for entry in data["logs"]] == ["m1", "m2"]
+    assert data["protocol_version"] == PROTOCOL_VERSION
+
+
+@pytest.mark.api
+def test_log_buffer_evicts_oldest(client):
+    """Entries beyond the buffer size drop the oldest."""
+    for i in range(5):
+        client.post("/api/v1/logs", json={"msg": f"m{i}"})
+    data = client.get("/api/v1/logs").json()
+    assert [entry["msg"] for entry in data["logs"]] == ["m2", "m3", "m4"]
+
+
+@pytest.mark.api
+def test_large_log_listing_is_gzipped(client, monkeypatch):
+    """Responses above the size threshold are gzip-encoded on request."""
+    monkeypatch.setattr(importlib.import_module("synapse.api.app"), "logs", deque(maxlen=50))
+    for i in range(20):
+        client.post("/api/v1/logs", json={"msg": f"entry {i}", "level": "info"})
+    response = client.get("/api/v1/logs", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()["logs"]) == 20
+
+
+@pytest.mark.api
+def test_stream_logs_as_ndjson(client):
+    """/logs/stream yields one JSON object per line, oldest first."""
+    import json
+
+    for i in range(3):
+        client.post("/api/v1/logs", json={"msg": f"m{i}"})
+    response = client.get("/api/v1/logs/stream?limit=2")
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [json.loads(line)["msg"] for line in lines] == ["m1", "m2"]
+
+
+@pytest.mark.api
+def test_get_logs_negotiates_ndjson(client):
+    """Accept: application/x-ndjson switches /logs to streaming."""
+    client.post("/api/v1/logs", json={"msg": "only"})
+    assert "logs" in client.get("/api/v1/logs").json()
+    response = client.get("/api/v1/logs", headers={"Accept": "application/x-ndjson"})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text.strip().startswith('{"msg":"only"')
+
+
+@pytest.mark.api
+def test_large_listing_is_chunk_encoded(client, monkeypatch):
+    """Listings above ENCODE_CHUNK_SIZE stream the same JSON document."""
+    app_module = importlib.import_module("synapse.api.app")
+    monkeypatch.setattr(app_module, "logs", deque(maxlen=10))
+    for i in range(5):
+        client.post("/api/v1/logs", json={"msg": f"m{i}"})
+    whole = client.get("/api/v1/logs").json()
+
+    monkeypatch.setattr(app_module, "ENCODE_CHUNK_SIZE", 2)
+    client.post("/api/v1/logs", json={"msg": "m5"})  # also clears the response cache
+    client.post("/api/v1/logs", json={"msg": "m6"})
+    chunked = client.get("/api/v1/logs").json()
+
+    assert chunked["protocol_version"] == PROTOCOL_VERSION
+    assert [e["msg"] for e in chunked["logs"]] == [e["msg"] for e in whole["logs"]] + ["m5", "m6"]
@@ -216,3 +216,25 @@ def test_set_provider_priority(client, mock_provider_service):
     assert response.status_code == 200
     data = response.json()
     assert data["priority"] == 1
+
+
+# === STORED RECORDS ===
+
+@pytest.mark.api
+def test_provider_record_round_trip(client):
+    """Providers are stored as records and serialize with the key masked."""
+    from synapse.api.routes.providers import ProviderRecord, providers_db
+
+    created = client.post("/api/v1/providers", json={
+        "name": "Record Test", "api_key": "sk-secret", "models": ["m1"]
+    }).json()
+    try:
+        assert isinstance(providers_db["record_test"], ProviderRecord)
+        assert created["api_key"] == "***"
+        client.put("/api/v1/providers/record_test", json={"priority": 1})
+        listed = client.get("/api/v1/providers").json()["providers"]
+        record = next(p for p in listed if p["id"] == "record_test")
+        assert record["priority"] == 1
+        assert record["updated_at"] is not None
+    finally:
+        providers_db.pop("record_test", None)
@@ -0,0 +1,146 @@
+"""Tests for the GET response cache middleware."""
+import pytest
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from synapse.api import middleware
+from synapse.api.middleware import invalidate_response_cache, make_response_cache_middleware
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture
+def counted_app():
+    """App whose GET handlers count invocations."""
+    app = FastAPI()
+    calls = {"status": 0, "missing": 0, "racy": 0, "stream": 0}
+    app.middleware("http")(make_response_cache_middleware(
+        {"/status": 60.0, "/missing": 60.0, "/tagged": 60.0, "/racy": 60.0, "/stream": 60.0}
+    ))
+
+    @app.get("/status")
+    async def status(limit: int = 10):
+        calls["status"] += 1
+        return {"calls": calls["status"], "limit": limit}
+
+    @app.get("/missing")
+    async def missing():
+        calls["missing"] += 1
+        raise HTTPException(status_code=404)
+
+    @app.get("/tagged")
+    async def tagged(response: Response):
+        response.headers["ETag"] = '"v1"'
+        response.headers["Cache-Control"] = "no-cache"
+        return {"ok": True}
+
+    @app.get("/racy")
+    async def racy():
+        # A write lands while this response is being produced
+        calls["racy"] += 1
+        invalidate_response_cache()
+        return {"calls": calls["racy"]}
+
+    @app.get("/stream")
+    async def stream():
+        calls["stream"] += 1
+        lines = (f"{i}\n".encode() for i in range(3))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    @app.post("/write")
+    async def write():
+        return {"ok": True}
+
+    invalidate_response_cache()
+    yield TestClient(app), calls
+    invalidate_response_cache()
+
+
+@pytest.mark.api
+def test_repeat_get_served_from_cache(counted_app):
+    client, calls = counted_app
+    first = client.get("/status").json()
+    second = client.get("/status").json()
+    assert first == second
+    assert calls["status"] == 1
+
+
+@pytest.mark.api
+def test_query_string_is_part_of_key(counted_app):
+    client, calls = counted_app
+    assert client.get("/status?limit=5").json()["limit"] == 5
+    assert client.get("/status?limit=10").json()["limit"] == 10
+    assert calls["status"] == 2
+
+
+@pytest.mark.api
+def test_write_invalidates_cache(counted_app):
+    client, calls = counted_app
+    client.get("/status")
+    client.post("/write")
+    assert client.get("/status").json()["calls"] == 2
+
+
+@pytest.mark.api
+def test_errors_not_cached(counted_app):
+    client, calls = counted_app
+    assert client.get("/missing").status_code == 404
+    assert client.get("/missing").status_code == 404
+    assert calls["missing"] == 2
+
+
+@pytest.mark.api
+def test_cache_hit_replays_headers(counted_app):
+    client, _ = counted_app
+    first = client.get("/tagged")
+    second = client.get("/tagged")
+    for response in (first, second):
+        assert response.headers["etag"] == '"v1"'
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["content-type"] == "application/json"
+    assert second.json() == {"ok": True}
+
+
+@pytest.mark.api
+def test_response_invalidated_mid_flight_not_stored(counted_app):
+    client, calls = counted_app
+    assert client.get("/racy").json()["calls"] == 1
+    assert client.get("/racy").json()["calls"] == 2
+
+
+@pytest.mark.api
+def test_cache_is_bounded_lru(counted_app, monkeypatch):
+    client, calls = counted_app
+    monkeypatch.setattr(middleware, "RESPONSE_CACHE_MAX", 2)
+    client.get("/status?limit=1")
+    client.get("/status?limit=2")
+    client.get("/status?limit=1")  # hit; limit=2 is now least recent
+    client.get("/status?limit=3")
+    assert len(middleware._response_cache) == 2
+    assert calls["status"] == 3
+    client.get("/status?limit=1")
+    assert calls["status"] == 3
+    client.get("/status?limit=2")
+    assert calls["status"] == 4
+
+
+@pytest.mark.api
+def test_expired_entry_dropped_on_lookup(counted_app, monkeypatch):
+    client, calls = counted_app
+    client.get("/status")
+    now = middleware.time.monotonic()
+    monkeypatch.setattr(middleware.time, "monotonic", lambda: now + 120)
+    assert client.get("/status").json()["calls"] == 2
+    assert len(middleware._response_cache) == 1
+
+
+@pytest.mark.api
+def test_streaming_response_not_cached(counted_app):
+    client, calls = counted_app
+    first = client.get("/stream")
+    second = client.get("/stream")
+    assert first.content == second.content == b"0\n1\n2\n"
+    assert "content-length" not in first.headers
+    assert calls["stream"] == 2
+    assert not middleware._response_cache
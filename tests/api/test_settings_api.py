@@ -99,6 +99,19 @@ def test_update_telegram_settings(client):
     assert response.status_code == 200
 
 
+@pytest.mark.api
+def test_settings_get_reflects_update(client):
+    """Cached GET bodies are re-encoded after a PUT."""
+    client.get("/api/v1/settings/system")
+    client.put("/api/v1/settings/system", json={"max_agents": 7})
+    assert client.get("/api/v1/settings/system").json()["settings"]["max_agents"] == 7
+
+    client.get("/api/v1/settings/connectors")
+    client.put("/api/v1/settings/connectors/telegram", json={"enabled": False})
+    data = client.get("/api/v1/settings/connectors").json()
+    assert data["settings"]["telegram"]["enabled"] is False
+
+
 # === ENVIRONMENT VARIABLES ===
 
 @pytest.mark.api
@@ -158,3 +171,25 @@ def test_restore_backup(client):
     """Test restoring from backup."""
     response = client.post("/api/v1/settings/restore/backup_123")
     assert response.status_code in [200, 404]
+
+
+@pytest.mark.api
+def test_restore_created_backup(client):
+    """A created backup can be restored by its id; unknown ids are 404."""
+    backup_id = client.post("/api/v1/settings/backup").json()["backup_id"]
+    response = client.post(f"/api/v1/settings/restore/{backup_id}")
+    assert response.status_code == 200
+    assert response.json()["backup_id"] == backup_id
+    ids = [b["id"] for b in client.get("/api/v1/settings/backups").json()["backups"]]
+    assert backup_id in ids
+    assert client.post("/api/v1/settings/restore/missing").status_code == 404
+
+
+@pytest.mark.api
+def test_backups_in_same_second_are_distinct(client):
+    """Back-to-back backups get distinct ids and are all kept."""
+    first = client.post("/api/v1/settings/backup").json()["backup_id"]
+    second = client.post("/api/v1/settings/backup").json()["backup_id"]
+    assert first != second
+    ids = [b["id"] for b in client.get("/api/v1/settings/backups").json()["backups"]]
+    assert first in ids and second in ids
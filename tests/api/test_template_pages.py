@@ -0,0 +1,68 @@
+"""Tests for the static template pages (providers/agents/settings)."""
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+PROTOCOL_VERSION = "1.0"
+
+app_module = importlib.import_module("synapse.api.app")
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    from synapse.api.middleware import _rate_limit_counts
+    _rate_limit_counts.clear()
+    yield TestClient(app_module.app)
+    _rate_limit_counts.clear()
+
+
+@pytest.mark.api
+@pytest.mark.parametrize("name", app_module.TEMPLATE_PAGES)
+def test_template_page_matches_file(client, name):
+    """Pages serve the template file's bytes, gzipped when accepted."""
+    expected = (app_module.TEMPLATES_DIR / name).read_bytes()
+    plain = client.get(f"/{name}", headers={"Accept-Encoding": "identity"})
+    zipped = client.get(f"/{name}", headers={"Accept-Encoding": "gzip"})
+    assert plain.status_code == 200
+    assert plain.content == expected
+    assert plain.headers["content-type"].startswith("text/html")
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.content == expected
+
+    response = client.get(
+        f"/{name}",
+        headers={"Accept-Encoding": "identity", "If-None-Match": plain.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.api
+def test_template_read_once(client, monkeypatch):
+    """Repeated requests are served from the cached encoding."""
+    app_module._load_template.cache_clear()
+    reads = []
+    original = app_module.Path.read_bytes
+
+    def counting_read(path):
+        reads.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(app_module.Path, "read_bytes", counting_read)
+    for _ in range(3):
+        assert client.get("/agents.html").status_code == 200
+    assert reads == ["agents.html"]
+
+
+@pytest.mark.api
+def test_missing_template_is_404(client, monkeypatch, tmp_path):
+    """A missing template returns a 404 page."""
+    app_module._load_template.cache_clear()
+    monkeypatch.setattr(app_module, "TEMPLATES_DIR", tmp_path)
+    try:
+        response = client.get("/settings.html")
+        assert response.status_code == 404
+        assert "Settings page not found" in response.text
+    finally:
+        app_module._load_template.cache_clear()
@@ -23,5 +23,55 @@ class TestWebSocketAuthentication:
             content = f.read()
         assert 'close' in content.lower()
 
+
+class TestWebSocketEcho:
+    """Test authenticated WebSocket round trip."""
+
+    def test_echo_returns_json_text_frame(self, monkeypatch):
+        """Verify echoed messages are JSON text frames."""
+        from fastapi.testclient import TestClient
+        from synapse.api.app import app
+
+        monkeypatch.setenv("SYNAPSE_API_KEY", "ws-test-key")
+        client = TestClient(app)
+        with client.websocket_connect("/ws?token=ws-test-key") as ws:
+            ws.send_text('{"msg": "hi", "n": 1}')
+            reply = ws.receive_json()
+        assert reply["type"] == "echo"
+        assert reply["data"] == {"msg": "hi", "n": 1}
+
+    def test_msgpack_subprotocol_falls_back_to_json(self, monkeypatch):
+        """Without msgspec the msgpack subprotocol is declined and JSON is used."""
+        from fastapi.testclient import TestClient
+        from synapse.api import responses
+        from synapse.api.app import app
+
+        monkeypatch.setenv("SYNAPSE_API_KEY", "ws-test-key")
+        monkeypatch.setattr(responses, "MSGPACK_AVAILABLE", False)
+        client = TestClient(app)
+        with client.websocket_connect(
+            "/ws?token=ws-test-key", subprotocols=[responses.MSGPACK_SUBPROTOCOL]
+        ) as ws:
+            assert ws.accepted_subprotocol is None
+            ws.send_text('{"msg": "hi"}')
+            assert ws.receive_json()["data"] == {"msg": "hi"}
+
+    def test_msgpack_echo(self, monkeypatch):
+        """Clients negotiating the msgpack subprotocol get binary frames."""
+        pytest.importorskip("msgspec")
+        from fastapi.testclient import TestClient
+        from synapse.api import responses
+        from synapse.api.app import app
+
+        monkeypatch.setenv("SYNAPSE_API_KEY", "ws-test-key")
+        client = TestClient(app)
+        with client.websocket_connect(
+            "/ws?token=ws-test-key", subprotocols=[responses.MSGPACK_SUBPROTOCOL]
+        ) as ws:
+            assert ws.accepted_subprotocol == responses.MSGPACK_SUBPROTOCOL
+            ws.send_bytes(responses.msgpack_dumps({"msg": "hi"}))
+            reply = responses.msgpack_loads(ws.receive_bytes())
+        assert reply["data"] == {"msg": "hi"}
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
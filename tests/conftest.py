@@ -96,10 +96,10 @@ async def execution_guard():
 # ============================================================================
 
 @pytest_asyncio.fixture
-async def memory_store():
+async def memory_store(tmp_path):
     """Create a memory store for testing."""
     from synapse.memory.store import MemoryStore
-    store = MemoryStore()
+    store = MemoryStore(db_path=str(tmp_path / "memory.db"))
     return store
 
 
@@ -77,6 +77,28 @@ class TestDeterminism:
         
         assert hash1 == hash2, "Identical inputs must produce identical hashes"
     
+    def test_planner_cache_is_bounded_lru(self):
+        """Planner cache must evict least recently used plans"""
+        planner = DeterministicPlanner(cache_size=2)
+        
+        plan_a = planner.generate_plan("task A", {}, {"fs:read"}, 1)
+        planner.generate_plan("task B", {}, {"fs:read"}, 1)
+        assert planner.generate_plan("task A", {}, {"fs:read"}, 1) is plan_a
+        
+        planner.generate_plan("task C", {}, {"fs:read"}, 1)
+        
+        assert len(planner._plan_cache) == 2
+        assert planner.generate_plan("task A", {}, {"fs:read"}, 1) is plan_a
+    
+    def test_planner_keyword_steps_in_canonical_order(self):
+        """Keyword steps must follow canonical order, not task word order"""
+        planner = DeterministicPlanner()
+        caps = {"fs:read", "fs:write", "os:process", "net:http"}
+        
+        plan = planner.generate_plan("Search then WRITE, then re-read", {}, caps, 1)
+        
+        assert [s.action for s in plan.steps] == ["read", "write", "search"]
+    
     def test_planner_does_not_depend_on_execution_order(self):
         """Planner must not depend on execution order"""
         planner = DeterministicPlanner()
@@ -112,6 +134,29 @@ class TestDeterminism:
         assert result1.plan_hash == result2.plan_hash, "Plan hashes must match"
         assert result1.deterministic_state_hash == result2.deterministic_state_hash, "State hashes must match"
     
+    def test_state_hash_is_incremental_over_trace(self):
+        """State hash must reflect the recorded trace and be re-computable"""
+        runtime = AgentRuntime(PolicyConstrainedPlanner({}))
+        empty_hash = runtime._compute_state_hash()
+        
+        runtime._record_step({"step_id": "s1", "action": "read", "success": True})
+        runtime._track_capabilities({"fs:read"})
+        
+        assert runtime._compute_state_hash() != empty_hash
+        assert runtime._compute_state_hash() == runtime._compute_state_hash()
+    
+    def test_used_capabilities_hash_independent_of_insertion_order(self):
+        """Capability insertion order must not affect the state hash"""
+        runtime1 = AgentRuntime(PolicyConstrainedPlanner({}))
+        runtime2 = AgentRuntime(PolicyConstrainedPlanner({}))
+        
+        runtime1._track_capabilities({"net:http"})
+        runtime1._track_capabilities({"fs:read", "fs:write"})
+        runtime2._track_capabilities({"fs:write", "fs:read", "net:http"})
+        
+        assert runtime1._sorted_capabilities == ["fs:read", "fs:write", "net:http"]
+        assert runtime1._compute_state_hash() == runtime2._compute_state_hash()
+    
     def test_plan_hash_is_cryptographic(self):
         """Plan hash must be cryptographic SHA256"""
         builder = PlanBuilder(
@@ -139,6 +184,38 @@ class TestDeterminism:
         
         assert hash1 != hash2, "Different seeds must produce different hashes"
     
+    def test_batch_step_construction_matches_add_step(self):
+        """Batched step construction must match per-step construction"""
+        raw_steps = [
+            {"action": "read", "capabilities": {"fs:read"}, "parameters": {"path": "/a"}},
+            {"action": "analyze", "capabilities": set()},
+        ]
+        
+        single = PlanBuilder("task1", 42, "policy")
+        for raw in raw_steps:
+            single.add_step(raw["action"], raw["capabilities"], raw.get("parameters"))
+        batched = PlanBuilder("task1", 42, "policy").add_steps_batch(raw_steps)
+        
+        assert (
+            batched.build().compute_deterministic_hash()
+            == single.build().compute_deterministic_hash()
+        )
+    
+    def test_plan_waves_group_independent_steps(self):
+        """Steps in disjoint capability namespaces must share a wave"""
+        builder = PlanBuilder("task1", 42, "policy")
+        builder.add_step("read", {"fs:read"}, {})
+        builder.add_step("search", {"net:http"}, {})
+        builder.add_step("write", {"fs:write"}, {})
+        builder.add_step("analyze", set(), {})
+        
+        waves = builder.build().steps_by_wave()
+        
+        assert [[s.action for s in wave] for wave in waves] == [
+            ["read", "search", "analyze"],
+            ["write"],
+        ]
+    
     def test_plan_step_order_deterministic(self):
         """Plan step order must be deterministic"""
         builder = PlanBuilder("task1", 42, "policy")
@@ -319,6 +396,21 @@ class TestSecurity:
         assert result == False, "Quota violation must fail"
         assert "max_steps_exceeded" in quota.get_violations()
     
+    def test_repeated_quota_violation_reported_once(self):
+        """Repeated violations must be reported once and keep the hash stable"""
+        limits = QuotaLimits(max_steps=1, max_time_ms=1000, max_capability_calls=10)
+        quota = ExecutionQuota(limits)
+        quota.start()
+        
+        quota.record_step()
+        quota.record_step()
+        hash_after_first = quota.get_state_hash()
+        quota.state.steps_used -= 1
+        quota.record_step()
+        
+        assert quota.get_violations() == ["max_steps_exceeded"]
+        assert quota.get_state_hash() == hash_after_first
+    
     def test_no_implicit_capabilities(self):
         """No implicit capabilities allowed"""
         policy_rules = {"allowed_capabilities": []}
@@ -351,6 +443,18 @@ class TestSecurity:
         
         assert reconstructed == original_data, "Reconstructed data must match original"
     
+    def test_unknown_snapshot_ids_rejected(self):
+        """Unknown or malformed snapshot IDs must not resolve"""
+        vault = MemoryVault()
+        snapshot = vault.store(agent_id="agent1", data={"k": 1}, capabilities_required=set())
+        
+        assert len(snapshot.snapshot_id) == 16
+        assert vault.retrieve(snapshot.snapshot_id, set()) is snapshot
+        assert vault.retrieve("0" * 16, set()) is None
+        assert vault.retrieve("not-hex", set()) is None
+        assert vault.verify_integrity("not-hex") is False
+        assert vault.reconstruct("not-hex") is None
+    
     def test_agent_isolation_enforced(self):
         """Agent isolation must be enforced"""
         vault = MemoryVault()
@@ -455,6 +559,18 @@ class TestRuntime:
         assert result.plan_hash is not None
         assert result.deterministic_state_hash is not None
     
+    def test_agent_context_capabilities_frozen(self):
+        """Context capabilities must be an immutable frozenset"""
+        context = AgentContext(
+            agent_id="agent1",
+            task_id="task1",
+            capabilities={"fs:read"},
+            execution_seed=42
+        )
+        
+        assert context.capabilities == frozenset({"fs:read"})
+        assert isinstance(context.capabilities, frozenset)
+    
     def test_execution_trace_recorded(self):
         """Execution trace must be recorded"""
         policy_rules = {"allowed_capabilities": ["fs:read"]}
@@ -473,6 +589,123 @@ class TestRuntime:
         assert len(result.execution_trace) > 0, "Execution trace must be recorded"
         assert all("step_id" in step for step in result.execution_trace)
     
+    def test_execution_trace_in_plan_order(self):
+        """Wave execution must record the trace in plan order"""
+        builder = PlanBuilder("task1", 42, "policy")
+        builder.add_step("read", {"fs:read"}, {})
+        builder.add_step("write", {"fs:write"}, {})
+        builder.add_step("search", {"net:http"}, {})
+        plan = builder.build()
+        
+        planner = MagicMock()
+        planner.generate_plan.return_value = PlanningResult(
+            success=True, plan=plan, plan_hash="plan", violations=[], timestamp=""
+        )
+        runtime = AgentRuntime(planner)
+        context = AgentContext(
+            agent_id="agent1",
+            task_id="task1",
+            capabilities={"fs:read", "fs:write", "net:http"},
+            execution_seed=42
+        )
+        
+        result = asyncio.run(runtime.run("task", context))
+        
+        assert [s["action"] for s in result.execution_trace] == ["read", "write", "search"]
+    
+    @staticmethod
+    def _sequential_reference(plan, context, execute_step=None):
+        """Trace, capabilities and state hash of a one-step-at-a-time run"""
+        runtime = AgentRuntime(MagicMock())
+        if execute_step is not None:
+            runtime._execute_step = execute_step
+        
+        async def run():
+            for step in sorted(plan.steps, key=lambda s: s.order):
+                step_result = await runtime._execute_step(step, context)
+                runtime._record_step(step_result)
+                runtime._track_capabilities(step.required_capabilities)
+                if not step_result.get("success"):
+                    break
+        
+        try:
+            asyncio.run(run())
+        except RuntimeError:
+            pass
+        return (
+            [s["action"] for s in runtime._execution_trace],
+            runtime._used_capabilities,
+            runtime._compute_state_hash(),
+        )
+    
+    def test_failed_wave_matches_sequential_execution(self):
+        """A failing plan records exactly what sequential execution would"""
+        builder = PlanBuilder("task1", 42, "policy")
+        builder.add_step("read", {"fs:read"}, {})
+        builder.add_step("write", {"fs:write"}, {})
+        builder.add_step("search", {"net:http"}, {})
+        builder.add_step("list", {"fs:list"}, {})
+        builder.add_step("post", {"net:post"}, {})
+        plan = builder.build()
+        
+        planner = MagicMock()
+        planner.generate_plan.return_value = PlanningResult(
+            success=True, plan=plan, plan_hash="plan", violations=[], timestamp=""
+        )
+        context = AgentContext(
+            agent_id="agent1",
+            task_id="task1",
+            capabilities={"fs:read", "fs:write", "fs:list", "net:post"},
+            execution_seed=42
+        )
+        
+        # "search" fails in the first wave beside "read"; "write" (a later
+        # wave, earlier in plan order) still runs, "post" and "list" do not
+        result = asyncio.run(AgentRuntime(planner).run("task", context))
+        trace, capabilities, state_hash = self._sequential_reference(plan, context)
+        
+        assert not result.success
+        assert trace == ["read", "write", "search"]
+        assert [s["action"] for s in result.execution_trace] == trace
+        assert result.used_capabilities == capabilities
+        assert result.deterministic_state_hash == state_hash
+        assert result.error == f"Step {plan.steps[2].step_id} failed"
+    
+    def test_raising_wave_matches_sequential_execution(self):
+        """A step raising in a later wave keeps only the steps before it"""
+        builder = PlanBuilder("task1", 42, "policy")
+        builder.add_step("read", {"fs:read"}, {})
+        builder.add_step("write", {"fs:write"}, {})
+        builder.add_step("search", {"net:http"}, {})
+        plan = builder.build()
+        
+        planner = MagicMock()
+        planner.generate_plan.return_value = PlanningResult(
+            success=True, plan=plan, plan_hash="plan", violations=[], timestamp=""
+        )
+        context = AgentContext(
+            agent_id="agent1",
+            task_id="task1",
+            capabilities={"fs:read", "fs:write"},
+            execution_seed=42
+        )
+        runtime = AgentRuntime(planner)
+        execute_step = runtime._execute_step
+        
+        async def raising_write(step, ctx):
+            if step.action == "write":
+                raise RuntimeError("skill crashed")
+            return await execute_step(step, ctx)
+        
+        runtime._execute_step = raising_write
+        result = asyncio.run(runtime.run("task", context))
+        trace, capabilities, state_hash = self._sequential_reference(plan, context, raising_write)
+        
+        assert result.error == "skill crashed"
+        assert [s["action"] for s in result.execution_trace] == trace == ["read"]
+        assert result.used_capabilities == capabilities
+        assert result.deterministic_state_hash == state_hash
+    
     def test_used_capabilities_tracked(self):
         """Used capabilities must be tracked"""
         policy_rules = {"allowed_capabilities": ["fs:read", "fs:write"]}
@@ -689,6 +922,59 @@ class TestConcurrency:
         
         assert quota.state.steps_used == 10
     
+    def test_wave_execution_bounded_by_max_parallel(self):
+        """Concurrent steps within a wave must not exceed max_parallel"""
+        runtime = AgentRuntime(PolicyConstrainedPlanner({}))
+        context = AgentContext(
+            agent_id="agent1",
+            task_id="task1",
+            capabilities=set(),
+            execution_seed=42,
+            max_parallel=2
+        )
+        builder = PlanBuilder("task1", 42, "policy")
+        for i in range(5):
+            builder.add_step(f"step{i}", set(), {})
+        wave = builder.build().steps_by_wave()[0]
+        
+        active = 0
+        peak = 0
+        
+        async def tracked_step(step, ctx):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {"step_id": step.step_id, "success": True}
+        
+        runtime._execute_step = tracked_step
+        results = asyncio.run(
+            runtime._execute_wave(wave, context, asyncio.Semaphore(context.max_parallel))
+        )
+        
+        assert [r["step_id"] for r in results] == [s.step_id for s in wave]
+        assert peak == 2
+    
+    def test_step_exception_reported_as_failure(self):
+        """A raising step must produce a failed result with its error"""
+        runtime = AgentRuntime(PolicyConstrainedPlanner({}))
+        context = AgentContext(
+            agent_id="agent1",
+            task_id="task1",
+            capabilities=set(),
+            execution_seed=42
+        )
+        
+        async def failing_step(step, ctx):
+            raise RuntimeError("skill crashed")
+        
+        runtime._execute_step = failing_step
+        result = asyncio.run(runtime.run("analyze", context))
+        
+        assert result.success is False
+        assert result.error == "skill crashed"
+    
     def test_concurrent_seal_safe(self):
         """Concurrent sealing must be safe"""
         seal = MemorySeal()
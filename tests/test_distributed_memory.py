@@ -23,15 +23,15 @@ class TestDistributedMemory:
         assert store is not None
 
     @pytest.mark.asyncio
-    async def test_distributed_memory_add(self, capability_manager):
+    async def test_distributed_memory_add(self, capability_manager, tmp_path):
         """Test distributed memory add."""
         from synapse.memory.distributed.store import DistributedMemoryStore
-        store = DistributedMemoryStore(capability_manager)
+        store = DistributedMemoryStore(capability_manager, db_path=str(tmp_path / "memory.db"))
         await store.add_long_term("test", {"data": "value"})
 
     @pytest.mark.asyncio
-    async def test_distributed_memory_replicate(self, capability_manager):
+    async def test_distributed_memory_replicate(self, capability_manager, tmp_path):
         """Test distributed memory replicate."""
         from synapse.memory.distributed.store import DistributedMemoryStore
-        store = DistributedMemoryStore(capability_manager)
+        store = DistributedMemoryStore(capability_manager, db_path=str(tmp_path / "memory.db"))
         await store.replicate()
@@ -7,7 +7,7 @@ class TestDistributedMemoryStoreFull:
     """Test DistributedMemoryStore with full coverage."""
     
     @pytest.fixture
-    def distributed_store(self):
+    def distributed_store(self, tmp_path):
         """Create a DistributedMemoryStore."""
         from synapse.memory.distributed.store import DistributedMemoryStore
         from synapse.security.capability_manager import CapabilityManager
@@ -17,7 +17,7 @@ class TestDistributedMemoryStoreFull:
         caps.grant_capability("memory:read")
         caps.grant_capability("memory:replicate")
         
-        return DistributedMemoryStore(caps=caps)
+        return DistributedMemoryStore(caps=caps, db_path=str(tmp_path / "memory.db"))
     
     def test_distributed_memory_store_creation(self, distributed_store):
         """Test DistributedMemoryStore creation."""
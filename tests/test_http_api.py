@@ -137,5 +137,14 @@ def test_trace_propagation(app_client):
     # Response should have protocol_version
     data = response.json()
     assert "protocol_version" in data
-    # Trace ID may or may not be in response depending on implementation
-    # This test verifies the endpoint works with trace headers
+    assert data["trace_id"] == "test-trace-123"
+    assert response.headers["X-Trace-ID"] == "test-trace-123"
+
+
+@pytest.mark.unit
+def test_trace_id_generated_without_header(app_client):
+    """Test a trace ID is minted when the request carries none."""
+    response = app_client.post("/task", json={"task": "process"})
+    trace_id = response.json()["trace_id"]
+    assert len(trace_id) == 32
+    assert response.headers["X-Trace-ID"] == trace_id
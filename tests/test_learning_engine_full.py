@@ -7,12 +7,12 @@ class TestLearningEngineFull:
     """Test LearningEngine with full coverage."""
     
     @pytest.fixture
-    def learning_engine(self):
+    def learning_engine(self, tmp_path):
         """Create a LearningEngine."""
         from synapse.learning.engine import LearningEngine
         from synapse.memory.store import MemoryStore
         
-        memory = MemoryStore()
+        memory = MemoryStore(db_path=str(tmp_path / "memory.db"))
         return LearningEngine(memory=memory)
     
     def test_learning_engine_creation(self, learning_engine):
@@ -160,3 +160,65 @@ def test_optimization_response_protocol_version():
     )
     
     assert response.protocol_version == "1.0"
+
+
+@pytest.mark.asyncio
+async def test_optimizer_caches_policy_decision(optimizer_agent):
+    """Policy decisions are cached per skill until invalidated."""
+    mock_policy = MagicMock()
+    mock_policy.allows_optimization = MagicMock(return_value=True)
+    optimizer_agent.policy_engine = mock_policy
+
+    request = OptimizationRequest(
+        skill_name="cached_skill",
+        current_code="def execute(): pass",
+        performance_metrics={},
+        optimization_goal="improve",
+        seed=42
+    )
+
+    await optimizer_agent.optimize_code(request)
+    await optimizer_agent.optimize_prompt(request)
+    assert mock_policy.allows_optimization.call_count == 1
+
+    mock_policy.allows_optimization.return_value = False
+    optimizer_agent.invalidate_policy("cached_skill")
+    response = await optimizer_agent.optimize_code(request)
+
+    assert response.success is False
+    assert mock_policy.allows_optimization.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_optimizer_policy_cache_expires(optimizer_agent, monkeypatch):
+    """Cached policy decisions are re-checked after the TTL."""
+    import synapse.agents.optimizer as optimizer_module
+
+    mock_policy = MagicMock()
+    mock_policy.allows_optimization = MagicMock(return_value=True)
+    optimizer_agent.policy_engine = mock_policy
+    monkeypatch.setattr(optimizer_module, "POLICY_CACHE_TTL", 0.0)
+
+    assert optimizer_agent._allows_optimization("ttl_skill") is True
+    assert optimizer_agent._allows_optimization("ttl_skill") is True
+    assert mock_policy.allows_optimization.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_optimizer_fallback_is_memoized():
+    """Fallback code is built once per (skill, goal, seed)."""
+    from synapse.agents.optimizer import OptimizerAgent
+
+    agent = OptimizerAgent()
+    request = OptimizationRequest(
+        skill_name="memo_skill",
+        performance_metrics={},
+        optimization_goal="latency",
+        seed=7
+    )
+
+    first = await agent.optimize_code(request)
+    second = await agent.optimize_code(request)
+
+    assert first.optimized_code is second.optimized_code
+    assert "class OptimizedMemoSkill" in first.optimized_code
@@ -180,3 +180,42 @@ async def test_deterministic_prompt_envelope(mock_provider):
     
     assert envelope1 == envelope2  # Same input = same envelope
     assert "protocol_version" in envelope1
+
+
+@pytest.mark.unit
+async def test_batch_retries_only_failed_items(mock_provider, fallback_provider):
+    """Failed batch items go through the fallback chain; successes are kept."""
+    from synapse.llm.provider import LLMRouter
+
+    mock_provider.generate_batch = AsyncMock(
+        return_value=[{"text": "a"}, RuntimeError("item failed"), {"text": "c"}]
+    )
+    mock_provider.generate.side_effect = Exception("Primary failed")
+    router = LLMRouter()
+    router.register(mock_provider)
+    router.register(fallback_provider)
+
+    results = await router.generate_batch(["p1", "p2", "p3"])
+    assert results == [{"text": "a"}, fallback_provider.generate.return_value, {"text": "c"}]
+    fallback_provider.generate.assert_awaited_once_with("p2")
+
+
+@pytest.mark.unit
+async def test_batch_timeout_is_not_resent(mock_provider, fallback_provider):
+    """A timed-out batch reports the error instead of re-running every prompt."""
+    import asyncio
+    from synapse.llm.provider import LLMRouter
+
+    async def slow_batch(prompts):
+        await asyncio.sleep(1)
+
+    mock_provider.generate_batch = slow_batch
+    router = LLMRouter()
+    router.register(mock_provider)
+    router.register(fallback_provider)
+    router.set_timeout(0.01)
+
+    results = await router.generate_batch(["p1", "p2"])
+    assert all(isinstance(r, TimeoutError) for r in results)
+    mock_provider.generate.assert_not_awaited()
+    fallback_provider.generate.assert_not_awaited()
@@ -63,3 +63,16 @@ class TestMemoryStore:
         await memory_store.add_long_term("test_category", {"data": "value"})
         results = await memory_store.search("test")
         assert isinstance(results, list)
+
+
+@pytest.mark.asyncio
+async def test_memory_store_default_path(tmp_path, monkeypatch):
+    """Without a db_path the store opens DEFAULT_DB_PATH, not a file named "None"."""
+    from synapse.memory import store as store_module
+    db_path = tmp_path / "home" / ".synapse" / "memory.db"
+    monkeypatch.setattr(store_module, "DEFAULT_DB_PATH", str(db_path))
+    monkeypatch.chdir(tmp_path)
+    store = store_module.MemoryStore()
+    await store.add_long_term("category", {"data": "value"})
+    assert db_path.exists()
+    assert not (tmp_path / "None").exists()
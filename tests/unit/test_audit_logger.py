@@ -0,0 +1,156 @@
+"""Unit tests for the audit enable switch."""
+import asyncio
+import json
+
+import pytest
+
+from synapse.observability import logger as obs_logger
+from synapse.observability.logger import (
+    audit,
+    audit_enabled,
+    audit_scope,
+    get_audit_log,
+    set_audit_enabled,
+)
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture(autouse=True)
+def restore_audit_switch():
+    yield
+    set_audit_enabled(True)
+
+
+@pytest.mark.unit
+class TestAuditSwitch:
+    def test_enabled_by_default(self):
+        assert audit_enabled() is True
+
+    def test_disabled_audit_records_nothing(self):
+        before = len(get_audit_log())
+        set_audit_enabled(False)
+        audit(event="should_not_record")
+        assert len(get_audit_log()) == before
+
+    def test_scope_overrides_process_switch(self):
+        with audit_scope(False):
+            assert audit_enabled() is False
+        assert audit_enabled() is True
+
+        set_audit_enabled(False)
+        with audit_scope(True):
+            assert audit_enabled() is True
+        assert audit_enabled() is False
+
+    def test_scope_is_isolated_per_task(self):
+        async def scoped():
+            with audit_scope(False):
+                await asyncio.sleep(0)
+                return audit_enabled()
+
+        async def unscoped():
+            await asyncio.sleep(0)
+            return audit_enabled()
+
+        async def main():
+            return await asyncio.gather(scoped(), unscoped())
+
+        assert asyncio.run(main()) == [False, True]
+
+    def test_event_fields_and_timestamp_recorded(self):
+        audit(event="switch_test_event", value=1)
+        entry = obs_logger._audit_log[-1]
+        assert entry["event"] == "switch_test_event"
+        assert entry["value"] == 1
+        assert entry["timestamp"].endswith("+00:00")
+
+
+@pytest.mark.unit
+class TestAuditFlush:
+    def test_sync_audit_is_written_immediately(self, caplog):
+        with caplog.at_level("INFO", logger="synapse.observability"):
+            audit(event="sync_flush_event")
+        assert any("sync_flush_event" in r.getMessage() for r in caplog.records)
+        assert not obs_logger._audit_pending
+
+    async def test_loop_audit_is_batched(self, caplog):
+        with caplog.at_level("INFO", logger="synapse.observability"):
+            audit(event="batched_a")
+            audit(event="batched_b")
+            assert [e["event"] for e in obs_logger._audit_pending] == ["batched_a", "batched_b"]
+            assert get_audit_log()[-1]["event"] == "batched_b"
+
+            await asyncio.sleep(0)
+
+        assert not obs_logger._audit_pending
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("batched_a" in m for m in messages)
+        assert any("batched_b" in m for m in messages)
+
+    async def test_flush_audit_drains_queue(self):
+        audit(event="manual_flush")
+        assert obs_logger.flush_audit() >= 1
+        assert not obs_logger._audit_pending
+
+    def test_audit_line_is_json(self, caplog):
+        with caplog.at_level("INFO", logger="synapse.observability"):
+            audit(event="json_line_event", obj=object(), keys={1: "a"})
+        line = next(r.getMessage() for r in caplog.records if "json_line_event" in r.getMessage())
+        payload = json.loads(line.split("AUDIT: ", 1)[1])
+        assert payload["event"] == "json_line_event"
+        assert payload["keys"] == {"1": "a"}
+        assert payload["obj"].startswith("<object object")
+
+
+@pytest.mark.unit
+class TestAuditDrainer:
+    async def test_drainer_defers_and_flushes(self, caplog, monkeypatch):
+        monkeypatch.setattr(obs_logger, "AUDIT_DRAIN_INTERVAL", 0.001)
+        obs_logger.start_audit_drainer()
+        try:
+            with caplog.at_level("INFO", logger="synapse.observability"):
+                audit(event="drained_event")
+                await asyncio.sleep(0)
+                assert [e["event"] for e in obs_logger._audit_pending] == ["drained_event"]
+
+                await asyncio.sleep(0.02)
+                assert not obs_logger._audit_pending
+        finally:
+            await obs_logger.stop_audit_drainer()
+        assert any("drained_event" in r.getMessage() for r in caplog.records)
+
+    async def test_stop_flushes_remaining(self):
+        obs_logger.start_audit_drainer()
+        audit(event="flushed_on_stop")
+        await obs_logger.stop_audit_drainer()
+        assert not obs_logger._audit_pending
+        assert asyncio.get_running_loop() not in obs_logger._audit_drain_refs
+
+    async def test_drainer_is_reference_counted(self, monkeypatch):
+        monkeypatch.setattr(obs_logger, "AUDIT_DRAIN_INTERVAL", 60)
+        obs_logger.start_audit_drainer()
+        obs_logger.start_audit_drainer()
+        await obs_logger.stop_audit_drainer()
+        try:
+            # Another app on this loop is still draining: writes stay deferred
+            audit(event="still_deferred")
+            await asyncio.sleep(0)
+            assert [e["event"] for e in obs_logger._audit_pending] == ["still_deferred"]
+        finally:
+            await obs_logger.stop_audit_drainer()
+        assert not obs_logger._audit_pending
+
+        audit(event="next_iteration")
+        await asyncio.sleep(0)
+        assert not obs_logger._audit_pending
+
+    def test_full_queue_drops_oldest(self, monkeypatch):
+        monkeypatch.setattr(obs_logger, "_audit_pending", obs_logger.deque(maxlen=2))
+        monkeypatch.setattr(obs_logger, "AUDIT_QUEUE_MAX", 2)
+        monkeypatch.setattr(obs_logger, "_schedule_audit_flush", lambda: None)
+        dropped = obs_logger.get_metric("audit_lines_dropped")
+        for i in range(3):
+            audit(event=f"overflow_{i}")
+        assert [e["event"] for e in obs_logger._audit_pending] == ["overflow_1", "overflow_2"]
+        assert obs_logger.get_metric("audit_lines_dropped") == dropped + 1
@@ -0,0 +1,25 @@
+"""Unit tests for canonical JSON encoding."""
+import json
+
+import pytest
+
+from synapse.core import canonical
+from synapse.core.canonical import canonical_json
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.mark.unit
+class TestCanonicalJson:
+    def test_keys_sorted_without_whitespace(self):
+        assert canonical_json({"b": 1, "a": [1, 2]}) == b'{"a":[1,2],"b":1}'
+
+    def test_returns_bytes(self):
+        assert isinstance(canonical_json({"key": "value"}), bytes)
+
+    def test_stdlib_fallback_emits_identical_bytes(self, monkeypatch):
+        data = {"z": "ünïcode", "a": {"n": 3, "f": 1.5, "l": [True, None]}}
+        expected = canonical_json(data)
+        monkeypatch.setattr(canonical, "orjson", None)
+        assert canonical_json(data) == expected
+        assert json.loads(expected) == data
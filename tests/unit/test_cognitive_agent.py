@@ -0,0 +1,66 @@
+"""Tests for CognitiveAgent skill registration and sealing."""
+import pytest
+
+from synapse.agents.runtime.agent import CognitiveAgent
+from synapse.core.models import ExecutionContext, ResourceLimits, SkillManifest
+
+PROTOCOL_VERSION: str = "1.0"
+
+
+@pytest.fixture
+def context():
+    return ExecutionContext(
+        session_id="sess",
+        agent_id="agent",
+        trace_id="trace",
+        capabilities=[],
+        memory_store=None,
+        logger=None,
+        resource_limits=ResourceLimits(cpu_seconds=10, memory_mb=256, disk_mb=10, network_kb=500),
+        protocol_version=PROTOCOL_VERSION,
+    )
+
+
+def _manifest(name: str = "dummy") -> SkillManifest:
+    return SkillManifest(
+        name=name,
+        version="1.0",
+        description="Dummy skill",
+        author="test",
+        inputs={},
+        outputs={},
+        required_capabilities=[],
+        timeout_seconds=5,
+        trust_level="trusted",
+        risk_level=1,
+        isolation_type="subprocess",
+    )
+
+
+async def _ok():
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_sealed_registry(context):
+    agent = CognitiveAgent("test_agent", context)
+    agent.register_skill(_manifest(), _ok)
+    assert not agent.sealed
+    agent.seal()
+    assert agent.sealed
+    assert await agent.execute_skill("dummy") == "ok"
+    with pytest.raises(ValueError):
+        await agent.execute_skill("missing")
+    with pytest.raises(RuntimeError):
+        agent.register_skill(_manifest("other"), _ok)
+    assert list(agent.skill_registry) == ["dummy"]
+
+
+def test_registry_writable_until_sealed(context):
+    agent = CognitiveAgent("test_agent", context)
+    agent.skill_registry["dummy"] = _ok
+    assert isinstance(agent.skill_registry, dict)
+    agent.seal()
+    assert agent.skill_registry["dummy"] is _ok
+    with pytest.raises(TypeError):
+        agent.skill_registry["other"] = _ok
@@ -94,3 +94,25 @@ class TestCriticAgentWithLLM:
         )
         assert result["should_create_skill"] is True
         assert len(result["knowledge_gaps"]) > 0
+
+
+@pytest.mark.phase4
+@pytest.mark.unit
+class TestCriticEvaluationPrompt:
+    def test_prompt_contains_result_fields(self):
+        from synapse.agents.critic import CriticAgent
+        prompt = CriticAgent().create_evaluation_prompt(
+            {"status": "error", "result": None, "error": "boom"}
+        )
+        assert "Status: error" in prompt
+        assert "Error: boom" in prompt
+
+    def test_prompt_rendering_is_memoized(self):
+        from synapse.agents.critic import CriticAgent, _render_eval_prompt
+        critic = CriticAgent()
+        execution_result = {"status": "completed", "result": "memo-check"}
+        first = critic.create_evaluation_prompt(execution_result)
+        hits = _render_eval_prompt.cache_info().hits
+        second = critic.create_evaluation_prompt(execution_result)
+        assert second == first
+        assert _render_eval_prompt.cache_info().hits == hits + 1
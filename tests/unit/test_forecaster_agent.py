@@ -0,0 +1,109 @@
+"""Unit tests for ForecasterAgent trend predictions and post-processing."""
+import random
+import uuid
+
+import pytest
+
+from synapse.agents import forecaster as forecaster_module
+from synapse.agents.forecaster import ForecasterAgent, ForecastRequest, Prediction
+
+PROTOCOL_VERSION = "1.0"
+
+
+class _Telemetry:
+    def __init__(self, historical):
+        self._historical = historical
+
+    def get_historical_metrics(self):
+        return self._historical
+
+
+def _request():
+    return ForecastRequest(target="node-1", forecast_type="resource", horizon_minutes=30, seed=7)
+
+
+@pytest.mark.unit
+class TestForecasterAgent:
+    async def test_trend_predictions(self):
+        agent = ForecasterAgent(telemetry=_Telemetry({
+            "cpu_trend": [50, 95],
+            "memory_trend": [1000, 1200],
+            "failure_trend": [0.3],
+        }))
+        result = await agent.forecast(_request())
+
+        assert [p["type"] for p in result.predictions] == ["cpu_overload", "skill_failure"]
+        assert result.predictions[0]["probability"] == pytest.approx(0.9)
+        assert result.predictions[1]["probability"] == 0.3
+        assert [r["action"] for r in result.recommendations] == ["throttle_cpu", "review_skill"]
+        assert result.confidence == pytest.approx(0.6)
+        assert result.risk_level == 4
+
+    async def test_llm_prediction_confidence_is_seed_deterministic(self):
+        class _LLM:
+            async def generate(self, prompt):
+                return {"content": "steady"}
+
+        agent = ForecasterAgent(llm=_LLM())
+        first = await agent.forecast(_request())
+        second = await agent.forecast(_request())
+
+        expected = random.Random(7).uniform(0.7, 0.95)
+        assert first.predictions[0]["type"] == "llm_forecast"
+        assert first.predictions[0]["confidence"] == expected
+        assert second.predictions[0]["confidence"] == expected
+
+    async def test_shutdown_stops_llm_batch_worker(self):
+        class _LLM:
+            async def generate(self, prompt):
+                return {"content": "steady"}
+
+        agent = ForecasterAgent(llm=_LLM())
+        await agent.forecast(_request())
+        worker = agent._llm_client._worker
+        assert worker is not None and not worker.done()
+        await agent.shutdown()
+        assert worker.done()
+
+    async def test_stable_when_no_trend_crosses_threshold(self):
+        agent = ForecasterAgent(telemetry=_Telemetry({"cpu_trend": [10]}))
+        result = await agent.forecast(_request())
+
+        assert [p["type"] for p in result.predictions] == ["stable"]
+        assert result.recommendations == []
+        assert result.risk_level == 0
+
+    @pytest.mark.parametrize("pred_type,prob,expected", [
+        ("memory_exhaustion", 0.85, 4),
+        ("memory_exhaustion", 0.7, 3),
+        ("cpu_overload", 0.0, 2),
+        ("skill_failure", 0.6, 3),
+        ("skill_failure", 0.2, 1),
+        ("llm_forecast", 0.99, 0),
+    ])
+    def test_risk_tiers(self, pred_type, prob, expected):
+        _, _, risk = ForecasterAgent()._postprocess(
+            [Prediction(type=pred_type, target="t", probability=prob)]
+        )
+        assert risk == expected
+
+    def test_prediction_dict_omits_unset_fields(self):
+        pred = Prediction(type="llm_forecast", target="node-1", forecast="ok", confidence=0.8)
+        assert pred.to_dict() == {
+            "type": "llm_forecast",
+            "target": "node-1",
+            "confidence": 0.8,
+            "forecast": "ok",
+        }
+
+    def test_forecast_id_is_uuid_formatted(self):
+        forecast_id = ForecasterAgent()._generate_forecast_id(7, "node-1")
+        assert str(uuid.UUID(forecast_id)) == forecast_id
+        assert forecast_id == ForecasterAgent()._generate_forecast_id(7, "node-1")
+
+    def test_forecast_id_is_memoized(self):
+        agent = ForecasterAgent()
+        agent._generate_forecast_id(11, "memory")
+        hits = forecaster_module._forecast_id_cached.cache_info().hits
+        agent._generate_forecast_id(11, "memory")
+        assert forecaster_module._forecast_id_cached.cache_info().hits == hits + 1
@@ -0,0 +1,70 @@
+"""Unit tests for GovernorAgent skill bottleneck detection."""
+import pytest
+
+from synapse.agents import _governor_kernels
+from synapse.agents import governor as governor_module
+from synapse.agents.governor import AnalysisView, GovernorAgent, SkillMetrics
+
+PROTOCOL_VERSION = "1.0"
+
+
+def _skill_metrics(count):
+    return {
+        f"skill_{i}": {
+            "success_rate": 0.5 if i % 3 == 0 else 0.95,
+            "latency_ms": 450 if i % 5 == 0 else 120,
+        }
+        for i in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestSkillBottlenecks:
+    @pytest.mark.skipif(not _governor_kernels.AVAILABLE, reason="numpy not installed")
+    def test_vectorized_path_matches_loop(self, monkeypatch):
+        agent = GovernorAgent(telemetry=None, policy_engine=None, resource_manager=None)
+        metrics = _skill_metrics(200)
+        metrics["broken"] = "not-a-dict"
+
+        vectorized = agent._detect_skill_bottlenecks(metrics)
+        monkeypatch.setattr(governor_module, "VECTORIZE_MIN_SKILLS", 10**9)
+        looped = agent._detect_skill_bottlenecks(metrics)
+
+        assert vectorized == looped
+        assert {b["type"] for b in looped} == {"low_success_rate", "high_latency"}
+
+    def test_skill_metrics_objects_match_dicts(self):
+        agent = GovernorAgent(telemetry=None, policy_engine=None, resource_manager=None)
+        as_dicts = _skill_metrics(20)
+        as_objects = {name: SkillMetrics(**m) for name, m in as_dicts.items()}
+        assert agent._detect_skill_bottlenecks(as_objects) == agent._detect_skill_bottlenecks(as_dicts)
+
+    def test_small_inputs_use_loop(self):
+        agent = GovernorAgent(telemetry=None, policy_engine=None, resource_manager=None)
+        bottlenecks = agent._detect_skill_bottlenecks(
+            {"slow": {"success_rate": 0.9, "latency_ms": 500}}
+        )
+        assert bottlenecks == [{
+            "type": "high_latency",
+            "source": "skill:slow",
+            "value": 500,
+            "threshold": 300,
+        }]
+
+    def test_action_id_is_memoized(self):
+        agent = GovernorAgent(telemetry=None, policy_engine=None, resource_manager=None)
+        first = agent._generate_id(3, "optimize_skill", "skill:a")
+        hits = governor_module._action_id_cached.cache_info().hits
+        assert agent._generate_id(3, "optimize_skill", "skill:a") == first
+        assert governor_module._action_id_cached.cache_info().hits == hits + 1
+        assert first.startswith("act-") and len(first) == 36
+
+
+@pytest.mark.unit
+def test_analysis_view_reads_like_dict():
+    view = AnalysisView(system={"cpu": 0.5}, skills={})
+    assert view["system"] is view.system
+    assert view.get("skills") == {}
+    assert view.get("missing") is None
+    assert dict(view) == {"system": {"cpu": 0.5}, "skills": {}}
+    assert view == {"system": {"cpu": 0.5}, "skills": {}}
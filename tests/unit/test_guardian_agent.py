@@ -0,0 +1,194 @@
+"""Unit tests for GuardianAgent plan validation and its audit records."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from synapse.agents.guardian import GuardianAgent, ValidatedPlan
+from synapse.observability.logger import audit_scope, get_audit_log
+
+PROTOCOL_VERSION = "1.0"
+
+
+def _new_records(before, event):
+    return [e for e in get_audit_log()[before:] if e.get("event") == event]
+
+
+def _security(caps_approved=True, human_approved=True):
+    security = MagicMock()
+    security.check_capabilities = AsyncMock(return_value=SimpleNamespace(
+        approved=caps_approved, blocked_capabilities=[] if caps_approved else ["fs:write"]
+    ))
+    security.request_human_approval = AsyncMock(return_value=SimpleNamespace(approved=human_approved))
+    return security
+
+
+@pytest.mark.unit
+class TestGuardianPlanValidation:
+    async def test_approved_plan_emits_one_record(self):
+        guardian = GuardianAgent(security_manager=_security())
+        before = len(get_audit_log())
+        result = await guardian.validate_plan({"id": "p1", "required_capabilities": ["fs:read"]})
+
+        assert result.approved
+        [record] = _new_records(before, "plan_validation")
+        assert record["plan_id"] == "p1"
+        assert record["approved"] is True
+        assert record["reason"] == "all_checks_passed"
+        assert [s["step"] for s in record["steps"]] == ["started", "approved"]
+
+    async def test_missing_capabilities_denied(self):
+        guardian = GuardianAgent(security_manager=_security(caps_approved=False))
+        before = len(get_audit_log())
+        result = await guardian.validate_plan({"id": "p2", "required_capabilities": ["fs:write"]})
+
+        assert not result.approved
+        [record] = _new_records(before, "plan_validation")
+        assert record["steps"][-1] == {
+            "step": "denied", "reason": "missing_capabilities", "blocked": ["fs:write"]
+        }
+
+    async def test_human_denial_recorded(self):
+        guardian = GuardianAgent(security_manager=_security(human_approved=False))
+        before = len(get_audit_log())
+        result = await guardian.validate_plan({"id": "p3", "risk_level": 4})
+
+        assert result.reason == "human_denied"
+        [record] = _new_records(before, "plan_validation")
+        assert [s["step"] for s in record["steps"]] == [
+            "started", "human_approval_requested", "human_approval_denied"
+        ]
+
+    async def test_high_risk_checks_run_concurrently(self):
+        started = []
+        release = asyncio.Event()
+
+        async def check_capabilities(**kwargs):
+            started.append("caps")
+            await release.wait()
+            return SimpleNamespace(approved=True, blocked_capabilities=[])
+
+        async def request_human_approval(**kwargs):
+            started.append("human")
+            release.set()
+            return SimpleNamespace(approved=True)
+
+        security = MagicMock()
+        security.check_capabilities = check_capabilities
+        security.request_human_approval = request_human_approval
+        guardian = GuardianAgent(security_manager=security)
+        result = await asyncio.wait_for(
+            guardian.validate_plan({"id": "p6", "risk_level": 3, "required_capabilities": ["x"]}),
+            timeout=1,
+        )
+        assert result.approved and result.requires_human_approval
+        assert sorted(started) == ["caps", "human"]
+
+    async def test_denied_capabilities_cancel_approval(self):
+        cancelled = asyncio.Event()
+
+        async def request_human_approval(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def check_capabilities(**kwargs):
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(approved=False, blocked_capabilities=["fs:write"])
+
+        security = MagicMock()
+        security.check_capabilities = check_capabilities
+        security.request_human_approval = request_human_approval
+        guardian = GuardianAgent(security_manager=security)
+        result = await guardian.validate_plan(
+            {"id": "p7", "risk_level": 4, "required_capabilities": ["fs:write"]}
+        )
+        assert result.reason == "capability_check_complete"
+        # The cancelled request has unwound before validate_plan returns
+        assert cancelled.is_set()
+
+    async def test_cancelled_approval_error_is_contained(self):
+        async def request_human_approval(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                raise RuntimeError("approval backend closed")
+
+        security = MagicMock()
+        security.check_capabilities = AsyncMock(
+            return_value=SimpleNamespace(approved=False, blocked_capabilities=["fs:write"])
+        )
+        security.request_human_approval = request_human_approval
+        guardian = GuardianAgent(security_manager=security)
+        result = await guardian.validate_plan(
+            {"id": "p8", "risk_level": 4, "required_capabilities": ["fs:write"]}
+        )
+        assert not result.approved
+
+    async def test_accepts_prevalidated_plan(self):
+        security = _security(human_approved=False)
+        guardian = GuardianAgent(security_manager=security)
+        raw = {"id": "p8", "risk_level": 3, "required_capabilities": ["fs:read"]}
+        plan = ValidatedPlan.from_dict(raw)
+        assert plan.plan_id == "p8" and plan.risk_level == 3
+
+        result = await guardian.validate_plan(plan)
+
+        assert result.reason == "human_denied"
+        assert security.request_human_approval.await_args.kwargs["plan"] is raw
+
+    async def test_error_still_flushes_record(self):
+        security = _security()
+        security.check_capabilities = AsyncMock(side_effect=RuntimeError("boom"))
+        guardian = GuardianAgent(security_manager=security)
+        before = len(get_audit_log())
+
+        with pytest.raises(RuntimeError):
+            await guardian.validate_plan({"id": "p4", "required_capabilities": ["x"]})
+
+        [record] = _new_records(before, "plan_validation")
+        assert record["reason"] == "error"
+
+    async def test_audit_disabled_skips_record(self):
+        guardian = GuardianAgent()
+        before = len(get_audit_log())
+        with audit_scope(False):
+            await guardian.validate_plan({"id": "p5"})
+        assert _new_records(before, "plan_validation") == []
+
+
+@pytest.mark.unit
+class TestGuardianExecutionSafety:
+    async def test_dangerous_params_blocked(self):
+        guardian = GuardianAgent()
+        before = len(get_audit_log())
+        result = await guardian.check_execution_safety("shell", {"cmd": "rm -rf /"})
+
+        assert not result.approved
+        [record] = _new_records(before, "execution_safety_check")
+        assert record["reason"] == "dangerous_parameters"
+        assert record["steps"][0]["params"] == ["cmd: rm -rf"]
+
+    async def test_safe_params_pass(self):
+        guardian = GuardianAgent()
+        result = await guardian.check_execution_safety("read", {"path": "/workspace/a.txt"})
+        assert result.approved
+        assert result.reason == "safety_check_passed"
+
+    async def test_approve_paths_reuse_shared_results(self):
+        guardian = GuardianAgent()
+        first = await guardian.check_execution_safety("read", {"path": "a"})
+        second = await guardian.check_execution_safety("read", {"path": "b"})
+        assert first is second
+        # Shared, so the blocked list must not be mutable
+        assert first.blocked_capabilities == ()
+        with pytest.raises(AttributeError):
+            first.blocked_capabilities.append("leak")
+        plan = ValidatedPlan.from_dict({})
+        caps = await guardian._check_capabilities(plan, {})
+        assert caps is await guardian._check_capabilities(plan, {})
+        assert caps.reason == "no_capabilities_required"
+        assert caps.blocked_capabilities == ()
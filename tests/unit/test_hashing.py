@@ -0,0 +1,56 @@
+"""Unit tests for configurable content hashing."""
+import hashlib
+import importlib
+import importlib.util
+
+import pytest
+
+from synapse.core import hashing
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.fixture
+def reload_hashing(monkeypatch):
+    def _reload(algorithm):
+        monkeypatch.setenv(hashing.HASH_ALGORITHM_ENV, algorithm)
+        return importlib.reload(hashing)
+
+    yield _reload
+    monkeypatch.delenv(hashing.HASH_ALGORITHM_ENV, raising=False)
+    importlib.reload(hashing)
+
+
+@pytest.mark.unit
+class TestContentHashing:
+    def test_default_is_sha256(self, reload_hashing):
+        module = reload_hashing("sha256")
+        assert module.HASH_ALGORITHM == "sha256"
+        assert module.content_hash(b"data") == hashlib.sha256(b"data").hexdigest()
+        assert module.content_digest(b"data") == hashlib.sha256(b"data").digest()
+
+    def test_unknown_algorithm_falls_back_to_sha256(self, reload_hashing):
+        assert reload_hashing("md5").HASH_ALGORITHM == "sha256"
+
+    def test_missing_blake3_falls_back_to_sha256(self, reload_hashing, monkeypatch):
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(
+            importlib.util, "find_spec",
+            lambda name, *args: None if name == "blake3" else find_spec(name, *args),
+        )
+        assert reload_hashing("blake3").HASH_ALGORITHM == "sha256"
+
+    def test_blake3_opt_in(self, reload_hashing):
+        blake3 = pytest.importorskip("blake3")
+        module = reload_hashing("blake3")
+        assert module.HASH_ALGORITHM == "blake3"
+        assert module.content_hash(b"data") == blake3.blake3(b"data").hexdigest()
+        assert len(module.content_hash(b"data")) == 64
+
+    def test_hasher_supports_incremental_copy(self, reload_hashing):
+        module = reload_hashing("sha256")
+        hasher = module.content_hasher(b"ab")
+        clone = hasher.copy()
+        clone.update(b"c")
+        assert clone.hexdigest() == module.content_hash(b"abc")
+        assert hasher.hexdigest() == module.content_hash(b"ab")
@@ -0,0 +1,90 @@
+"""Unit tests for the batching LLM client."""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from synapse.llm.batching import BatchingLLMClient
+
+PROTOCOL_VERSION = "1.0"
+
+
+class _BatchProvider:
+    def __init__(self):
+        self.batches = []
+
+    async def generate(self, prompt, **kwargs):
+        return {"content": f"single:{prompt}"}
+
+    async def generate_batch(self, prompts):
+        self.batches.append(list(prompts))
+        return [
+            ValueError(p) if p == "bad" else {"content": f"batch:{p}"}
+            for p in prompts
+        ]
+
+
+@pytest.mark.unit
+class TestBatchingLLMClient:
+    async def test_concurrent_prompts_share_one_batch(self):
+        provider = _BatchProvider()
+        client = BatchingLLMClient(provider, window_ms=1)
+        results = await asyncio.gather(*(client.generate(f"p{i}") for i in range(5)))
+        assert [r["content"] for r in results] == [f"batch:p{i}" for i in range(5)]
+        assert provider.batches == [[f"p{i}" for i in range(5)]]
+        await client.aclose()
+
+    async def test_max_batch_splits_dispatch(self):
+        provider = _BatchProvider()
+        client = BatchingLLMClient(provider, max_batch=2, window_ms=1)
+        await asyncio.gather(*(client.generate(f"p{i}") for i in range(5)))
+        assert [len(b) for b in provider.batches] == [2, 2, 1]
+        await client.aclose()
+
+    async def test_per_prompt_errors_are_isolated(self):
+        client = BatchingLLMClient(_BatchProvider(), window_ms=1)
+        ok, bad = await asyncio.gather(
+            client.generate("ok"), client.generate("bad"), return_exceptions=True
+        )
+        assert ok == {"content": "batch:ok"}
+        assert isinstance(bad, ValueError)
+        await client.aclose()
+
+    async def test_mock_provider_falls_back_to_generate(self):
+        provider = AsyncMock()
+        provider.generate = AsyncMock(return_value={"content": "x"})
+        client = BatchingLLMClient(provider, window_ms=1)
+        assert not client.supports_batch
+        await asyncio.gather(client.generate("a"), client.generate("b"))
+        assert provider.generate.await_count == 2
+        await client.aclose()
+
+    async def test_kwargs_bypass_queue(self):
+        provider = _BatchProvider()
+        client = BatchingLLMClient(provider)
+        result = await client.generate("p", temperature=0.0)
+        assert result == {"content": "single:p"}
+        assert provider.batches == []
+
+    def test_rejects_empty_batch_size(self):
+        with pytest.raises(ValueError):
+            BatchingLLMClient(_BatchProvider(), max_batch=0)
+
+    async def test_lone_prompt_skips_window(self):
+        provider = _BatchProvider()
+        client = BatchingLLMClient(provider, window_ms=10_000)
+        result = await asyncio.wait_for(client.generate("solo"), timeout=1)
+        assert result == {"content": "batch:solo"}
+        await client.aclose()
+
+    async def test_aclose_during_window_resolves_pending(self):
+        provider = _BatchProvider()
+        client = BatchingLLMClient(provider, max_batch=2, window_ms=200)
+        tasks = [asyncio.ensure_future(client.generate(f"p{i}")) for i in range(3)]
+        # Let the collector take p0 and start waiting out the window
+        for _ in range(3):
+            await asyncio.sleep(0)
+        await client.aclose()
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        assert [r["content"] for r in results] == ["batch:p0", "batch:p1", "batch:p2"]
+        assert provider.batches == [["p0", "p1"], ["p2"]]
@@ -0,0 +1,29 @@
+"""Unit tests for cached UTC timestamp formatting."""
+from datetime import datetime, UTC
+
+import pytest
+
+from synapse.core.timestamps import utc_isoformat
+
+PROTOCOL_VERSION = "1.0"
+
+
+@pytest.mark.unit
+class TestUtcIsoformat:
+    def test_matches_datetime_isoformat(self):
+        ns = 1_700_000_000_123_456_789
+        expected = datetime.fromtimestamp(ns // 1_000_000_000, UTC).replace(
+            microsecond=123_456
+        ).isoformat()
+        assert utc_isoformat(ns) == expected
+
+    def test_prefix_cache_tracks_second_changes(self):
+        first = utc_isoformat(1_700_000_000_000_000_000)
+        second = utc_isoformat(1_700_000_001_000_000_000)
+        assert first.endswith("20.000000+00:00")
+        assert second.endswith("21.000000+00:00")
+
+    def test_default_uses_current_time(self):
+        parsed = datetime.fromisoformat(utc_isoformat())
+        assert parsed.tzinfo is not None
+        assert abs((datetime.now(UTC) - parsed).total_seconds()) < 5